@@ -0,0 +1,182 @@
+"""
+FastAPI dependencies providing the API's services.
+
+Every service is a lazily built singleton of the process-wide
+ServiceContainer. Service modules are imported inside their factories, so
+importing the routes stays cheap and the server answers /health before any
+vector store, tokenizer or project snapshot is loaded. Use them as
+`service = Depends(get_resume_writer)`; outside a request (e.g. in job
+handlers) call the getter directly.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.config import settings
+from app.core.container import ServiceContainer, get_container
+
+logger = logging.getLogger(__name__)
+
+# Built first by the startup warmup: the services behind the common requests
+WARMUP_ORDER = [
+    "project_store",
+    "resume_writer",
+    "resume_scorer",
+    "job_parser",
+    "cover_letter_writer",
+    "rag_service",
+    "job_analysis",
+    "resume_parser",
+    "export",
+]
+
+
+class MinimalRelevanceRanker:
+    """Stand-in the ranking routes use while the relevance ranker cannot be built."""
+
+    async def rank_projects_for_job(self, job_description: str, top_k: int = 5):
+        return []
+
+    async def get_project_recommendations(self, job_description: str):
+        return {"ranked_projects": [], "job_analysis": {}, "project_statistics": {}}
+
+    async def create_project_vector_store(self):
+        return False
+
+
+def _rag_service():
+    from app.services.rag_service import RAGService
+    return RAGService()
+
+
+def _job_analysis():
+    from app.services.job_analysis_service import JobAnalysisService
+    return JobAnalysisService()
+
+
+def _export():
+    from app.services.export_service import ExportService
+    return ExportService()
+
+
+def _resume_parser():
+    from app.services.resume_parser_service import ResumeParserService
+    return ResumeParserService()
+
+
+def _project_store():
+    from app.services.project_store import ProjectStoreService
+    return ProjectStoreService()
+
+
+def _project_parser():
+    # The store's parser refreshes the store's snapshot whenever it saves a project
+    return get_project_store().project_parser
+
+
+def _relevance_ranker():
+    from app.services.relevance_ranker import RelevanceRanker
+    # Failures reach the container, which records them and retries on the next get()
+    return RelevanceRanker(project_store=get_project_store())
+
+
+def _resume_writer():
+    from app.services.resume_writer import ResumeWriterService
+    # The ranker is resolved from the container when a cover letter first needs it
+    return ResumeWriterService(get_project_store(), relevance_ranker=get_relevance_ranker)
+
+
+def _cover_letter_writer():
+    from app.services.cover_letter_writer import CoverLetterWriterService
+    return CoverLetterWriterService()
+
+
+def _resume_scorer():
+    from app.services.resume_scorer import ResumeScorerService
+    return ResumeScorerService()
+
+
+def _job_parser():
+    from app.core.job_parser import JobParserService
+    return JobParserService()
+
+
+def register_services(container: ServiceContainer):
+    """Register the API's service factories with a container."""
+    container.register("rag_service", _rag_service)
+    container.register("job_analysis", _job_analysis)
+    container.register("export", _export)
+    container.register("resume_parser", _resume_parser)
+    container.register("project_store", _project_store)
+    container.register("project_parser", _project_parser)
+    container.register("relevance_ranker", _relevance_ranker)
+    container.register("resume_writer", _resume_writer)
+    container.register("cover_letter_writer", _cover_letter_writer)
+    container.register("resume_scorer", _resume_scorer)
+    container.register("job_parser", _job_parser)
+
+
+register_services(get_container())
+
+
+def start_warmup() -> Optional[asyncio.Task]:
+    """Start building every service in the background, if api.warmup_services is enabled."""
+    if not settings.api.warmup_services:
+        return None
+    container = get_container()
+    order = WARMUP_ORDER + [name for name in container.names if name not in WARMUP_ORDER]
+    return asyncio.create_task(container.warmup(order))
+
+
+def get_rag_service():
+    return get_container().get("rag_service")
+
+
+def get_job_analysis_service():
+    return get_container().get("job_analysis")
+
+
+def get_export_service():
+    return get_container().get("export")
+
+
+def get_resume_parser_service():
+    return get_container().get("resume_parser")
+
+
+def get_project_store():
+    return get_container().get("project_store")
+
+
+def get_project_parser():
+    return get_container().get("project_parser")
+
+
+def get_relevance_ranker():
+    return get_container().get("relevance_ranker")
+
+
+def get_relevance_ranker_or_minimal():
+    """The relevance ranker, or MinimalRelevanceRanker for this request if it cannot be built."""
+    try:
+        return get_relevance_ranker()
+    except Exception as e:
+        logger.error(f"Error initializing relevance ranker: {e}")
+        return MinimalRelevanceRanker()
+
+
+def get_resume_writer():
+    return get_container().get("resume_writer")
+
+
+def get_cover_letter_writer():
+    return get_container().get("cover_letter_writer")
+
+
+def get_resume_scorer():
+    return get_container().get("resume_scorer")
+
+
+def get_job_parser():
+    return get_container().get("job_parser")
@@ -0,0 +1,16 @@
+"""
+Prometheus scrape endpoint.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Every metric, and the hit ratios of the registered caches, in the Prometheus text format."""
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
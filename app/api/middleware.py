@@ -0,0 +1,99 @@
+"""
+ASGI middleware of the API.
+"""
+
+import json
+import time
+
+from app.core import metrics, tracing
+from app.core.config import settings
+
+# Probes, docs and the trace endpoints themselves are not worth a trace each
+UNTRACED_PATHS = ("/health", "/api/health", "/metrics")
+UNTRACED_PREFIXES = ("/api/debug/", "/docs", "/redoc", "/openapi.json")
+
+
+class TracingMiddleware:
+    """
+    Record a trace of every HTTP request and keep it in the trace store.
+
+    Responses carry the trace id in X-Trace-Id. When settings.tracing.debug_header
+    is enabled and the request sends "X-Debug-Trace: 1", the response also
+    carries the trace summary (per-stage time, queue wait and tokens) as JSON
+    in X-Debug-Trace. Headers are sent before a streamed body, so for
+    streaming endpoints that summary only covers the work done before the
+    first event; the stored trace is complete.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not settings.tracing.enabled or \
+                path in UNTRACED_PATHS or path.startswith(UNTRACED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope.get("headers") or [])
+        send_summary = settings.tracing.debug_header and \
+            request_headers.get(b"x-debug-trace", b"").lower() in (b"1", b"true")
+
+        with tracing.trace(f"{scope['method']} {path}") as request_trace:
+            request_trace.attributes.update(method=scope["method"], path=path)
+
+            async def send_with_trace_headers(message):
+                if message["type"] == "http.response.start":
+                    request_trace.attributes["status"] = message["status"]
+                    headers = list(message.get("headers") or [])
+                    headers.append((b"x-trace-id", request_trace.id.encode("latin-1")))
+                    if send_summary:
+                        summary = json.dumps(request_trace.summary(), separators=(",", ":"))
+                        headers.append((b"x-debug-trace", summary.encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_headers)
+            except Exception as e:
+                request_trace.attributes["error"] = type(e).__name__
+                raise
+            finally:
+                tracing.get_trace_store().add(request_trace)
+
+
+class MetricsMiddleware:
+    """
+    Record the latency of every HTTP request by route template, and the
+    number of requests in flight.
+
+    Routes are labelled with their template ("/api/jobs/{job_id}"), read
+    from the scope after routing, so path parameters do not multiply the
+    series; requests matching no route are labelled "unmatched".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc(1, (method,))
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec(1, (method,))
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            metrics.HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, (method, route, str(status)))
@@ -1,57 +1,37 @@
 import logging
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from typing import Dict, Any, List, Optional
-from app.services.rag_service import RAGService
-from app.services.job_analysis_service import JobAnalysisService
-from app.services.export_service import ExportService
-from app.services.resume_parser_service import ResumeParserService
-from app.services.project_parser import ProjectParserService
-from app.services.project_store import ProjectStoreService
-from app.services.relevance_ranker import RelevanceRanker
-from app.services.resume_writer import ResumeWriterService
-from app.services.cover_letter_writer import CoverLetterWriterService
-from app.services.resume_scorer import ResumeScorerService
-from app.core.job_parser import JobParserService
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, List, Optional, Tuple
+from app.api.dependencies import (
+    get_cover_letter_writer,
+    get_export_service,
+    get_job_analysis_service,
+    get_job_parser,
+    get_project_parser,
+    get_project_store,
+    get_rag_service,
+    get_relevance_ranker_or_minimal,
+    get_resume_parser_service,
+    get_resume_scorer,
+    get_resume_writer,
+)
+from app.core.container import get_container
+from app.core.tracing import get_trace_store
+from app.core.loop_watchdog import get_loop_watchdog
+from app.core.job_cache import job_analysis_cache
+from app.core.job_queue import get_job_queue
+from pydantic import BaseModel, Field
 import os
+import asyncio
+import json
+import time
 import tempfile
-from app.core.config import settings
+from app.core.config import settings, DEFAULT_TENANT, TENANT_ID_REGEX
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-rag_service = RAGService()
-job_analysis_service = JobAnalysisService()
-export_service = ExportService()
-resume_parser_service = ResumeParserService()
-project_parser_service = ProjectParserService()
-project_store_service = ProjectStoreService()
-resume_writer_service = ResumeWriterService(project_store_service)
-# relevance_ranker_service = RelevanceRanker()
-cover_letter_writer_service = CoverLetterWriterService()
-resume_scorer_service = ResumeScorerService()
-job_parser_service = JobParserService()
-
-# Global variable for lazy loading
-relevance_ranker_service = None
-
-def get_relevance_ranker():
-    """Lazy initialization of relevance ranker service."""
-    global relevance_ranker_service
-    if relevance_ranker_service is None:
-        try:
-            relevance_ranker_service = RelevanceRanker()
-        except Exception as e:
-            logger.error(f"Error initializing relevance ranker: {e}")
-            # Return a minimal implementation
-            class MinimalRelevanceRanker:
-                async def rank_projects_for_job(self, job_description: str, top_k: int = 5):
-                    return []
-                async def get_project_recommendations(self, job_description: str):
-                    return {"ranked_projects": [], "job_analysis": {}, "project_statistics": {}}
-                async def create_project_vector_store(self):
-                    return False
-            relevance_ranker_service = MinimalRelevanceRanker()
-    return relevance_ranker_service
+# Services are built on first use by the container; see app/api/dependencies.py
+job_queue = get_job_queue()
 
 class ResumeSection(BaseModel):
     section_name: str
@@ -60,6 +40,7 @@ class ResumeSection(BaseModel):
 class QueryRequest(BaseModel):
     query: str
     num_results: int = 3
+    tenant_id: str = Field(DEFAULT_TENANT, pattern=TENANT_ID_REGEX)
 
 class JobDescriptionRequest(BaseModel):
     job_description: str
@@ -96,6 +77,19 @@ class DeduplicatedResumeRequest(BaseModel):
     include_sections: List[str]
     candidate_skills: List[str] = None
     max_projects_per_section: int = 4
+    stream_tokens: bool = False  # Streaming endpoints only: also emit token deltas
+
+class BatchResumeRequest(BaseModel):
+    job_descriptions: List[str]
+    include_sections: List[str]
+    max_projects_per_section: int = 4
+    stream: bool = False  # Emit one SSE "job" event per resume as it completes
+
+class BulkKeywordScoringRequest(BaseModel):
+    job_descriptions: List[str]
+    resumes: List[Dict[str, Any]]
+    pairs: List[Tuple[int, int]] = []  # (job index, resume index) pairs to return keyword lists for
+    include_matrix: bool = True
 
 class CoverLetterRequest(BaseModel):
     job_description: str
@@ -108,9 +102,11 @@ class CoverLetterRequest(BaseModel):
 class ResumeScoringRequest(BaseModel):
     job_description: str
     resume_data: Dict[str, Any]
+    tier: int = 1  # 0: keyword/ATS scoring only, 1: also LLM feedback
+    prefetch_feedback: Optional[bool] = None  # Tier 0: start LLM feedback in the background (default: settings)
 
 @router.post("/optimize-section")
-async def optimize_section(section: ResumeSection, job_description: str):
+async def optimize_section(section: ResumeSection, job_description: str, rag_service=Depends(get_rag_service)):
     try:
         optimized_content = await rag_service.optimize_section(
             section.section_name,
@@ -122,15 +118,17 @@ async def optimize_section(section: ResumeSection, job_description: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/query")
-async def query_vector_store(request: QueryRequest):
+async def query_vector_store(request: QueryRequest, rag_service=Depends(get_rag_service)):
     try:
-        results = await rag_service.query(request.query, request.num_results)
+        results = await rag_service.query_vector_store(request.query, request.num_results, tenant_id=request.tenant_id)
         return {"results": results}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(file: UploadFile = File(...), tenant_id: str = Form(DEFAULT_TENANT, pattern=TENANT_ID_REGEX),
+                        rag_service=Depends(get_rag_service),
+                        resume_parser_service=Depends(get_resume_parser_service)):
     if not file.filename.endswith('.docx'):
         raise HTTPException(
             status_code=400,
@@ -151,7 +149,7 @@ async def upload_resume(file: UploadFile = File(...)):
             parsed_resume = resume_parser_service.parse_docx(temp_file_path)
             
             # Create vector store
-            await rag_service.create_vector_store(parsed_resume)
+            await rag_service.create_vector_store(parsed_resume, tenant_id=tenant_id)
             
             return {
                 "status": "success",
@@ -180,7 +178,7 @@ async def upload_resume(file: UploadFile = File(...)):
         )
 
 @router.post("/analyze-job")
-async def analyze_job(request: JobDescriptionRequest):
+async def analyze_job(request: JobDescriptionRequest, job_analysis_service=Depends(get_job_analysis_service)):
     try:
         analysis = await job_analysis_service.analyze_job_description(request.job_description)
         return analysis
@@ -188,7 +186,8 @@ async def analyze_job(request: JobDescriptionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/calculate-skill-match")
-async def calculate_skill_match(resume_data: ResumeData, job_description: str):
+async def calculate_skill_match(resume_data: ResumeData, job_description: str,
+                                job_analysis_service=Depends(get_job_analysis_service)):
     try:
         match_results = await job_analysis_service.calculate_skill_match(
             resume_data.sections.get("skills", ""),
@@ -199,7 +198,8 @@ async def calculate_skill_match(resume_data: ResumeData, job_description: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/suggest-improvements")
-async def suggest_improvements(section: ResumeSection, job_description: str):
+async def suggest_improvements(section: ResumeSection, job_description: str,
+                               job_analysis_service=Depends(get_job_analysis_service)):
     try:
         suggestions = await job_analysis_service.suggest_improvements(
             section.section_name,
@@ -211,7 +211,7 @@ async def suggest_improvements(section: ResumeSection, job_description: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/export")
-async def export_resume(request: ExportRequest):
+async def export_resume(request: ExportRequest, export_service=Depends(get_export_service)):
     try:
         if request.format == "pdf":
             file_path = export_service.export_to_pdf(request.resume_data.sections)
@@ -227,7 +227,8 @@ async def export_resume(request: ExportRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/use-existing-resume")
-async def use_existing_resume():
+async def use_existing_resume(tenant_id: str = Query(DEFAULT_TENANT, pattern=TENANT_ID_REGEX), rag_service=Depends(get_rag_service),
+                              resume_parser_service=Depends(get_resume_parser_service)):
     try:
         # Use the existing resume file if it exists
         resume_path = "Kalyanam_resume.docx"
@@ -236,7 +237,7 @@ async def use_existing_resume():
             parsed_resume = resume_parser_service.parse_docx(resume_path)
             
             # Create vector store
-            await rag_service.create_vector_store(parsed_resume)
+            await rag_service.create_vector_store(parsed_resume, tenant_id=tenant_id)
             
             return {
                 "status": "success",
@@ -296,7 +297,7 @@ async def use_existing_resume():
             }
             
             # Create vector store from default resume
-            await rag_service.create_vector_store(default_resume)
+            await rag_service.create_vector_store(default_resume, tenant_id=tenant_id)
             
             return {
                 "status": "success", 
@@ -314,7 +315,7 @@ async def use_existing_resume():
 
 # New project-based routes
 @router.post("/project-dump")
-async def parse_project_dump(request: ProjectDumpRequest):
+async def parse_project_dump(request: ProjectDumpRequest, project_parser_service=Depends(get_project_parser)):
     """Parse a natural language project dump into structured format."""
     try:
         result = await project_parser_service.parse_and_save_project(
@@ -326,7 +327,7 @@ async def parse_project_dump(request: ProjectDumpRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/projects")
-async def get_all_projects():
+async def get_all_projects(project_store_service=Depends(get_project_store)):
     """Get all stored projects."""
     try:
         projects = project_store_service.get_all_projects()
@@ -335,7 +336,7 @@ async def get_all_projects():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/projects/statistics")
-async def get_project_statistics():
+async def get_project_statistics(project_store_service=Depends(get_project_store)):
     print("=== ENTERED /api/projects/statistics ENDPOINT ===")
     try:
         stats = project_store_service.get_project_statistics()
@@ -348,7 +349,7 @@ async def get_project_statistics():
         return {"error": str(e), "traceback": tb}
 
 @router.get("/projects/{project_title}")
-async def get_project_by_title(project_title: str):
+async def get_project_by_title(project_title: str, project_store_service=Depends(get_project_store)):
     """Get a specific project by title."""
     try:
         project = project_store_service.get_project_by_title(project_title)
@@ -359,7 +360,7 @@ async def get_project_by_title(project_title: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/projects/search/{query}")
-async def search_projects(query: str, limit: int = 5):
+async def search_projects(query: str, limit: int = 5, project_store_service=Depends(get_project_store)):
     """Search projects by query."""
     try:
         projects = project_store_service.search_projects(query, limit)
@@ -368,7 +369,7 @@ async def search_projects(query: str, limit: int = 5):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/projects/technology/{technology}")
-async def get_projects_by_technology(technology: str):
+async def get_projects_by_technology(technology: str, project_store_service=Depends(get_project_store)):
     """Get projects that use a specific technology."""
     try:
         projects = project_store_service.get_projects_by_technology(technology)
@@ -377,7 +378,7 @@ async def get_projects_by_technology(technology: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/parse-job")
-async def parse_job_description(request: JobDescriptionRequest):
+async def parse_job_description(request: JobDescriptionRequest, job_parser_service=Depends(get_job_parser)):
     """Parse job description into structured format."""
     try:
         job_data = await job_parser_service.parse_job_description(request.job_description)
@@ -386,10 +387,11 @@ async def parse_job_description(request: JobDescriptionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/rank-projects")
-async def rank_projects_for_job(request: JobDescriptionRequest, top_k: int = 5):
+async def rank_projects_for_job(request: JobDescriptionRequest, top_k: int = 5,
+                                relevance_ranker=Depends(get_relevance_ranker_or_minimal)):
     """Rank projects by relevance to job description."""
     try:
-        ranked_projects = await get_relevance_ranker().rank_projects_for_job(
+        ranked_projects = await relevance_ranker.rank_projects_for_job(
             request.job_description, top_k
         )
         return {"ranked_projects": ranked_projects, "count": len(ranked_projects)}
@@ -397,10 +399,11 @@ async def rank_projects_for_job(request: JobDescriptionRequest, top_k: int = 5):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/project-recommendations")
-async def get_project_recommendations(job_description: JobDescriptionRequest):
+async def get_project_recommendations(job_description: JobDescriptionRequest,
+                                      relevance_ranker=Depends(get_relevance_ranker_or_minimal)):
     """Get comprehensive project recommendations for a job."""
     try:
-        recommendations = await get_relevance_ranker().get_project_recommendations(job_description.job_description)
+        recommendations = await relevance_ranker.get_project_recommendations(job_description.job_description)
         # Ensure the response is JSON serializable
         if isinstance(recommendations, dict):
             return recommendations
@@ -412,11 +415,13 @@ async def get_project_recommendations(job_description: JobDescriptionRequest):
         return {"ranked_projects": [], "job_analysis": {}, "project_statistics": {}}
 
 @router.post("/generate-resume-section")
-async def generate_resume_section(section_name: str, section_type: str, request: JobDescriptionRequest):
+async def generate_resume_section(section_name: str, section_type: str, request: JobDescriptionRequest,
+                                  resume_writer_service=Depends(get_resume_writer),
+                                  relevance_ranker=Depends(get_relevance_ranker_or_minimal)):
     """Generate a specific resume section."""
     try:
         # Get ranked projects
-        ranked_projects = await get_relevance_ranker().rank_projects_for_job(
+        ranked_projects = await relevance_ranker.rank_projects_for_job(
             request.job_description, top_k=10
         )
         
@@ -434,12 +439,13 @@ async def generate_resume_section(section_name: str, section_type: str, request:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/generate-tailored-resume", response_model=dict)
-async def generate_tailored_resume_route(request: TailoredResumeRequest):
+async def generate_tailored_resume_route(request: TailoredResumeRequest,
+                                         resume_writer_service=Depends(get_resume_writer)):
     """
     Generate a complete, tailored resume with specific sections.
     """
     try:
-        generated_data = resume_writer_service.generate_tailored_resume(
+        generated_data = await resume_writer_service.generate_tailored_resume(
             job_description=request.job_description,
             include_sections=request.include_sections,
         )
@@ -449,7 +455,8 @@ async def generate_tailored_resume_route(request: TailoredResumeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/generate-deduplicated-resume", response_model=dict)
-async def generate_deduplicated_resume_route(request: DeduplicatedResumeRequest):
+async def generate_deduplicated_resume_route(request: DeduplicatedResumeRequest,
+                                             resume_writer_service=Depends(get_resume_writer)):
     """
     Generate a complete, tailored resume with intelligent project deduplication.
     Ensures projects aren't repeated across different sections.
@@ -465,71 +472,229 @@ async def generate_deduplicated_resume_route(request: DeduplicatedResumeRequest)
         logger.error(f"Error generating deduplicated resume: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+ACADEMIC_CV_SECTIONS = ["summary", "research", "projects", "skills", "education"]
+
+async def _generate_academic_cv(request: DeduplicatedResumeRequest, resume_writer_service) -> Dict[str, Any]:
+    # For academic CV, we want to include more comprehensive sections
+    generated_data = await resume_writer_service.generate_tailored_resume_with_deduplication(
+        job_description=request.job_description,
+        include_sections=ACADEMIC_CV_SECTIONS,
+        candidate_skills=request.candidate_skills
+    )
+
+    # Add academic-specific metadata
+    generated_data["cv_type"] = "academic"
+    generated_data["comprehensive_mode"] = True
+
+    return generated_data
+
 @router.post("/generate-academic-cv", response_model=dict)
-async def generate_academic_cv_route(request: DeduplicatedResumeRequest):
+async def generate_academic_cv_route(request: DeduplicatedResumeRequest,
+                                     resume_writer_service=Depends(get_resume_writer)):
     """
     Generate an academic CV with comprehensive research and project sections.
     Includes all relevant projects without strict deduplication for academic purposes.
     """
     try:
-        # For academic CV, we want to include more comprehensive sections
-        academic_sections = ["summary", "research", "projects", "skills", "education"]
-        
-        generated_data = await resume_writer_service.generate_tailored_resume_with_deduplication(
-            job_description=request.job_description,
-            include_sections=academic_sections,
-            candidate_skills=request.candidate_skills
-        )
-        
-        # Add academic-specific metadata
-        generated_data["cv_type"] = "academic"
-        generated_data["comprehensive_mode"] = True
-        
-        return generated_data
+        return await _generate_academic_cv(request, resume_writer_service)
     except Exception as e:
         logger.error(f"Error generating academic CV: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _sse_response(events, extra_done_fields: Dict[str, Any] = None) -> StreamingResponse:
+    """Serialize resume generation events as a Server-Sent Events stream."""
+    async def encode():
+        try:
+            async for event in events:
+                if event["event"] == "done" and extra_done_fields:
+                    event.update(extra_done_fields)
+                name = event.pop("event")
+                yield f"event: {name}\ndata: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming resume generation: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+    return StreamingResponse(
+        encode(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/generate-deduplicated-resume/stream")
+async def stream_deduplicated_resume_route(request: DeduplicatedResumeRequest,
+                                           resume_writer_service=Depends(get_resume_writer)):
+    """
+    Streaming variant of /generate-deduplicated-resume.
+    Emits a "section" event as each section completes and a final "done" event.
+    """
+    events = resume_writer_service.stream_tailored_resume_with_deduplication(
+        job_description=request.job_description,
+        include_sections=request.include_sections,
+        candidate_skills=request.candidate_skills,
+        max_projects_per_section=request.max_projects_per_section,
+        stream_tokens=request.stream_tokens
+    )
+    return _sse_response(events)
+
+@router.post("/generate-academic-cv/stream")
+async def stream_academic_cv_route(request: DeduplicatedResumeRequest,
+                                   resume_writer_service=Depends(get_resume_writer)):
+    """
+    Streaming variant of /generate-academic-cv.
+    Emits a "section" event as each section completes and a final "done" event.
+    """
+    events = resume_writer_service.stream_tailored_resume_with_deduplication(
+        job_description=request.job_description,
+        include_sections=ACADEMIC_CV_SECTIONS,
+        candidate_skills=request.candidate_skills,
+        stream_tokens=request.stream_tokens
+    )
+    return _sse_response(events, {"cv_type": "academic", "comprehensive_mode": True})
+
+@router.post("/batch/generate-resumes")
+async def batch_generate_resumes_route(request: BatchResumeRequest, resume_writer_service=Depends(get_resume_writer)):
+    """
+    Generate deduplicated resumes for a list of job descriptions in one call.
+    Failed jobs are reported per job; the rest of the batch still completes.
+    """
+    if not request.job_descriptions:
+        raise HTTPException(status_code=400, detail="job_descriptions must not be empty")
+    if len(request.job_descriptions) > settings.resume.batch_max_jobs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.resume.batch_max_jobs} job descriptions per batch"
+        )
+
+    if request.stream:
+        async def events():
+            started = time.perf_counter()
+            failed = 0
+            async for result in resume_writer_service.iter_resumes_batch(
+                request.job_descriptions, request.include_sections, request.max_projects_per_section
+            ):
+                failed += result["status"] == "error"
+                yield {"event": "job", **result}
+            yield {
+                "event": "done",
+                "succeeded": len(request.job_descriptions) - failed,
+                "failed": failed,
+                "generation_time_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+        return _sse_response(events())
+
+    try:
+        return await resume_writer_service.generate_resumes_batch(
+            request.job_descriptions, request.include_sections, request.max_projects_per_section
+        )
+    except Exception as e:
+        logger.error(f"Error generating resume batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def _generate_cover_letter(request: CoverLetterRequest, cover_letter_writer_service) -> Dict[str, Any]:
+    # Extract company info if not provided
+    company_name = request.company_name
+    job_title = request.job_title
+
+    if not company_name or not job_title:
+        extracted_info = cover_letter_writer_service.extract_company_info(request.job_description)
+        company_name = company_name or extracted_info["company_name"]
+        job_title = job_title or extracted_info["job_title"]
+
+    return await cover_letter_writer_service.generate_cover_letter(
+        job_description=request.job_description,
+        candidate_name=request.candidate_name,
+        candidate_resume_sections=request.candidate_resume_sections,
+        company_name=company_name,
+        job_title=job_title,
+        tone=request.tone
+    )
+
 @router.post("/generate-cover-letter", response_model=dict)
-async def generate_cover_letter_route(request: CoverLetterRequest):
+async def generate_cover_letter_route(request: CoverLetterRequest,
+                                      cover_letter_writer_service=Depends(get_cover_letter_writer)):
     """
     Generate a tailored cover letter based on resume data and job description.
     """
     try:
-        # Extract company info if not provided
-        company_name = request.company_name
-        job_title = request.job_title
-        
-        if not company_name or not job_title:
-            extracted_info = cover_letter_writer_service.extract_company_info(request.job_description)
-            company_name = company_name or extracted_info["company_name"]
-            job_title = job_title or extracted_info["job_title"]
-        
-        # Generate cover letter
-        result = await cover_letter_writer_service.generate_cover_letter(
-            job_description=request.job_description,
-            candidate_name=request.candidate_name,
-            candidate_resume_sections=request.candidate_resume_sections,
-            company_name=company_name,
-            job_title=job_title,
-            tone=request.tone
-        )
-        
-        return result
+        return await _generate_cover_letter(request, cover_letter_writer_service)
     except Exception as e:
         logger.error(f"Error generating cover letter: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Job handlers run outside a request; services not built yet are built off the event loop
+async def _deduplicated_resume_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = DeduplicatedResumeRequest(**payload)
+    resume_writer_service = await asyncio.to_thread(get_resume_writer)
+    return await resume_writer_service.generate_tailored_resume_with_deduplication(
+        job_description=request.job_description,
+        include_sections=request.include_sections,
+        candidate_skills=request.candidate_skills,
+        max_projects_per_section=request.max_projects_per_section
+    )
+
+async def _academic_cv_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return await _generate_academic_cv(DeduplicatedResumeRequest(**payload), await asyncio.to_thread(get_resume_writer))
+
+async def _cover_letter_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return await _generate_cover_letter(CoverLetterRequest(**payload), await asyncio.to_thread(get_cover_letter_writer))
+
+job_queue.register("deduplicated_resume", _deduplicated_resume_job)
+job_queue.register("academic_cv", _academic_cv_job)
+job_queue.register("cover_letter", _cover_letter_job)
+
+async def _submit_job(kind: str, request: BaseModel) -> Dict[str, Any]:
+    try:
+        job_id = await job_queue.submit(kind, request.model_dump())
+    except Exception as e:
+        logger.error(f"Error queueing {kind} job: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"job_id": job_id, "kind": kind, "status": "queued", "status_url": f"/api/jobs/{job_id}"}
+
+@router.post("/jobs/generate-deduplicated-resume", status_code=202)
+async def submit_deduplicated_resume_job(request: DeduplicatedResumeRequest):
+    """Queue /generate-deduplicated-resume in the background; poll /jobs/{job_id} for the result."""
+    return await _submit_job("deduplicated_resume", request)
+
+@router.post("/jobs/generate-academic-cv", status_code=202)
+async def submit_academic_cv_job(request: DeduplicatedResumeRequest):
+    """Queue /generate-academic-cv in the background; poll /jobs/{job_id} for the result."""
+    return await _submit_job("academic_cv", request)
+
+@router.post("/jobs/generate-cover-letter", status_code=202)
+async def submit_cover_letter_job(request: CoverLetterRequest):
+    """Queue /generate-cover-letter in the background; poll /jobs/{job_id} for the result."""
+    return await _submit_job("cover_letter", request)
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Return the status of a background job, with its result or error once finished."""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+@router.get("/admin/job-queue-stats")
+async def get_job_queue_stats():
+    """Report queue depth, job counts and wait/service time distributions."""
+    return job_queue.stats()
+
 @router.post("/score-resume", response_model=dict)
-async def score_resume_route(request: ResumeScoringRequest):
+async def score_resume_route(request: ResumeScoringRequest, resume_scorer_service=Depends(get_resume_scorer)):
     """
     Score a resume against a job description using ATS simulation and LLM feedback.
+    With tier=0 only the local keyword score is returned and no LLM call is made,
+    unless prefetch_feedback asks for LLM feedback to be prepared in the background;
+    it can then be fetched from /score-resume/feedback/{feedback_key}.
     """
+    if request.tier not in (0, 1):
+        raise HTTPException(status_code=400, detail="tier must be 0 or 1")
     try:
         # Score the resume
         result = await resume_scorer_service.score_resume(
             job_description=request.job_description,
-            resume_data=request.resume_data
+            resume_data=request.resume_data,
+            tier=request.tier,
+            prefetch_feedback=request.prefetch_feedback
         )
         
         return result
@@ -537,8 +702,52 @@ async def score_resume_route(request: ResumeScoringRequest):
         logger.error(f"Error scoring resume: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/score-resume/feedback/{feedback_key}")
+async def get_score_feedback(feedback_key: str, resume_scorer_service=Depends(get_resume_scorer)):
+    """Return cached tier 1 LLM feedback for a feedback_key from /score-resume, or its pending or failed status."""
+    feedback = resume_scorer_service.get_cached_feedback(feedback_key)
+    if feedback is not None:
+        return {"feedback_key": feedback_key, "status": "ready", "feedback": feedback}
+    status = resume_scorer_service.feedback_status(feedback_key)
+    if status == "pending":
+        return {"feedback_key": feedback_key, "status": "pending"}
+    if status == "failed":
+        return {"feedback_key": feedback_key, "status": "failed",
+                "error": resume_scorer_service.get_feedback_error(feedback_key)}
+    raise HTTPException(status_code=404, detail=f"No feedback for key: {feedback_key}")
+
+@router.post("/batch/score-keywords")
+async def batch_score_keywords_route(request: BulkKeywordScoringRequest,
+                                     resume_scorer_service=Depends(get_resume_scorer)):
+    """
+    Keyword-score every resume against every job description.
+    Returns the full score matrix and matched/missing keywords for the requested pairs.
+    """
+    if not request.job_descriptions or not request.resumes:
+        raise HTTPException(status_code=400, detail="job_descriptions and resumes must not be empty")
+    cells = len(request.job_descriptions) * len(request.resumes)
+    if cells > settings.scoring.bulk_max_pairs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.scoring.bulk_max_pairs} job/resume pairs per request"
+        )
+    try:
+        # Extraction and sparse products are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(
+            resume_scorer_service.score_keywords_bulk,
+            request.job_descriptions,
+            request.resumes,
+            request.pairs,
+            request.include_matrix
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error bulk scoring keywords: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/optimize-resume-section")
-async def optimize_resume_section(request: OptimizeSectionRequest):
+async def optimize_resume_section(request: OptimizeSectionRequest, resume_writer_service=Depends(get_resume_writer)):
     """Optimize an existing resume section for a job."""
     try:
         optimized_content = await resume_writer_service.optimize_existing_section(
@@ -555,7 +764,8 @@ async def optimize_resume_section(request: OptimizeSectionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/generate-cover-letter-intro")
-async def generate_cover_letter_intro(request: JobDescriptionRequest, candidate_skills: List[str] = None):
+async def generate_cover_letter_intro(request: JobDescriptionRequest, candidate_skills: List[str] = None,
+                                      resume_writer_service=Depends(get_resume_writer)):
     """Generate a cover letter introduction paragraph."""
     try:
         intro = await resume_writer_service.generate_cover_letter_intro(
@@ -566,14 +776,71 @@ async def generate_cover_letter_intro(request: JobDescriptionRequest, candidate_
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/create-project-vector-store")
-async def create_project_vector_store():
+async def create_project_vector_store(relevance_ranker=Depends(get_relevance_ranker_or_minimal)):
     """Create vector store from all projects."""
     try:
-        success = await get_relevance_ranker().create_project_vector_store()
+        success = await relevance_ranker.create_project_vector_store()
         return {"status": "success", "message": "Project vector store created successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/admin/cache-stats")
+async def get_cache_stats():
+    """
+    Report size and hit/miss statistics for the in-process caches.
+    Caches of services that have not been built yet are reported as null.
+    """
+    # Cache modules pull in numpy and langchain; keep them off the API import path
+    from app.services.embedding_cache import get_embedding_cache
+    from app.core.llm_cache import get_llm_response_cache
+
+    # A stats probe must not build services, with their LLM clients and indexes
+    container = get_container()
+    rag_service = container.peek("rag_service")
+    resume_scorer_service = container.peek("resume_scorer")
+    try:
+        return {
+            "job_analysis": job_analysis_cache.stats(),
+            "embeddings": get_embedding_cache().stats(),
+            "vector_stores": rag_service.residency_stats() if rag_service is not None else None,
+            "llm_responses": get_llm_response_cache().stats(),
+            "score_feedback": (resume_scorer_service.feedback_cache.stats()
+                               if resume_scorer_service is not None else None)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/admin/services")
+async def get_service_stats():
+    """Report which services have been built, and how long each build took."""
+    return get_container().stats()
+
+@router.get("/debug/traces")
+async def list_traces(limit: int = 50):
+    """Summaries of the most recent request and job traces, newest first."""
+    return {"traces": get_trace_store().recent(limit)}
+
+@router.get("/debug/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """Every span of one trace, with per-stage time, queue wait and token totals."""
+    trace = get_trace_store().get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
+    return trace.to_dict()
+
+@router.get("/debug/traces/{trace_id}/chrome")
+async def get_chrome_trace(trace_id: str):
+    """One trace in Chrome trace-event format, for chrome://tracing or ui.perfetto.dev."""
+    trace = get_trace_store().get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
+    return trace.to_chrome_trace()
+
+@router.get("/debug/loop-stalls")
+async def get_loop_stalls(limit: int = 20):
+    """Event-loop lag and the routes and code locations that blocked the loop, worst first."""
+    return get_loop_watchdog().summary(limit)
+
 @router.get("/health")
 async def health_check():
     return {"status": "healthy"} 
\ No newline at end of file
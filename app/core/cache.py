@@ -0,0 +1,241 @@
+"""
+Shared in-memory caching primitives for the Resume Editor Bot.
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least-recently-used cache with hit/miss counters.
+
+    With `weigh`, entries are also bounded by their total weight (e.g. bytes):
+    least recently used entries are evicted while the total exceeds
+    max_weight, though the newest entry is always kept. A value's weight is
+    taken when it is put, so put it again after it grows.
+    """
+
+    def __init__(self, max_size: int = 1024, max_weight: Optional[float] = None,
+                 weigh: Optional[Callable[[Any], float]] = None):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._weights: Dict[Hashable, float] = {}
+        self.weight = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for a key and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is not cached
+
+        Returns:
+            Cached value or the default
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or refresh a value, evicting the least recently used entry when full."""
+        weight = self.weigh(value) if self.weigh is not None else 0.0
+        with self._lock:
+            self.weight += weight - self._weights.get(key, 0.0)
+            self._weights[key] = weight
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size or (
+                    self.max_weight is not None and self.weight > self.max_weight and len(self._entries) > 1):
+                evicted, _ = self._entries.popitem(last=False)
+                self.weight -= self._weights.pop(evicted, 0.0)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove a key from the cache and return its value."""
+        with self._lock:
+            self.weight -= self._weights.pop(key, 0.0)
+            return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self.weight = 0.0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss statistics for the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
+            if self.weigh is not None:
+                stats.update(weight=self.weight, max_weight=self.max_weight)
+            return stats
+
+
+class AsyncTTLCache:
+    """
+    Size-bounded LRU cache for async computations with per-entry TTL and
+    single-flight coalescing: concurrent callers asking for the same missing
+    key share one in-flight computation instead of starting their own.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 3600,
+                 copy_on_read: bool = False, clock: Callable[[], float] = time.monotonic):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.copy_on_read = copy_on_read
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Task"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def _read(self, value: Any) -> Any:
+        return copy.deepcopy(value) if self.copy_on_read else value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh cached value without computing it, or the default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                return default
+            self._entries.move_to_end(key)
+            return self._read(value)
+
+    def put(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]],
+                             ttl_seconds: Optional[float] = None,
+                             cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Return the cached value for a key, computing it at most once.
+
+        The computation runs in its own task and every caller, the first one
+        included, awaits it through asyncio.shield: a caller that is cancelled
+        (e.g. its client disconnected) stops waiting without cancelling the
+        computation the other callers share.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument coroutine function producing the value
+            ttl_seconds: Optional TTL overriding the cache default
+            cacheable: Optional check a value must pass to be stored, e.g. to
+                skip fallback results; callers still receive the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.get_running_loop().create_task(self._compute(key, compute, ttl_seconds, cacheable))
+            # Retrieve the exception even when every caller stopped waiting
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._inflight[key] = task
+        return self._read(await asyncio.shield(task))
+
+    async def _compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]],
+                       ttl_seconds: Optional[float], cacheable: Optional[Callable[[Any], bool]]) -> Any:
+        try:
+            value = await compute()
+            if cacheable is None or cacheable(value):
+                self.put(key, value, ttl_seconds)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+            self.expirations = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size, hit/miss and coalescing statistics for the cache."""
+        lookups = self.hits + self.misses + self.coalesced
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0
+        }
@@ -1,6 +1,6 @@
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from pydantic_settings import BaseSettings
 from pydantic import BaseModel
@@ -9,12 +9,18 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Tenant whose resume index lives directly under paths.embeddings_dir
+DEFAULT_TENANT = "default"
+# Tenant ids name index directories, so they are restricted to safe path segments
+TENANT_ID_REGEX = r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$"
+
 # --- Configuration Models ---
 class ApiSettings(BaseModel):
     host: str
     port: int
     debug: bool
     cors_origins: List[str]
+    warmup_services: bool = True
 
 class OpenAISettings(BaseModel):
     model: str
@@ -25,6 +31,9 @@ class VectorDBSettings(BaseModel):
     embedding_model: str
     chunk_size: int
     chunk_overlap: int
+    embedding_cache_size: int = 2048
+    max_resident_tenants: int = 50
+    max_resident_index_mb: int = 512
 
 class PathSettings(BaseModel):
     data_dir: str
@@ -32,17 +41,82 @@ class PathSettings(BaseModel):
     exports_dir: str
     resumes_dir: str
     embeddings_dir: str
+    nltk_data_dir: str = "data/nltk_data"
 
 class ResumeSettings(BaseModel):
     max_projects: int
     max_skills: int
     section_order: List[str]
+    section_concurrency: int = 5
+    batch_concurrency: int = 20
+    batch_max_jobs: int = 100
 
 class ProjectAnalysisSettings(BaseModel):
     relevance_threshold: float
     max_recommendations: int
     skill_extraction_enabled: bool
 
+class ProjectStoreSettings(BaseModel):
+    refresh_interval_seconds: float = 2.0
+
+class LLMResponseEndpointSettings(BaseModel):
+    ttl_seconds: Optional[int] = None
+    cache_nondeterministic: bool = False
+
+class LLMResponseCacheSettings(BaseModel):
+    enabled: bool = True
+    max_memory_entries: int = 512
+    default_ttl_seconds: int = 86400
+    endpoints: Dict[str, LLMResponseEndpointSettings] = {}
+
+class CacheSettings(BaseModel):
+    job_analysis_ttl_seconds: int = 3600
+    job_analysis_max_entries: int = 256
+    llm_responses: LLMResponseCacheSettings = LLMResponseCacheSettings()
+
+class LLMGatewaySettings(BaseModel):
+    base_url: Optional[str] = None
+    max_concurrency: int = 16
+    requests_per_second: float = 0.0
+    max_connections: int = 32
+    max_keepalive_connections: int = 32
+    keepalive_expiry_seconds: float = 30.0
+    timeout_seconds: float = 120.0
+    max_retries: int = 2
+
+class ScoringSettings(BaseModel):
+    vocabulary_files: List[str] = ["data/skills.yaml"]
+    extra_keywords: List[str] = []
+    bulk_max_pairs: int = 1000000
+    job_keyword_cache_size: int = 256
+    feedback_cache_max_entries: int = 512
+    feedback_cache_ttl_seconds: int = 86400
+    feedback_failure_ttl_seconds: int = 300
+    prefetch_feedback: bool = False
+    tokenizer: str = "auto"
+
+class TracingSettings(BaseModel):
+    enabled: bool = True
+    debug_header: bool = True
+    max_traces: int = 200
+
+class MetricsSettings(BaseModel):
+    enabled: bool = True
+
+class LoopWatchdogSettings(BaseModel):
+    enabled: bool = False
+    threshold_ms: float = 100.0
+    interval_ms: float = 20.0
+    max_stalls: int = 200
+    stack_depth: int = 40
+
+class JobQueueSettings(BaseModel):
+    db_path: Optional[str] = None
+    workers: int = 4
+    max_attempts: int = 3
+    result_ttl_seconds: int = 604800
+    metrics_window: int = 1000
+
 class Settings(BaseSettings):
     api: ApiSettings
     openai: OpenAISettings
@@ -50,6 +124,14 @@ class Settings(BaseSettings):
     paths: PathSettings
     resume: ResumeSettings
     project_analysis: ProjectAnalysisSettings
+    project_store: ProjectStoreSettings = ProjectStoreSettings()
+    cache: CacheSettings = CacheSettings()
+    llm_gateway: LLMGatewaySettings = LLMGatewaySettings()
+    job_queue: JobQueueSettings = JobQueueSettings()
+    scoring: ScoringSettings = ScoringSettings()
+    tracing: TracingSettings = TracingSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    loop_watchdog: LoopWatchdogSettings = LoopWatchdogSettings()
     
     # Load directly from environment for secrets
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
@@ -0,0 +1,130 @@
+"""
+Lazily built, process-wide service singletons.
+
+Services register a factory under a name and are constructed on the first
+get(), so importing the API does not load vector stores, tokenizers or
+project snapshots. Factories may get() other services, which is how
+dependents share one instance. warmup() builds services in a worker thread
+after the server is up, moving the cost off the first requests.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class ServiceContainer:
+    """Named factories whose results are built once, on first use."""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._build_ms: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.warmup_state = "idle"  # idle, running, done
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """
+        Register the factory building a service.
+
+        Args:
+            name: Service name used with get()
+            factory: Callable without arguments returning the service
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name: str) -> Any:
+        """Return the service, building it on the first call."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        if name not in self._factories:
+            raise KeyError(f"Unknown service: {name}")
+        # One lock per service: unrelated services can be built concurrently
+        with self._locks[name]:
+            if name not in self._instances:
+                start = time.perf_counter()
+                try:
+                    instance = self._factories[name]()
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    raise
+                self._build_ms[name] = (time.perf_counter() - start) * 1000
+                self._errors.pop(name, None)
+                self._instances[name] = instance
+            return self._instances[name]
+
+    def override(self, name: str, instance: Any):
+        """Use an already built instance for a service, e.g. a fake in tests."""
+        with self._lock:
+            self._locks.setdefault(name, threading.Lock())
+            self._factories.setdefault(name, lambda: instance)
+            self._instances[name] = instance
+
+    def reset(self, name: Optional[str] = None):
+        """Drop one built service, or all of them, so the next get() rebuilds it."""
+        with self._lock:
+            names = [name] if name is not None else list(self._instances)
+            for service_name in names:
+                self._instances.pop(service_name, None)
+                self._build_ms.pop(service_name, None)
+
+    def is_built(self, name: str) -> bool:
+        return name in self._instances
+
+    def peek(self, name: str) -> Any:
+        """Return the service if it has been built, without building it; otherwise None."""
+        return self._instances.get(name)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    async def warmup(self, names: Optional[Iterable[str]] = None):
+        """
+        Build services one after another in a worker thread.
+
+        Failures are recorded in stats() and do not stop the warmup; the
+        failing service is retried on its next get().
+
+        Args:
+            names: Services to build, in order; all registered services by default
+        """
+        self.warmup_state = "running"
+        try:
+            for name in list(names or self.names):
+                try:
+                    await asyncio.to_thread(self.get, name)
+                except Exception as e:
+                    print(f"Error warming up service {name}: {str(e)}")
+        finally:
+            self.warmup_state = "done"
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the build state and build time of every registered service."""
+        services = {}
+        for name in self.names:
+            if name in self._instances:
+                services[name] = {"built": True, "build_ms": round(self._build_ms.get(name, 0.0), 1)}
+            else:
+                services[name] = {"built": False, "error": self._errors.get(name)}
+        return {"warmup": self.warmup_state, "services": services}
+
+
+_container: Optional[ServiceContainer] = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> ServiceContainer:
+    """Return the process-wide service container."""
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                _container = ServiceContainer()
+    return _container
@@ -0,0 +1,57 @@
+"""
+Process-wide memoization of job-description analysis.
+
+JobParserService, JobAnalysisService and the /api/parse-job route all send the
+same job text to the LLM during a single user flow. Results are cached here,
+keyed by the normalized job description, the model and the prompt version.
+"""
+
+import hashlib
+import re
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.core.metrics import register_cache
+
+job_analysis_cache = AsyncTTLCache(
+    max_size=settings.cache.job_analysis_max_entries,
+    ttl_seconds=settings.cache.job_analysis_ttl_seconds,
+    copy_on_read=True
+)
+register_cache("job_analysis", job_analysis_cache)
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Collapse whitespace so cosmetic differences map to the same cache entry."""
+    return re.sub(r"\s+", " ", job_description or "").strip()
+
+
+def job_cache_key(kind: str, job_description: str, model: str, prompt_version: str) -> Tuple[str, str, str, str]:
+    """
+    Build the cache key for a job analysis result.
+
+    Args:
+        kind: Type of analysis (e.g. "parse", "analyze")
+        job_description: Raw job description text
+        model: LLM model name
+        prompt_version: Version tag of the prompt producing the result
+
+    Returns:
+        Hashable cache key
+    """
+    digest = hashlib.sha256(normalize_job_description(job_description).encode("utf-8")).hexdigest()
+    return (kind, digest, model, prompt_version)
+
+
+async def cached_job_analysis(kind: str, job_description: str, model: str, prompt_version: str,
+                              compute: Callable[[], Awaitable[Any]],
+                              cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    Return a memoized job analysis, sharing one in-flight LLM call per key.
+
+    Results rejected by `cacheable` (e.g. fallbacks after an unparsable
+    response) are returned but not stored, so the next call retries.
+    """
+    key = job_cache_key(kind, job_description, model, prompt_version)
+    return await job_analysis_cache.get_or_compute(key, compute, cacheable=cacheable)
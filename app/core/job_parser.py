@@ -1,32 +1,43 @@
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
+from app.core.llm_cache import get_llm_response_cache
 import json
 from typing import Dict, Any, List
 import re
 from langchain.prompts import PromptTemplate
+from app.core.job_cache import cached_job_analysis
+
+# Bump whenever the parsing prompt changes so cached results are not reused
+PARSE_PROMPT_VERSION = "1"
 
 class JobParserService:
     def __init__(self):
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment variables")
             
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
+        self.llm = get_llm_gateway().chat_model()
 
     async def parse_job_description(self, job_description: str) -> Dict[str, Any]:
         """
         Parse job description to extract structured information.
         
+        Results are memoized process-wide, so repeated calls with the same job
+        text share a single LLM call.
+        
         Args:
             job_description: Raw job description text
             
         Returns:
             Structured job information dictionary
         """
+        return await cached_job_analysis(
+            "parse", job_description, self.llm.model_name, PARSE_PROMPT_VERSION,
+            lambda: self._parse_job_description_uncached(job_description)
+        )
+
+    async def _parse_job_description_uncached(self, job_description: str) -> Dict[str, Any]:
+        """Parse a job description with the LLM, bypassing the cache."""
         try:
             prompt = ChatPromptTemplate.from_messages([
                 ("system", """You are an expert at parsing job descriptions. Extract the following information:
@@ -48,11 +59,10 @@ class JobParserService:
                 ("user", "Job Description: {job_description}")
             ])
             
-            chain = prompt | self.llm
-            
-            response = await chain.ainvoke({
+            # Persisted across restarts; responses without a JSON object are not cached
+            response = await get_llm_response_cache().ainvoke(prompt, self.llm, {
                 "job_description": job_description
-            })
+            }, endpoint="parse_job", validate=lambda content: "{" in content)
             
             # Parse the JSON response
             try:
@@ -0,0 +1,352 @@
+"""
+In-process background queue for long-running generation jobs.
+
+Resume, academic CV and cover letter generation can take minutes. Submit
+endpoints store the request in a SQLite job table and return a job id right
+away; asyncio workers pick jobs up with a configurable parallelism and write
+the result (or error) back to the table, where GET /api/jobs/{id} reads it.
+
+Jobs left queued or running when the process stopped are queued again the
+next time the workers start. Several worker processes on one host may share
+the table: a job is claimed atomically before it runs, and each running job
+records its owner (host, pid and a per-process nonce), so a starting process
+only re-queues jobs whose owner is no longer alive. The nonce tells a
+restarted server that got its predecessor's pid (e.g. pid 1 in a container)
+apart from the process that claimed the job. Processes on different hosts sharing the file
+are not supported.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import statistics
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.core import tracing
+from app.core.config import settings
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """Whether the process that claimed a job is still running (unknown hosts count as alive)."""
+    if not owner:
+        return False
+    if owner == OWNER:
+        return True
+    parts = owner.rsplit(":", 2)
+    if len(parts) < 3:
+        # Owners recorded before nonces were added: host:pid
+        parts = owner.rsplit(":", 1) + [""]
+    host, pid, _ = parts
+    if host != socket.gethostname():
+        return True
+    try:
+        if int(pid) == os.getpid():
+            # Our pid with another nonce: an earlier process that had this pid
+            return False
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        return True
+    return True
+
+
+def _latency_summary(samples: Deque[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "avg_ms": round(statistics.fmean(ordered), 1),
+        "p50_ms": round(ordered[len(ordered) // 2], 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        "max_ms": round(ordered[-1], 1)
+    }
+
+
+class JobQueue:
+    """SQLite-backed job table worked off by a pool of asyncio tasks."""
+
+    def __init__(self, db_path: str = None, workers: int = None, max_attempts: int = None,
+                 result_ttl_seconds: int = None, clock: Callable[[], float] = time.time):
+        """
+        Args default to settings.job_queue.
+
+        Args:
+            db_path: SQLite file holding the job table; opened on first use
+            workers: Number of jobs processed concurrently
+            max_attempts: Starts after which an interrupted job is marked failed
+            result_ttl_seconds: Age after which finished jobs are purged on start
+            clock: Time source for job timestamps
+        """
+        config = settings.job_queue
+        self._db_path = db_path
+        self.workers = workers or config.workers
+        self.max_attempts = max_attempts or config.max_attempts
+        self.result_ttl_seconds = config.result_ttl_seconds if result_ttl_seconds is None else result_ttl_seconds
+        self.clock = clock
+
+        self._handlers: Dict[str, JobHandler] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Queue and workers belong to the event loop they were started on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+        self.running = 0
+        self.recovered = 0
+        self._wait_ms: Deque[float] = deque(maxlen=config.metrics_window)
+        self._service_ms: Deque[float] = deque(maxlen=config.metrics_window)
+
+    def register(self, kind: str, handler: JobHandler):
+        """
+        Register the coroutine that processes jobs of a kind.
+
+        Args:
+            kind: Job kind passed to submit()
+            handler: Async callable taking the job payload and returning a JSON-serializable result
+        """
+        self._handlers[kind] = handler
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path or settings.job_queue.db_path or os.path.join(settings.paths.data_dir, "jobs.sqlite3")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the job table on first use; call with self._lock held."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, payload TEXT NOT NULL, "
+                "result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+                "created_at REAL NOT NULL, started_at REAL, finished_at REAL, owner TEXT)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a statement and return the number of rows it changed."""
+        with self._lock:
+            conn = self._connection()
+            changed = conn.execute(sql, params).rowcount
+            conn.commit()
+            return changed
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def close(self):
+        """Close the job table; the next call reopens it at the current db_path."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def started(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self._loop is loop and any(not task.done() for task in self._tasks)
+
+    async def start(self):
+        """Start the workers on the running loop and queue every unfinished job again."""
+        if self.started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+
+        if self.result_ttl_seconds > 0:
+            self._execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (SUCCEEDED, FAILED, self.clock() - self.result_ttl_seconds)
+            )
+        # Jobs still marked running by a process that is gone were interrupted by a restart
+        for job_id, owner in self._query("SELECT id, owner FROM jobs WHERE status = ?", (RUNNING,)):
+            if not _owner_alive(owner):
+                self._execute("UPDATE jobs SET status = ?, owner = NULL WHERE id = ? AND status = ?",
+                              (QUEUED, job_id, RUNNING))
+        pending = self._query("SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,))
+        for (job_id,) in pending:
+            self._queue.put_nowait(job_id)
+        self.recovered += len(pending)
+        if pending:
+            print(f"Job queue resumed {len(pending)} unfinished job(s)")
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers. Jobs they were running stay queued for the next start."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> str:
+        """
+        Store a job and queue it for the workers.
+
+        Args:
+            kind: Registered job kind
+            payload: JSON-serializable handler input
+
+        Returns:
+            Id of the new job
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        await self.start()
+        job_id = uuid.uuid4().hex
+        self._execute(
+            "INSERT INTO jobs (id, kind, status, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, kind, QUEUED, json.dumps(payload), self.clock())
+        )
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the status (and result or error once finished) of a job, or None if unknown."""
+        rows = self._query(
+            "SELECT kind, status, result, error, attempts, created_at, started_at, finished_at "
+            "FROM jobs WHERE id = ?", (job_id,)
+        )
+        if not rows:
+            return None
+        kind, status, result, error, attempts, created_at, started_at, finished_at = rows[0]
+        job = {
+            "job_id": job_id,
+            "kind": kind,
+            "status": status,
+            "attempts": attempts,
+            "created_at": created_at,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "wait_ms": round((started_at - created_at) * 1000, 1) if started_at else None,
+            "service_ms": round((finished_at - started_at) * 1000, 1) if finished_at and started_at else None
+        }
+        if status == SUCCEEDED:
+            job["result"] = json.loads(result)
+        elif status == FAILED:
+            job["error"] = error
+        return job
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        rows = self._query("SELECT kind, status, payload, attempts, created_at FROM jobs WHERE id = ?", (job_id,))
+        if not rows or rows[0][1] != QUEUED:
+            return
+        kind, _, payload, attempts, created_at = rows[0]
+
+        if attempts >= self.max_attempts:
+            self._execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED, f"Job interrupted {attempts} times; giving up", self.clock(), job_id)
+            )
+            return
+        handler = self._handlers.get(kind)
+        if handler is None:
+            self._execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED, f"No handler registered for job kind: {kind}", self.clock(), job_id)
+            )
+            return
+
+        started_at = self.clock()
+        # Claim the job; another process sharing the table may have taken it first
+        claimed = self._execute(
+            "UPDATE jobs SET status = ?, owner = ?, attempts = attempts + 1, started_at = ? "
+            "WHERE id = ? AND status = ?",
+            (RUNNING, OWNER, started_at, job_id, QUEUED)
+        )
+        if not claimed:
+            return
+        self._wait_ms.append((started_at - created_at) * 1000)
+        self.running += 1
+        # The job's trace shares its id, so /api/debug/traces/{job_id} shows where the time went
+        with tracing.trace(f"job {kind}", trace_id=job_id) as job_trace:
+            job_trace.attributes.update(kind=kind, attempt=attempts + 1)
+            try:
+                result = await handler(json.loads(payload))
+                status, result_json, error = SUCCEEDED, json.dumps(result, default=str), None
+            except asyncio.CancelledError:
+                self._execute("UPDATE jobs SET status = ?, owner = NULL WHERE id = ?", (QUEUED, job_id))
+                raise
+            except Exception as e:
+                print(f"Job {job_id} ({kind}) failed: {str(e)}")
+                status, result_json, error = FAILED, None, str(e)
+            finally:
+                self.running -= 1
+        if settings.tracing.enabled:
+            job_trace.attributes["status"] = status
+            tracing.get_trace_store().add(job_trace)
+
+        finished_at = self.clock()
+        self._service_ms.append((finished_at - started_at) * 1000)
+        self._execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            (status, result_json, error, finished_at, job_id)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, job counts and wait/service time distributions."""
+        counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}
+        for status, count in self._query("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = count
+        return {
+            "workers": self.workers,
+            "started": self.started,
+            "queue_depth": counts[QUEUED],
+            "running": self.running,
+            "jobs": counts,
+            "recovered": self.recovered,
+            "wait_time": _latency_summary(self._wait_ms),
+            "service_time": _latency_summary(self._service_ms),
+            "kinds": sorted(self._handlers)
+        }
+
+
+_default_queue: Optional[JobQueue] = None
+_default_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, creating it on first use."""
+    global _default_queue
+    if _default_queue is None:
+        with _default_queue_lock:
+            if _default_queue is None:
+                _default_queue = JobQueue()
+    return _default_queue
@@ -0,0 +1,173 @@
+"""
+Multi-pattern technical keyword matching for resume scoring.
+
+The tech vocabulary (built-in keywords, data/skills.yaml and
+settings.scoring.extra_keywords) is compiled once into an Aho-Corasick
+automaton over word tokens. Matching walks the tokens of a text a single
+time, so cost does not grow with the vocabulary size, and a term only
+matches on whole words ("go" does not match "google", "ai" does not match
+"maintain").
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from app.core.config import settings
+
+# Tech stack keywords previously scanned one by one in ResumeScorerService
+DEFAULT_TECH_KEYWORDS = [
+    'python', 'java', 'javascript', 'c++', 'cuda', 'pytorch', 'tensorflow',
+    'onnx', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'fastapi',
+    'django', 'react', 'vue', 'angular', 'nodejs', 'mongodb', 'postgresql',
+    'mysql', 'redis', 'kafka', 'spark', 'hadoop', 'scala', 'go', 'rust',
+    'machine learning', 'deep learning', 'ai', 'ml', 'nlp', 'computer vision',
+    'data science', 'big data', 'cloud computing', 'devops', 'ci/cd',
+    'microservices', 'api', 'rest', 'graphql', 'sql', 'nosql', 'git',
+    'linux', 'unix', 'windows', 'macos', 'jenkins',
+    'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'agile', 'scrum'
+]
+
+# Words are runs of letters/digits; trailing '+' or '#' stay attached (c++, c#)
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*")
+_PARENTHESIZED = re.compile(r"\(([^)]*)\)")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase text and split it into the word tokens used for matching."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton whose alphabet is word tokens.
+
+    Each vocabulary term is a path of tokens through a trie; failure links
+    let overlapping terms ("deep learning", "learning") be reported from one
+    left-to-right pass.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[str, ...]] = [()]
+        self.terms: List[str] = []
+        seen = set()
+        for term in terms:
+            term = " ".join(term.lower().split())
+            if term and term not in seen and self._add(term):
+                seen.add(term)
+                self.terms.append(term)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _add(self, term: str) -> bool:
+        tokens = tokenize(term)
+        if not tokens:
+            return False
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+                self._goto[state][token] = next_state
+            state = next_state
+        self._outputs[state] += (term,)
+        return True
+
+    def _build_failure_links(self):
+        # Breadth-first, so a state's failure target is final before its children use it
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        Return the vocabulary terms occurring in text as whole words.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Distinct matched terms (lowercase vocabulary form) in order of first occurrence
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: Dict[str, None] = {}
+        state = 0
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if outputs[state]:
+                for term in outputs[state]:
+                    found[term] = None
+        return list(found)
+
+
+def _skill_terms(entry: str) -> List[str]:
+    # "Retrieval-Augmented Generation (RAG)" -> the phrase and its abbreviation
+    terms = [part.strip() for part in _PARENTHESIZED.findall(entry)]
+    terms.append(_PARENTHESIZED.sub(" ", entry).strip())
+    return [term for term in terms if term]
+
+
+def load_vocabulary_file(path: str) -> List[str]:
+    """
+    Read tech terms from a skills file shaped like data/skills.yaml.
+
+    Categories map to either a comma-separated string or a list of skills;
+    parenthesized abbreviations are added as terms of their own.
+    """
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f) or {}
+    values = data.values() if isinstance(data, dict) else [data]
+    terms = []
+    for value in values:
+        entries = value if isinstance(value, list) else str(value or "").split(",")
+        for entry in entries:
+            terms.extend(_skill_terms(str(entry)))
+    return terms
+
+
+def load_tech_vocabulary() -> List[str]:
+    """Return the configured tech vocabulary: built-in keywords, skill files and extra keywords."""
+    config = settings.scoring
+    terms = list(DEFAULT_TECH_KEYWORDS)
+    for path in config.vocabulary_files:
+        if not os.path.exists(path):
+            print(f"Tech vocabulary file not found, skipping: {path}")
+            continue
+        try:
+            terms.extend(load_vocabulary_file(path))
+        except Exception as e:
+            print(f"Error loading tech vocabulary from {path}: {str(e)}")
+    terms.extend(config.extra_keywords)
+    return terms
+
+
+_default_matcher: Optional[KeywordMatcher] = None
+_default_matcher_lock = threading.Lock()
+
+
+def get_tech_keyword_matcher() -> KeywordMatcher:
+    """Return the process-wide matcher over the configured tech vocabulary, compiling it on first use."""
+    global _default_matcher
+    if _default_matcher is None:
+        with _default_matcher_lock:
+            if _default_matcher is None:
+                _default_matcher = KeywordMatcher(load_tech_vocabulary())
+    return _default_matcher
@@ -0,0 +1,81 @@
+"""
+Sparse keyword coverage scoring for batches of job descriptions and resumes.
+
+Each document's keyword set becomes a row of a binary CSR matrix over the
+union vocabulary of the batch. One sparse product then gives the number of
+job keywords every resume covers, for all job/resume pairs at once; keyword
+lists are only materialized for the pairs a caller asks about.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def _term_rows(keyword_sets: Sequence[Iterable[str]], vocabulary: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    indptr = [0]
+    indices: List[int] = []
+    for keywords in keyword_sets:
+        columns = {vocabulary.setdefault(keyword, len(vocabulary)) for keyword in keywords}
+        indices.extend(sorted(columns))
+        indptr.append(len(indices))
+    return np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int32)
+
+
+def _term_matrix(rows: Tuple[np.ndarray, np.ndarray], width: int) -> sparse.csr_matrix:
+    indptr, indices = rows
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, width))
+
+
+class KeywordCoverageMatrix:
+    """Binary term matrices of a job batch and a resume batch sharing one vocabulary."""
+
+    def __init__(self, job_keywords: Sequence[Iterable[str]], resume_keywords: Sequence[Iterable[str]]):
+        """
+        Args:
+            job_keywords: Keyword set of each job description
+            resume_keywords: Keyword set of each resume
+        """
+        vocabulary: Dict[str, int] = {}
+        job_rows = _term_rows(job_keywords, vocabulary)
+        resume_rows = _term_rows(resume_keywords, vocabulary)
+        width = max(len(vocabulary), 1)
+        self.jobs = _term_matrix(job_rows, width)
+        self.resumes = _term_matrix(resume_rows, width)
+        self.terms = np.array(list(vocabulary), dtype=object)
+        self.job_sizes = np.diff(self.jobs.indptr)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.jobs.shape[0], self.resumes.shape[0]
+
+    def overlap_counts(self) -> np.ndarray:
+        """Return a (jobs x resumes) array of job keywords found in each resume."""
+        return (self.jobs @ self.resumes.T).toarray()
+
+    def scores(self) -> np.ndarray:
+        """
+        Return the keyword score of every job/resume pair.
+
+        Scores are the percentage of a job's keywords present in the resume,
+        truncated to an int exactly like ResumeScorerService._calculate_keyword_match.
+        """
+        sizes = self.job_sizes[:, None].astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = np.where(sizes > 0, self.overlap_counts() / sizes * 100, 0.0)
+        return coverage.astype(np.int32)
+
+    def pair_keywords(self, job_index: int, resume_index: int) -> Tuple[List[str], List[str]]:
+        """
+        Return the (matched, missing) job keywords of one pair, sorted.
+
+        Args:
+            job_index: Row of the job description
+            resume_index: Row of the resume
+        """
+        job_columns = self.jobs.indices[self.jobs.indptr[job_index]:self.jobs.indptr[job_index + 1]]
+        resume_columns = self.resumes.indices[self.resumes.indptr[resume_index]:self.resumes.indptr[resume_index + 1]]
+        present = np.isin(job_columns, resume_columns, assume_unique=True)
+        return sorted(self.terms[job_columns[present]]), sorted(self.terms[job_columns[~present]])
@@ -0,0 +1,232 @@
+"""
+Response cache for LLM calls whose inputs repeat.
+
+Section optimization, improvement suggestions and job parsing are re-run with
+identical inputs from the UI. Responses are keyed by (model, temperature,
+SHA-256 of the rendered prompt) and kept in an in-memory LRU in front of a
+SQLite file, with a TTL per endpoint.
+
+Calls with temperature > 0 are not cached unless the endpoint opts in, since
+their output is not meant to be reproducible. The SQLite file is opened on
+the first lookup, so a disabled cache never creates it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from langchain_core.messages import AIMessage
+
+from app.core import tracing
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.metrics import register_cache
+
+
+def _model_profile(llm: Any) -> Tuple[str, Optional[float]]:
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+    return str(model), getattr(llm, "temperature", None)
+
+
+def response_cache_key(model: str, temperature: Optional[float], rendered_prompt: str) -> str:
+    """
+    Build the cache key of an LLM response.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature (None when the model has none)
+        rendered_prompt: Prompt text after template variables were filled in
+
+    Returns:
+        Hex digest addressing the response
+    """
+    prompt_hash = hashlib.sha256(rendered_prompt.encode("utf-8")).hexdigest()
+    return hashlib.sha256(json.dumps([model, temperature, prompt_hash]).encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of LLM response texts with per-entry expiry."""
+
+    def __init__(self, cache_path: str = None, max_memory_entries: int = None, clock: Callable[[], float] = time.time):
+        config = settings.cache.llm_responses
+        self.cache_path = cache_path or os.path.join(settings.paths.data_dir, "llm_response_cache.sqlite3")
+        self.memory = LRUCache(max_memory_entries or config.max_memory_entries)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.bypassed = 0
+        self.saved_latency_ms = 0.0
+        self.endpoint_stats: Dict[str, Dict[str, float]] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the SQLite tier on first use; call with self._lock held."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, response TEXT NOT NULL, "
+                "latency_ms REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _endpoint_counter(self, endpoint: str) -> Dict[str, float]:
+        return self.endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0, "bypassed": 0, "saved_latency_ms": 0.0})
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Return a cached (response, original latency in ms) pair, or None.
+
+        Expired entries are dropped from both tiers.
+        """
+        now = self.clock()
+        entry = self.memory.get(key)
+        if entry is not None:
+            response, latency_ms, expires_at = entry
+            if expires_at > now:
+                return response, latency_ms
+            self.memory.pop(key)
+
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response, latency_ms, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, latency_ms, expires_at = row
+            if expires_at <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                return None
+        self.disk_hits += 1
+        self.memory.put(key, (response, latency_ms, expires_at))
+        return response, latency_ms
+
+    def put(self, key: str, endpoint: str, response: str, latency_ms: float, ttl_seconds: float):
+        """Store a response in both tiers for ttl_seconds."""
+        expires_at = self.clock() + ttl_seconds
+        self.memory.put(key, (response, latency_ms, expires_at))
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, response, latency_ms, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, response, latency_ms, expires_at)
+            )
+            conn.commit()
+
+    def endpoint_policy(self, endpoint: str) -> Tuple[float, bool]:
+        """Return (ttl seconds, whether temperature > 0 responses are cached) for an endpoint."""
+        config = settings.cache.llm_responses
+        endpoint_config = config.endpoints.get(endpoint)
+        if endpoint_config is None:
+            return config.default_ttl_seconds, False
+        ttl = endpoint_config.ttl_seconds if endpoint_config.ttl_seconds is not None else config.default_ttl_seconds
+        return ttl, endpoint_config.cache_nondeterministic
+
+    async def ainvoke(self, prompt: Any, llm: Any, inputs: Dict[str, Any], endpoint: str,
+                      validate: Callable[[str], bool] = None) -> AIMessage:
+        """
+        Render a prompt and return the LLM response, served from cache when possible.
+
+        Args:
+            prompt: LangChain prompt template
+            llm: Chat model to call on a miss
+            inputs: Template variables
+            endpoint: Name used for the TTL/opt-in policy and per-endpoint metrics
+            validate: Optional check a fresh response must pass before it is cached
+
+        Returns:
+            Message whose .content is the response text
+        """
+        prompt_value = await prompt.ainvoke(inputs)
+        model, temperature = _model_profile(llm)
+        ttl_seconds, cache_nondeterministic = self.endpoint_policy(endpoint)
+        counter = self._endpoint_counter(endpoint)
+
+        if not settings.cache.llm_responses.enabled or ttl_seconds <= 0 or \
+                (temperature and temperature > 0 and not cache_nondeterministic):
+            self.bypassed += 1
+            counter["bypassed"] += 1
+            return await llm.ainvoke(prompt_value)
+
+        key = response_cache_key(model, temperature, prompt_value.to_string())
+        with tracing.span("llm_cache", "cache", endpoint=endpoint) as lookup:
+            cached = self.get(key)
+            if lookup is not None:
+                lookup.attributes["hit"] = cached is not None
+        if cached is not None:
+            response, latency_ms = cached
+            self.hits += 1
+            self.saved_latency_ms += latency_ms
+            counter["hits"] += 1
+            counter["saved_latency_ms"] += latency_ms
+            return AIMessage(content=response)
+
+        self.misses += 1
+        counter["misses"] += 1
+        started = time.perf_counter()
+        message = await llm.ainvoke(prompt_value)
+        latency_ms = (time.perf_counter() - started) * 1000
+        content = message.content
+        if isinstance(content, str) and content and (validate is None or validate(content)):
+            self.put(key, endpoint, content, latency_ms, ttl_seconds)
+        return message
+
+    def clear(self):
+        """Drop every cached response and reset the counters."""
+        self.memory.clear()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+        self.hits = self.misses = self.disk_hits = self.bypassed = 0
+        self.saved_latency_ms = 0.0
+        self.endpoint_stats = {}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit ratio, stored bytes and saved-latency estimates."""
+        lookups = self.hits + self.misses
+        entries = bytes_stored = 0
+        with self._lock:
+            # A cache that was never used has no file to report on yet
+            if self._conn is not None or os.path.exists(self.cache_path):
+                entries, bytes_stored = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(response AS BLOB))), 0) FROM responses"
+                ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "bypassed": self.bypassed,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "stored_responses": entries,
+            "bytes_stored": bytes_stored,
+            "saved_latency_ms": round(self.saved_latency_ms, 1),
+            "endpoints": {name: dict(counter) for name, counter in self.endpoint_stats.items()},
+            "memory": self.memory.stats()
+        }
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = LLMResponseCache()
+                register_cache("llm_responses", _default_cache)
+    return _default_cache
@@ -0,0 +1,437 @@
+"""
+Shared access point for OpenAI chat and embedding models.
+
+Services obtain their models from the process-wide gateway instead of
+constructing ChatOpenAI themselves. The gateway keeps one model (and one
+pooled, keep-alive httpx client pair) per model/temperature profile, rate
+limits each profile, and caps the number of LLM calls in flight across all
+services with a single semaphore per event loop.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import httpx
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from pydantic import PrivateAttr
+
+from app.core import metrics, tracing
+from app.core.config import settings
+
+Profile = Tuple[str, Optional[float]]
+
+
+def _token_usage(response) -> tuple:
+    """Return (prompt, completion) tokens reported in an LLMResult."""
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    if usage:
+        return usage.get("prompt_tokens", 0) or 0, usage.get("completion_tokens", 0) or 0
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+            prompt_tokens += metadata.get("input_tokens", 0)
+            completion_tokens += metadata.get("output_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback recording every chat model call as an "llm" span.
+
+    The span is a child of the span active when the call starts and carries
+    the model name and the token usage the provider reports.
+    """
+
+    # Called in the caller's context, which holds the current trace
+    run_inline = True
+
+    def __init__(self):
+        self._spans: Dict[UUID, tracing.Span] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            **kwargs: Any) -> None:
+        active = tracing.current_trace()
+        if active is None:
+            return
+        params = kwargs.get("invocation_params") or {}
+        model = (kwargs.get("metadata") or {}).get("ls_model_name") or params.get("model_name") or \
+            params.get("model") or (serialized or {}).get("name")
+        self._spans[run_id] = active.start_span("llm", "llm", tracing.current_span(), model=model)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any) -> None:
+        llm_span = self._spans.pop(run_id, None)
+        if llm_span is not None:
+            llm_span.prompt_tokens, llm_span.completion_tokens = _token_usage(response)
+            llm_span.finish()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        llm_span = self._spans.pop(run_id, None)
+        if llm_span is not None:
+            llm_span.error = type(error).__name__
+            llm_span.finish()
+
+
+# Code object -> name of the *Service class it belongs to (None for other code)
+_service_of_code: Dict[Any, Optional[str]] = {}
+
+
+def _owner_from_self(frame) -> str:
+    """Return the class defining a method frame's function, found through its `self`."""
+    instance = frame.f_locals.get("self")
+    if instance is None:
+        return ""
+    for cls in type(instance).__mro__:
+        for attribute in vars(cls).values():
+            if getattr(attribute, "__code__", None) is frame.f_code:
+                return cls.__name__
+    return type(instance).__name__
+
+
+def _code_owner(frame) -> str:
+    """Return the outermost qualified-name component of a frame's function."""
+    qualname = getattr(frame.f_code, "co_qualname", None)  # Python 3.11+
+    if qualname is None:
+        return _owner_from_self(frame)
+    return qualname.split(".", 1)[0]
+
+
+def _calling_service() -> str:
+    """Return the name of the innermost *Service class on the call stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        service = _service_of_code.get(code, False)
+        if service is False:
+            owner = _code_owner(frame)
+            service = _service_of_code[code] = owner if owner.endswith("Service") else None
+        if service:
+            return service
+        frame = frame.f_back
+    return "other"
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback recording chat model latency, outcome and token
+    usage per calling service and model.
+
+    The calling service is found by walking the stack, which run_inline
+    keeps intact, for the innermost method of a *Service class.
+    """
+
+    run_inline = True
+
+    def __init__(self):
+        self._calls: Dict[UUID, tuple] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            **kwargs: Any) -> None:
+        params = kwargs.get("invocation_params") or {}
+        model = (kwargs.get("metadata") or {}).get("ls_model_name") or params.get("model_name") or \
+            params.get("model") or (serialized or {}).get("name") or "unknown"
+        self._calls[run_id] = (time.perf_counter(), (_calling_service(), str(model)))
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any) -> None:
+        call = self._calls.pop(run_id, None)
+        if call is None:
+            return
+        started, labels = call
+        prompt_tokens, completion_tokens = _token_usage(response)
+        metrics.LLM_CALL_DURATION.observe(time.perf_counter() - started, labels)
+        metrics.LLM_CALLS.inc(1, labels + ("ok",))
+        metrics.LLM_PROMPT_TOKENS.observe(prompt_tokens, labels)
+        metrics.LLM_COMPLETION_TOKENS.observe(completion_tokens, labels)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        call = self._calls.pop(run_id, None)
+        if call is None:
+            return
+        started, labels = call
+        metrics.LLM_CALL_DURATION.observe(time.perf_counter() - started, labels)
+        metrics.LLM_CALLS.inc(1, labels + ("error",))
+
+
+class GatewayChatOpenAI(ChatOpenAI):
+    """ChatOpenAI whose async calls hold a slot of the gateway's global semaphore."""
+
+    _gateway: "LLMGateway" = PrivateAttr(default=None)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        async with self._gateway.slot():
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        async with self._gateway.slot():
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+
+
+class GatewayOpenAIEmbeddings(OpenAIEmbeddings):
+    """OpenAIEmbeddings that counts requests, texts and latency in the metrics registry."""
+
+    def embed_documents(self, texts: List[str], chunk_size: Optional[int] = None, **kwargs: Any) -> List[List[float]]:
+        started = time.perf_counter()
+        try:
+            return super().embed_documents(texts, chunk_size=chunk_size, **kwargs)
+        finally:
+            self._record(len(texts), started)
+
+    async def aembed_documents(self, texts: List[str], chunk_size: Optional[int] = None,
+                               **kwargs: Any) -> List[List[float]]:
+        started = time.perf_counter()
+        try:
+            return await super().aembed_documents(texts, chunk_size=chunk_size, **kwargs)
+        finally:
+            self._record(len(texts), started)
+
+    def _record(self, texts: int, started: float):
+        labels = (self.model,)
+        metrics.EMBEDDING_REQUESTS.inc(1, labels)
+        metrics.EMBEDDING_TEXTS.inc(texts, labels)
+        metrics.EMBEDDING_DURATION.observe(time.perf_counter() - started, labels)
+
+
+class LLMGateway:
+    """
+    Factory and connection owner for every OpenAI model used by the service.
+
+    Models are built once per profile and shared. Tests and benchmarks can
+    install factories with set_override() to substitute local fakes.
+    """
+
+    def __init__(self, api_key: str = None, base_url: str = None, max_concurrency: int = None,
+                 requests_per_second: float = None, max_connections: int = None,
+                 max_keepalive_connections: int = None, keepalive_expiry: float = None,
+                 timeout: float = None, max_retries: int = None):
+        """
+        Args default to settings.OPENAI_API_KEY and settings.llm_gateway.
+
+        Args:
+            api_key: OpenAI API key
+            base_url: Base URL of an OpenAI-compatible API (None for OpenAI)
+            max_concurrency: Maximum LLM calls in flight per event loop
+            requests_per_second: Per-profile request rate (0 disables limiting)
+            max_connections: Connection pool size of each profile's HTTP client
+            max_keepalive_connections: Idle connections kept open per profile
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Request timeout in seconds
+            max_retries: Retries performed by the OpenAI client
+        """
+        config = settings.llm_gateway
+        self.api_key = api_key or settings.OPENAI_API_KEY
+        self.base_url = base_url if base_url is not None else config.base_url
+        self.max_concurrency = max_concurrency or config.max_concurrency
+        self.requests_per_second = config.requests_per_second if requests_per_second is None else requests_per_second
+        self.limits = httpx.Limits(
+            max_connections=max_connections or config.max_connections,
+            max_keepalive_connections=max_keepalive_connections or config.max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry or config.keepalive_expiry_seconds
+        )
+        self.timeout = timeout or config.timeout_seconds
+        self.max_retries = config.max_retries if max_retries is None else max_retries
+        # Records every chat call of the shared models as a span of the current trace
+        self.tracing_callback = TracingCallbackHandler()
+        self.metrics_callback = MetricsCallbackHandler()
+
+        self._lock = threading.Lock()
+        self._chat_models: Dict[Profile, BaseChatModel] = {}
+        self._embeddings: Dict[str, Embeddings] = {}
+        self._http_clients: Dict[Profile, Tuple[httpx.Client, httpx.AsyncClient]] = {}
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+        self._chat_override: Optional[Callable[[str, float], BaseChatModel]] = None
+        self._embeddings_override: Optional[Callable[[str], Embeddings]] = None
+
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_wait_seconds = 0.0
+
+    def set_override(self, chat_factory: Callable[[str, float], BaseChatModel] = None,
+                     embeddings_factory: Callable[[str], Embeddings] = None):
+        """
+        Substitute model construction, e.g. with local fakes in tests.
+
+        Args:
+            chat_factory: Callable(model, temperature) returning a chat model
+            embeddings_factory: Callable(model) returning an Embeddings instance
+        """
+        with self._lock:
+            self._chat_override = chat_factory
+            self._embeddings_override = embeddings_factory
+            self._chat_models.clear()
+            self._embeddings.clear()
+
+    def clear_override(self):
+        """Go back to building real OpenAI models."""
+        self.set_override(None, None)
+
+    def _http_clients_for(self, profile: Profile) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        clients = self._http_clients.get(profile)
+        if clients is None:
+            clients = (
+                httpx.Client(limits=self.limits, timeout=self.timeout),
+                httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+            )
+            self._http_clients[profile] = clients
+        return clients
+
+    def chat_model(self, model: str = None, temperature: float = None) -> BaseChatModel:
+        """
+        Return the shared chat model for a model/temperature profile.
+
+        Args:
+            model: Model name (defaults to settings.openai.model)
+            temperature: Sampling temperature (defaults to settings.openai.temperature)
+
+        Returns:
+            Chat model shared by every caller using the same profile
+        """
+        model = model or settings.openai.model
+        temperature = settings.openai.temperature if temperature is None else temperature
+        profile = (model, float(temperature))
+        with self._lock:
+            chat_model = self._chat_models.get(profile)
+            if chat_model is not None:
+                return chat_model
+
+            if self._chat_override is not None:
+                chat_model = self._chat_override(model, temperature)
+            else:
+                http_client, http_async_client = self._http_clients_for(profile)
+                rate_limiter = None
+                if self.requests_per_second and self.requests_per_second > 0:
+                    rate_limiter = InMemoryRateLimiter(
+                        requests_per_second=self.requests_per_second,
+                        check_every_n_seconds=min(0.1, 1 / self.requests_per_second),
+                        max_bucket_size=max(1, self.requests_per_second)
+                    )
+                chat_model = GatewayChatOpenAI(
+                    model=model,
+                    temperature=temperature,
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    max_retries=self.max_retries,
+                    http_client=http_client,
+                    http_async_client=http_async_client,
+                    rate_limiter=rate_limiter
+                )
+                chat_model._gateway = self
+            callbacks = list(chat_model.callbacks or [])
+            if settings.tracing.enabled and self.tracing_callback not in callbacks:
+                callbacks.append(self.tracing_callback)
+            if settings.metrics.enabled and self.metrics_callback not in callbacks:
+                callbacks.append(self.metrics_callback)
+            chat_model.callbacks = callbacks
+            self._chat_models[profile] = chat_model
+            return chat_model
+
+    def embeddings(self, model: str = None) -> Embeddings:
+        """
+        Return the shared embeddings client for a model.
+
+        Args:
+            model: Embedding model name (defaults to settings.vector_db.embedding_model)
+
+        Returns:
+            Embeddings instance shared by every caller using the same model
+        """
+        model = model or settings.vector_db.embedding_model
+        with self._lock:
+            embeddings = self._embeddings.get(model)
+            if embeddings is not None:
+                return embeddings
+
+            if self._embeddings_override is not None:
+                embeddings = self._embeddings_override(model)
+            else:
+                http_client, http_async_client = self._http_clients_for((model, None))
+                embeddings = GatewayOpenAIEmbeddings(
+                    model=model,
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    max_retries=self.max_retries,
+                    http_client=http_client,
+                    http_async_client=http_async_client
+                )
+            self._embeddings[model] = embeddings
+            return embeddings
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # asyncio primitives are bound to one loop; keep one per running loop
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the max_concurrency LLM call slots of the current event loop."""
+        waited = time.perf_counter()
+        async with self._semaphore():
+            wait_seconds = time.perf_counter() - waited
+            self.total_wait_seconds += wait_seconds
+            tracing.record_queue_wait(wait_seconds)
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return profile and concurrency statistics."""
+        with self._lock:
+            return {
+                "chat_profiles": [list(profile) for profile in self._chat_models],
+                "embedding_models": list(self._embeddings),
+                "http_client_pairs": len(self._http_clients),
+                "max_concurrency": self.max_concurrency,
+                "calls": self.calls,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "avg_wait_ms": round(self.total_wait_seconds / self.calls * 1000, 3) if self.calls else 0.0
+            }
+
+    async def aclose(self):
+        """Close every pooled HTTP client."""
+        with self._lock:
+            clients = list(self._http_clients.values())
+            self._http_clients.clear()
+            self._chat_models.clear()
+            self._embeddings.clear()
+        for http_client, http_async_client in clients:
+            http_client.close()
+            await http_async_client.aclose()
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Return the process-wide LLM gateway, creating it on first use."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway()
+    return _gateway
@@ -0,0 +1,237 @@
+"""
+Event-loop stall watchdog.
+
+Async routes that do blocking work (file exports, DOCX parsing, YAML
+loading, synchronous LLM calls) hold up every other request on the event
+loop. The watchdog finds them in a running server: a heartbeat coroutine
+wakes every interval_ms and measures how late it woke (the loop lag), and a
+monitor thread watches the heartbeat. When the loop has not come back for
+longer than threshold_ms, the thread captures the loop thread's stack with
+sys._current_frames(), so the stack shows the code that is blocking while
+it is still blocking. The stack is attributed to a route by looking for the
+code object of a registered route endpoint among its frames.
+
+Stalls are grouped by route and blocking location (the innermost frame in
+the application's own code) and summarized at /api/debug/loop-stalls.
+The watchdog is off by default; enable it with loop_watchdog.enabled.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, Optional
+
+from app.core import metrics
+from app.core.config import settings
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NO_ROUTE = "(no route)"
+
+
+def _lag_summary(samples: Deque[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "avg_ms": round(statistics.fmean(ordered), 2),
+        "p50_ms": round(ordered[len(ordered) // 2], 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+        "max_ms": round(ordered[-1], 2)
+    }
+
+
+class LoopWatchdog:
+    """Samples event-loop lag and records the stack of the code behind each stall."""
+
+    def __init__(self, threshold_ms: float = None, interval_ms: float = None,
+                 max_stalls: int = None, stack_depth: int = None):
+        """
+        Args default to settings.loop_watchdog.
+
+        Args:
+            threshold_ms: Lag above which the loop counts as stalled
+            interval_ms: Heartbeat and monitor thread period
+            max_stalls: Recent stalls kept for the summary
+            stack_depth: Innermost frames kept of each captured stack
+        """
+        config = settings.loop_watchdog
+        self.threshold = (threshold_ms or config.threshold_ms) / 1000
+        self.interval = (interval_ms or config.interval_ms) / 1000
+        self.stack_depth = stack_depth or config.stack_depth
+        self.stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls or config.max_stalls)
+        self.lag_ms: Deque[float] = deque(maxlen=1000)
+        self.hot_spots: Dict[tuple, Dict[str, Any]] = {}
+        self._routes: Dict[Any, str] = {}
+        self._lock = threading.Lock()
+        self._beat = 0
+        self._beat_at = 0.0
+        self._sample: Optional[Dict[str, Any]] = None  # Stack captured during the current stall
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def register_routes(self, routes: Iterable[Any]):
+        """Map the endpoint code of each route (e.g. app.routes) to "METHOD /path"."""
+        for route in routes:
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(endpoint, "__code__", None)
+            if code is None:
+                continue
+            methods = ",".join(sorted(getattr(route, "methods", None) or []))
+            self._routes[code] = f"{methods} {route.path}".strip()
+
+    def start(self):
+        """Start the heartbeat on the running event loop and the monitor thread."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat_at = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _heartbeat(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                self._beat += 1
+                self._beat_at = time.monotonic()
+                self._sample = None
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.lag_ms.append(lag * 1000)
+            if settings.metrics.enabled:
+                metrics.EVENT_LOOP_LAG.observe(lag)
+            if lag >= self.threshold:
+                with self._lock:
+                    sample = self._sample
+                self._record(lag, sample)
+
+    def _monitor(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                stalled_for = time.monotonic() - self._beat_at - self.interval
+                if stalled_for < self.threshold or self._sample is not None:
+                    continue
+                beat = self._beat
+            sample = self._capture()
+            with self._lock:
+                # Keep it only if the loop is still stuck on the same heartbeat
+                if self._beat == beat:
+                    self._sample = sample
+
+    def _capture(self) -> Dict[str, Any]:
+        """Snapshot the loop thread's stack and find its route and blocking location."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return {"route": NO_ROUTE, "location": "unknown", "stack": []}
+        route = NO_ROUTE
+        location = None
+        current = frame
+        while current is not None:
+            code = current.f_code
+            if location is None and code.co_filename.startswith(APP_ROOT + os.sep):
+                location = f"{os.path.relpath(code.co_filename, os.path.dirname(APP_ROOT))}:" \
+                           f"{current.f_lineno} in {code.co_name}"
+            if code in self._routes:
+                route = self._routes[code]
+                break
+            current = current.f_back
+        stack = traceback.extract_stack(frame, limit=self.stack_depth)
+        if location is None and stack:
+            location = f"{stack[-1].filename}:{stack[-1].lineno} in {stack[-1].name}"
+        return {
+            "route": route,
+            "location": location or "unknown",
+            "stack": [f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in stack]
+        }
+
+    def _record(self, lag: float, sample: Optional[Dict[str, Any]]):
+        # Stalls shorter than one monitor period can end before the thread sees them
+        sample = sample or {"route": NO_ROUTE, "location": "not captured", "stack": []}
+        lag_ms = round(lag * 1000, 1)
+        stall = {"at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                 "duration_ms": lag_ms, **sample}
+        key = (sample["route"], sample["location"])
+        with self._lock:
+            self.stalls.append(stall)
+            spot = self.hot_spots.setdefault(key, {
+                "route": key[0], "location": key[1], "count": 0, "total_ms": 0.0, "max_ms": 0.0
+            })
+            spot["count"] += 1
+            spot["total_ms"] = round(spot["total_ms"] + lag_ms, 1)
+            spot["max_ms"] = max(spot["max_ms"], lag_ms)
+            spot["last_seen"] = stall["at"]
+            spot["stack"] = sample["stack"]
+        if settings.metrics.enabled:
+            metrics.EVENT_LOOP_STALLS.inc(1, (sample["route"],))
+        print(f"Event loop stalled for {lag_ms} ms in {sample['route']} at {sample['location']}")
+
+    def summary(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        Return the lag distribution, the hot spots by total stall time and the newest stalls.
+
+        Args:
+            limit: Hot spots and recent stalls to include
+        """
+        with self._lock:
+            spots = sorted(self.hot_spots.values(), key=lambda spot: spot["total_ms"], reverse=True)
+            recent = list(self.stalls)[::-1][:limit]
+        return {
+            "enabled": settings.loop_watchdog.enabled,
+            "running": self.running,
+            "threshold_ms": self.threshold * 1000,
+            "interval_ms": self.interval * 1000,
+            "lag": _lag_summary(self.lag_ms),
+            "stalls": sum(spot["count"] for spot in spots),
+            "hot_spots": [dict(spot) for spot in spots[:limit]],
+            "recent": [{key: value for key, value in stall.items() if key != "stack"} for stall in recent]
+        }
+
+    def reset(self):
+        """Forget the recorded stalls and lag samples."""
+        with self._lock:
+            self.stalls.clear()
+            self.hot_spots.clear()
+            self.lag_ms.clear()
+
+
+_watchdog: Optional[LoopWatchdog] = None
+_watchdog_lock = threading.Lock()
+
+
+def get_loop_watchdog() -> LoopWatchdog:
+    """Return the process-wide loop watchdog."""
+    global _watchdog
+    if _watchdog is None:
+        with _watchdog_lock:
+            if _watchdog is None:
+                _watchdog = LoopWatchdog()
+    return _watchdog
@@ -0,0 +1,296 @@
+"""
+Prometheus-style metrics for the Resume Editor Bot.
+
+A small in-process implementation of counters, gauges and histograms that
+renders the Prometheus text exposition format (version 0.0.4), so /metrics
+needs no client library and no network dependency. Updating a metric takes
+one lock and a few list operations; label values are passed as a tuple in
+the order of the metric's label names.
+
+Caches register themselves with register_cache(); their hit/miss counters
+are read when /metrics is scraped rather than on every lookup.
+"""
+
+import bisect
+import math
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_BUCKETS = (16, 64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _check(self, labels: Labels):
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {labels}")
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, labels: Labels = ()):
+        with self._lock:
+            if labels not in self._values:
+                self._check(labels)
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+                for labels, value in values]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, labels: Labels = ()):
+        self.inc(-amount, labels)
+
+    def set(self, value: float, labels: Labels = ()):
+        with self._lock:
+            if labels not in self._values:
+                self._check(labels)
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed cumulative buckets, per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, value: float, labels: Labels = ()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                self._check(labels)
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def snapshot(self, labels: Labels = ()) -> Optional[Dict[str, Any]]:
+        """Return the count, sum and cumulative bucket counts of one label set."""
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                return None
+            counts, total = list(series[0]), series[1]
+        cumulative = [sum(counts[:i + 1]) for i in range(len(counts))]
+        return {"count": cumulative[-1], "sum": total,
+                "buckets": dict(zip(self.buckets + (math.inf,), cumulative))}
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        names = self.label_names + ("le",)
+        lines = []
+        for labels, counts, total in series:
+            running = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                running += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))} {running}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {running}")
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Named metrics plus scrape-time collectors, rendered together for /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._caches: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, documentation, label_names, buckets))
+
+    def register_cache(self, name: str, cache: Any):
+        """
+        Report a cache's stats() at scrape time under the given name.
+
+        Only a weak reference is kept; a later registration under the same
+        name replaces the earlier one.
+        """
+        reference = weakref.ref(cache)
+        with self._lock:
+            self._caches[name] = reference
+
+    def _cache_stats(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            caches = sorted(self._caches.items())
+        for name, reference in caches:
+            cache = reference()
+            if cache is None:
+                continue
+            try:
+                yield name, cache.stats()
+            except Exception as e:
+                print(f"Error reading stats of cache {name}: {str(e)}")
+
+    def _cache_lines(self) -> List[str]:
+        # family -> (type, help, stats() keys; the first one present is reported)
+        families = {
+            "cache_hits_total": ("counter", "Cache lookups served from the cache.", ("hits",)),
+            "cache_misses_total": ("counter", "Cache lookups that missed.", ("misses",)),
+            "cache_hit_ratio": ("gauge", "Share of cache lookups served from the cache.", ("hit_ratio",)),
+            "cache_entries": ("gauge", "Entries currently held by the cache.",
+                              ("size", "stored_vectors", "stored_responses")),
+        }
+        stats = list(self._cache_stats())
+        lines = []
+        for family, (kind, documentation, keys) in families.items():
+            samples = []
+            for name, values in stats:
+                value = next((values[key] for key in keys if values.get(key) is not None), None)
+                if value is not None:
+                    samples.append(f'{family}{{cache="{_escape(name)}"}} {_format_value(value)}')
+            if samples:
+                lines += [f"# HELP {family} {documentation}", f"# TYPE {family} {kind}"] + samples
+        return lines
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            samples = metric.samples()
+            if samples:
+                lines += metric.header() + samples
+        lines += self._cache_lines()
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Reset every metric (the registered caches are kept)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+register_cache = registry.register_cache
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.",
+    ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",)
+)
+LLM_CALL_DURATION = registry.histogram(
+    "llm_call_duration_seconds", "Chat model call latency by calling service and model.",
+    ("service", "model")
+)
+LLM_CALLS = registry.counter(
+    "llm_calls_total", "Chat model calls by calling service, model and outcome.",
+    ("service", "model", "status")
+)
+LLM_PROMPT_TOKENS = registry.histogram(
+    "llm_prompt_tokens", "Prompt tokens per chat model call.", ("service", "model"), TOKEN_BUCKETS
+)
+LLM_COMPLETION_TOKENS = registry.histogram(
+    "llm_completion_tokens", "Completion tokens per chat model call.", ("service", "model"), TOKEN_BUCKETS
+)
+EMBEDDING_REQUESTS = registry.counter(
+    "embedding_requests_total", "Embedding API requests by model.", ("model",)
+)
+EMBEDDING_TEXTS = registry.counter(
+    "embedding_texts_total", "Texts sent to the embedding API by model.", ("model",)
+)
+EMBEDDING_DURATION = registry.histogram(
+    "embedding_request_duration_seconds", "Embedding API request latency by model.", ("model",)
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "event_loop_lag_seconds", "How late the loop watchdog's heartbeat woke up.", (),
+    (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+EVENT_LOOP_STALLS = registry.counter(
+    "event_loop_stalls_total", "Event-loop stalls over the watchdog threshold by route.", ("route",)
+)
@@ -0,0 +1,157 @@
+"""
+Vendored NLTK resources and lazily loaded tokenization for resume scoring.
+
+Stopwords (and, when vendored, the punkt sentence model) live in
+data/nltk_data, pinned by data/nltk_data/MANIFEST.json and refreshed with
+scripts/vendor_nltk_data.py. Nothing is ever downloaded at runtime, and
+nothing is loaded until the first scoring call.
+
+When punkt is not vendored, words are split by regex_word_tokenize, a
+dependency-free port of NLTK's word tokenizer rules. It yields the same
+tokens as nltk.word_tokenize except that periods ending a sentence inside a
+longer text stay attached to their word, which keyword extraction strips
+anyway.
+"""
+
+import os
+import re
+import threading
+from typing import Callable, FrozenSet, List, Optional
+
+from app.core.config import settings
+
+STOPWORDS_RESOURCE = os.path.join("corpora", "stopwords", "english")
+PUNKT_RESOURCE = os.path.join("tokenizers", "punkt")
+MANIFEST_FILENAME = "MANIFEST.json"
+
+# Rules of nltk.tokenize.destructive.NLTKWordTokenizer (NLTK 3.8), applied in the same order
+_STARTING_QUOTES = [
+    (re.compile("([«“‘„]|[`]+)"), r" \1 "),
+    (re.compile(r"^\""), r"``"),
+    (re.compile(r"(``)"), r" \1 "),
+    (re.compile(r"([ \(\[{<])(\"|\'{2})"), r"\1 `` "),
+    (re.compile(r"(?i)(\')(?!re|ve|ll|m|t|s|d|n)(\w)\b"), r"\1 \2"),
+]
+_PUNCTUATION = [
+    (re.compile(r'([^\.])(\.)([\]\)}>"\'' "»”’ " r"]*)\s*$"), r"\1 \2 \3 "),
+    (re.compile(r"([:,])([^\d])"), r" \1 \2"),
+    (re.compile(r"([:,])$"), r" \1 "),
+    (re.compile(r"\.{2,}"), r" \g<0> "),
+    (re.compile(r"[;@#$%&]"), r" \g<0> "),
+    (re.compile(r'([^\.])(\.)([\]\)}>"\']*)\s*$'), r"\1 \2\3 "),
+    (re.compile(r"[?!]"), r" \g<0> "),
+    (re.compile(r"([^'])' "), r"\1 ' "),
+    (re.compile(r"[*]"), r" \g<0> "),
+    (re.compile(r"[\]\[\(\)\{\}\<\>]"), r" \g<0> "),
+    (re.compile(r"--"), r" -- "),
+]
+_ENDING_QUOTES = [
+    (re.compile("([»”’])"), r" \1 "),
+    (re.compile(r"''"), " '' "),
+    (re.compile(r'"'), " '' "),
+    (re.compile(r"([^' ])('[sS]|'[mM]|'[dD]|') "), r"\1 \2 "),
+    (re.compile(r"([^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T) "), r"\1 \2 "),
+]
+_CONTRACTIONS = [re.compile(pattern) for pattern in (
+    r"(?i)\b(can)(?#X)(not)\b",
+    r"(?i)\b(d)(?#X)('ye)\b",
+    r"(?i)\b(gim)(?#X)(me)\b",
+    r"(?i)\b(gon)(?#X)(na)\b",
+    r"(?i)\b(got)(?#X)(ta)\b",
+    r"(?i)\b(lem)(?#X)(me)\b",
+    r"(?i)\b(more)(?#X)('n)\b",
+    r"(?i)\b(wan)(?#X)(na)(?=\s)",
+    r"(?i) ('t)(?#X)(is)\b",
+    r"(?i) ('t)(?#X)(was)\b",
+)]
+
+
+def regex_word_tokenize(text: str) -> List[str]:
+    """
+    Split text into words and punctuation like nltk.word_tokenize(text, preserve_line=True).
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    for pattern, substitution in _STARTING_QUOTES:
+        text = pattern.sub(substitution, text)
+    for pattern, substitution in _PUNCTUATION:
+        text = pattern.sub(substitution, text)
+    text = f" {text} "
+    for pattern, substitution in _ENDING_QUOTES:
+        text = pattern.sub(substitution, text)
+    for pattern in _CONTRACTIONS:
+        text = pattern.sub(r" \1 \2 ", text)
+    return text.split()
+
+
+def nltk_data_dir() -> str:
+    """Return the vendored NLTK resource directory."""
+    return settings.paths.nltk_data_dir
+
+
+def has_vendored_resource(resource: str) -> bool:
+    """Return whether a resource (e.g. PUNKT_RESOURCE) is present in the vendored directory."""
+    path = os.path.join(nltk_data_dir(), resource)
+    return os.path.exists(path) or os.path.exists(path + ".zip")
+
+
+_lock = threading.Lock()
+_stopwords: Optional[FrozenSet[str]] = None
+_tokenizer: Optional[Callable[[str], List[str]]] = None
+_tokenizer_name: Optional[str] = None
+
+
+def get_stopwords() -> FrozenSet[str]:
+    """Return the English stopwords, read from the vendored directory on first use."""
+    global _stopwords
+    if _stopwords is None:
+        with _lock:
+            if _stopwords is None:
+                path = os.path.join(nltk_data_dir(), STOPWORDS_RESOURCE)
+                if not os.path.exists(path):
+                    raise LookupError(
+                        f"Stopwords not found at {path}; run scripts/vendor_nltk_data.py to vendor them"
+                    )
+                with open(path, 'r', encoding='utf-8') as f:
+                    _stopwords = frozenset(line.strip() for line in f if line.strip())
+    return _stopwords
+
+
+def _resolve_tokenizer():
+    mode = settings.scoring.tokenizer
+    if mode not in ("auto", "nltk", "regex"):
+        raise ValueError(f"Unknown scoring.tokenizer: {mode}")
+    if mode == "regex" or (mode == "auto" and not has_vendored_resource(PUNKT_RESOURCE)):
+        return regex_word_tokenize, "regex"
+
+    # Importing nltk takes about a second, so it only happens here
+    import nltk
+    from nltk.tokenize import word_tokenize
+    if nltk_data_dir() not in nltk.data.path:
+        nltk.data.path.insert(0, os.path.abspath(nltk_data_dir()))
+    nltk.data.find("tokenizers/punkt")
+    return word_tokenize, "nltk"
+
+
+def get_word_tokenizer() -> Callable[[str], List[str]]:
+    """
+    Return the word tokenizer selected by settings.scoring.tokenizer, loading it on first use.
+
+    "auto" uses nltk.word_tokenize when punkt is vendored and regex_word_tokenize
+    otherwise; "nltk" requires vendored punkt; "regex" never imports NLTK.
+    """
+    global _tokenizer, _tokenizer_name
+    if _tokenizer is None:
+        with _lock:
+            if _tokenizer is None:
+                _tokenizer, _tokenizer_name = _resolve_tokenizer()
+    return _tokenizer
+
+
+def tokenizer_name() -> Optional[str]:
+    """Return "nltk" or "regex" once the tokenizer has been loaded, else None."""
+    return _tokenizer_name
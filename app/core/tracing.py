@@ -0,0 +1,287 @@
+"""
+Lightweight request tracing for the generation pipeline.
+
+A Trace collects Spans: named, timed stages (job parsing, project selection,
+section generation, LLM calls, embeddings, vector searches, export) that
+nest through a ContextVar, so concurrent sections each get their own
+branch. Spans record wall time, time spent queueing for a concurrency slot,
+and prompt/completion token counts. Code outside an active trace pays only
+a ContextVar lookup.
+
+A finished trace serializes to JSON (spans plus per-stage totals) and to the
+Chrome trace-event format, which chrome://tracing and https://ui.perfetto.dev
+render as a flame chart. Recent traces are kept in a bounded store. LLM
+calls become spans through the gateway's TracingCallbackHandler.
+"""
+
+import asyncio
+import functools
+import inspect
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+def _lane() -> int:
+    # Spans of one task (or thread) nest properly, so each gets its own row in the trace viewer
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) if task is not None else threading.get_ident()
+
+
+class Span:
+    """One timed stage of a trace."""
+
+    __slots__ = ("id", "parent_id", "name", "category", "start", "end", "lane",
+                 "queue_wait_seconds", "prompt_tokens", "completion_tokens", "attributes", "error")
+
+    def __init__(self, name: str, category: str, parent_id: Optional[int], attributes: Dict[str, Any]):
+        self.id = next(_span_ids)
+        self.parent_id = parent_id
+        self.name = name
+        self.category = category
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.lane = _lane()
+        self.queue_wait_seconds = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def finish(self):
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+
+class Trace:
+    """Spans recorded while handling one request or job."""
+
+    def __init__(self, name: str, trace_id: str = None):
+        self.id = trace_id or uuid.uuid4().hex
+        self.name = name
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.spans: List[Span] = []
+        self.attributes: Dict[str, Any] = {}
+
+    def start_span(self, name: str, category: str = "app", parent: Optional[Span] = None, **attributes) -> Span:
+        span = Span(name, category, parent.id if parent is not None else None, attributes)
+        self.spans.append(span)
+        return span
+
+    def finish(self):
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+    def summary(self) -> Dict[str, Any]:
+        """Return per-stage totals: span count, wall time, queue wait and tokens."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        for span in self.spans:
+            stage = stages.setdefault(span.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                                  "queue_wait_ms": 0.0, "prompt_tokens": 0,
+                                                  "completion_tokens": 0})
+            duration_ms = span.duration_ms
+            stage["count"] += 1
+            stage["total_ms"] += duration_ms
+            stage["max_ms"] = max(stage["max_ms"], duration_ms)
+            stage["queue_wait_ms"] += span.queue_wait_seconds * 1000
+            stage["prompt_tokens"] += span.prompt_tokens
+            stage["completion_tokens"] += span.completion_tokens
+        for stage in stages.values():
+            for key in ("total_ms", "max_ms", "queue_wait_ms"):
+                stage[key] = round(stage[key], 2)
+        return {
+            "trace_id": self.id,
+            "name": self.name,
+            "duration_ms": round(self.duration_ms, 2),
+            "llm_calls": sum(1 for span in self.spans if span.category == "llm"),
+            "prompt_tokens": sum(span.prompt_tokens for span in self.spans),
+            "completion_tokens": sum(span.completion_tokens for span in self.spans),
+            "stages": stages
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the trace as JSON-serializable data, spans in start order."""
+        return {
+            **self.summary(),
+            "started_at": self.started_at,
+            "attributes": self.attributes,
+            "spans": [{
+                "id": span.id,
+                "parent_id": span.parent_id,
+                "name": span.name,
+                "category": span.category,
+                "start_ms": round((span.start - self.start) * 1000, 3),
+                "duration_ms": round(span.duration_ms, 3),
+                "queue_wait_ms": round(span.queue_wait_seconds * 1000, 3),
+                "prompt_tokens": span.prompt_tokens,
+                "completion_tokens": span.completion_tokens,
+                "attributes": span.attributes,
+                "error": span.error
+            } for span in sorted(self.spans, key=lambda s: s.start)]
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the trace in Chrome trace-event format (complete "X" events, microseconds)."""
+        lanes: Dict[int, int] = {}
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 0,
+                   "args": {"name": f"{self.name} {self.id}"}}]
+        for span in sorted(self.spans, key=lambda s: s.start):
+            tid = lanes.setdefault(span.lane, len(lanes) + 1)
+            args = {**span.attributes, "queue_wait_ms": round(span.queue_wait_seconds * 1000, 3)}
+            if span.prompt_tokens or span.completion_tokens:
+                args.update(prompt_tokens=span.prompt_tokens, completion_tokens=span.completion_tokens)
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - self.start) * 1e6, 1),
+                "dur": round(span.duration_ms * 1000, 1),
+                "pid": 1,
+                "tid": tid,
+                "args": args
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def trace(name: str, trace_id: str = None) -> Iterator[Trace]:
+    """Record the spans of the enclosed work into a new trace."""
+    new_trace = Trace(name, trace_id)
+    trace_token = _current_trace.set(new_trace)
+    span_token = _current_span.set(None)
+    try:
+        yield new_trace
+    finally:
+        new_trace.finish()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, category: str = "app", **attributes) -> Iterator[Optional[Span]]:
+    """
+    Time the enclosed block as a child of the current span.
+
+    Yields None (and records nothing) when no trace is active.
+    """
+    active = _current_trace.get()
+    if active is None:
+        yield None
+        return
+    new_span = active.start_span(name, category, _current_span.get(), **attributes)
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.error = type(e).__name__
+        raise
+    finally:
+        new_span.finish()
+        _current_span.reset(token)
+
+
+def traced(name: str, category: str = "app", **attributes):
+    """Decorator form of span() for sync and async functions."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name, category, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, category, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_queue_wait(seconds: float):
+    """Add time spent waiting for a concurrency slot to the current span."""
+    current = _current_span.get()
+    if current is not None:
+        current.queue_wait_seconds += seconds
+
+
+def annotate(**attributes):
+    """Set attributes on the current span."""
+    current = _current_span.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+class TraceStore:
+    """The most recent finished traces, by id; the oldest are dropped first."""
+
+    def __init__(self, max_traces: int = None):
+        self.max_traces = max_traces or settings.tracing.max_traces
+        self._traces: "OrderedDict[str, Trace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, finished: Trace):
+        with self._lock:
+            self._traces[finished.id] = finished
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            return self._traces.get(trace_id)
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return summaries of the newest traces first."""
+        with self._lock:
+            traces = list(self._traces.values())[::-1][:limit]
+        return [{**t.summary(), "started_at": t.started_at, "attributes": t.attributes} for t in traces]
+
+
+_store: Optional[TraceStore] = None
+_store_lock = threading.Lock()
+
+
+def get_trace_store() -> TraceStore:
+    """Return the process-wide store of recent traces."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TraceStore()
+    return _store
@@ -7,11 +7,37 @@ with proper configuration and middleware setup.
 
 import logging.config
 import yaml
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.dependencies import start_warmup
+from app.api.metrics import router as metrics_router
+from app.api.middleware import MetricsMiddleware, TracingMiddleware
 from app.api.routes import router as api_router
 from app.core.config import settings
+from app.core.job_queue import get_job_queue
+from app.core.loop_watchdog import get_loop_watchdog
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the loop watchdog if enabled, resume unfinished background jobs and warm up services."""
+    watchdog = None
+    if settings.loop_watchdog.enabled:
+        watchdog = get_loop_watchdog()
+        watchdog.register_routes(app.routes)
+        watchdog.start()
+    job_queue = get_job_queue()
+    await job_queue.start()
+    # Services build in the background; requests arriving first build what they need
+    warmup = start_warmup()
+    yield
+    if warmup is not None:
+        warmup.cancel()
+    await job_queue.stop()
+    if watchdog is not None:
+        await watchdog.stop()
 
 
 def create_app() -> FastAPI:
@@ -26,7 +52,11 @@ def create_app() -> FastAPI:
     if log_config_path.exists():
         with open(log_config_path, "r") as f:
             log_config = yaml.safe_load(f)
-            logging.config.dictConfig(log_config)
+        # File handlers fail to open when their directory does not exist yet
+        for handler in log_config.get("handlers", {}).values():
+            if "filename" in handler:
+                Path(handler["filename"]).parent.mkdir(parents=True, exist_ok=True)
+        logging.config.dictConfig(log_config)
     
     # Create FastAPI app
     app = FastAPI(
@@ -34,7 +64,8 @@ def create_app() -> FastAPI:
         description="An intelligent resume editing assistant powered by RAG",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
     
     # Configure CORS
@@ -44,10 +75,18 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Trace-Id", "X-Debug-Trace"],
     )
     
+    # Trace requests through the generation pipeline
+    app.add_middleware(TracingMiddleware)
+    # Outermost, so route latency includes the other middleware
+    app.add_middleware(MetricsMiddleware)
+    
     # Include API routes
     app.include_router(api_router, prefix="/api")
+    # Prometheus scrape endpoint
+    app.include_router(metrics_router)
     
     # Root endpoint
     @app.get("/")
@@ -1,12 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.metrics import router as metrics_router
+from app.api.middleware import MetricsMiddleware, TracingMiddleware
 from app.api.routes import router as api_router
 from app.core.config import settings
+from app.factory import lifespan
 
 app = FastAPI(
     title="Resume Editor Bot",
     description="A RAG-based Resume Editor Bot for optimizing resumes",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -16,10 +20,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id", "X-Debug-Trace"],
 )
 
+# Trace requests through the generation pipeline
+app.add_middleware(TracingMiddleware)
+# Outermost, so route latency includes the other middleware
+app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
+# Prometheus scrape endpoint
+app.include_router(metrics_router)
 
 @app.get("/")
 async def root():
@@ -1,14 +1,11 @@
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
 from app.core.prompts import COVER_LETTER_PROMPT_TEMPLATE
 from typing import Dict, Any, List, Optional
 import jinja2
 from datetime import datetime
 import os
-from docx import Document
-from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 import re
 
 class CoverLetterWriterService:
@@ -16,11 +13,7 @@ class CoverLetterWriterService:
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment variables")
             
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
+        self.llm = get_llm_gateway().chat_model()
         
         # Initialize Jinja2 environment
         self.jinja_env = jinja2.Environment()
@@ -126,9 +119,14 @@ class CoverLetterWriterService:
         """
         try:
             # Create exports directory if it doesn't exist
-            exports_dir = "data/exports"
+            exports_dir = settings.paths.exports_dir
             os.makedirs(exports_dir, exist_ok=True)
             
+            # python-docx is slow to import; only load it when a letter is saved
+            from docx import Document
+            from docx.shared import Inches
+            from docx.enum.text import WD_ALIGN_PARAGRAPH
+
             # Create document
             doc = Document()
             
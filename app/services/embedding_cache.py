@@ -0,0 +1,160 @@
+import os
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.core import tracing
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.metrics import register_cache
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest used to address cached embeddings."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache.
+
+    Vectors are keyed by (embedding model name, SHA-256 of the embedded text)
+    and stored in a SQLite file on disk, with an in-memory LRU in front of it.
+    """
+
+    def __init__(self, cache_path: str = None, max_memory_entries: int = None):
+        self.cache_path = cache_path or os.path.join(settings.paths.embeddings_dir, "embedding_cache.sqlite3")
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        self.memory = LRUCache(max_memory_entries or settings.vector_db.embedding_cache_size)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, dim INTEGER NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, text_hash))"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def get_many(self, model: str, text_hashes: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached vectors for a batch of text hashes.
+
+        Args:
+            model: Embedding model name
+            text_hashes: SHA-256 digests of the texts
+
+        Returns:
+            Mapping of text hash to vector for every hash that was cached
+        """
+        found = {}
+        disk_lookups = []
+        for text_hash in text_hashes:
+            vector = self.memory.get((model, text_hash))
+            if vector is not None:
+                found[text_hash] = vector
+            else:
+                disk_lookups.append(text_hash)
+
+        if disk_lookups:
+            with self._lock:
+                for text_hash in disk_lookups:
+                    row = self._conn.execute(
+                        "SELECT vector FROM embeddings WHERE model = ? AND text_hash = ?",
+                        (model, text_hash)
+                    ).fetchone()
+                    if row is not None:
+                        vector = np.frombuffer(row[0], dtype=np.float32).tolist()
+                        self.memory.put((model, text_hash), vector)
+                        found[text_hash] = vector
+                        self.disk_hits += 1
+
+        self.hits += len(found)
+        self.misses += len(text_hashes) - len(found)
+        return found
+
+    def put_many(self, model: str, entries: List[Tuple[str, List[float]]]) -> None:
+        """Store (text hash, vector) pairs in both the memory and disk tiers."""
+        rows = []
+        for text_hash, vector in entries:
+            array = np.asarray(vector, dtype=np.float32)
+            self.memory.put((model, text_hash), array.tolist())
+            rows.append((model, text_hash, int(array.shape[0]), array.tobytes()))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dim, vector) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the cache."""
+        lookups = self.hits + self.misses
+        with self._lock:
+            stored = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "stored_vectors": stored,
+            "memory": self.memory.stats()
+        }
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain embeddings wrapper that only sends uncached documents to the
+    underlying model.
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, cache: EmbeddingCache):
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.cache = cache
+        self.documents_embedded = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with tracing.span("embedding", "embedding", texts=len(texts)) as span:
+            hashes = [content_hash(text) for text in texts]
+            cached = self.cache.get_many(self.model_name, list(dict.fromkeys(hashes)))
+
+            # Embed each missing text once, even if it appears several times in the batch
+            missing = {}
+            for text_hash, text in zip(hashes, texts):
+                if text_hash not in cached and text_hash not in missing:
+                    missing[text_hash] = text
+            if span is not None:
+                span.attributes.update(cached=len(cached), embedded=len(missing))
+
+            if missing:
+                vectors = self.embeddings.embed_documents(list(missing.values()))
+                self.documents_embedded += len(missing)
+                new_entries = list(zip(missing.keys(), vectors))
+                self.cache.put_many(self.model_name, new_entries)
+                cached.update(new_entries)
+
+            return [cached[text_hash] for text_hash in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        with tracing.span("embedding", "embedding", texts=1, query=True):
+            return self.embeddings.embed_query(text)
+
+
+_default_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EmbeddingCache()
+        register_cache("embeddings", _default_cache)
+    return _default_cache
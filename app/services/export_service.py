@@ -1,11 +1,8 @@
 from typing import Dict, Any
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from fpdf import FPDF
 import json
 import os
 from datetime import datetime
+from app.core import tracing
 from app.core.config import settings
 
 class ExportService:
@@ -13,8 +10,14 @@ class ExportService:
         self.output_dir = settings.paths.exports_dir
         os.makedirs(self.output_dir, exist_ok=True)
 
+    @tracing.traced("export", "export", format="docx")
     def export_to_docx(self, resume_data: Dict[str, Any], filename: str = None) -> str:
         """Export resume to DOCX format."""
+        # Imported on use: python-docx and fpdf are slow to import and only needed here
+        from docx import Document
+        from docx.shared import Pt, RGBColor
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
         doc = Document()
         
         # Add name
@@ -58,8 +61,11 @@ class ExportService:
         doc.save(file_path)
         return file_path
 
+    @tracing.traced("export", "export", format="pdf")
     def export_to_pdf(self, resume_data: Dict[str, Any], filename: str = None) -> str:
         """Export resume to PDF format."""
+        from fpdf import FPDF
+
         pdf = FPDF()
         pdf.add_page()
         
@@ -102,6 +108,7 @@ class ExportService:
         pdf.output(file_path)
         return file_path
 
+    @tracing.traced("export", "export", format="json")
     def export_to_json(self, resume_data: Dict[str, Any], filename: str = None) -> str:
         """Export resume to JSON format."""
         if not filename:
@@ -1,21 +1,33 @@
-from typing import Dict, List, Any
+from typing import List
 import json
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
 from langchain.prompts import PromptTemplate
 from app.core.prompts import ResumePrompts
+from app.core.job_cache import cached_job_analysis
+from app.core.llm_cache import get_llm_response_cache
+
+# Bump whenever the analysis prompt changes so cached results are not reused
+ANALYSIS_PROMPT_VERSION = "1"
+
+def _is_text_fallback(analysis: dict) -> bool:
+    """True for the {"analysis": text} result returned when the LLM reply was not JSON."""
+    return isinstance(analysis, dict) and list(analysis) == ["analysis"]
 
 class JobAnalysisService:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
+        self.llm = get_llm_gateway().chat_model()
 
     async def analyze_job_description(self, job_description: str) -> dict:
-        """Analyze a job description and extract key information."""
+        """Analyze a job description and extract key information (memoized process-wide)."""
+        return await cached_job_analysis(
+            "analyze", job_description, self.llm.model_name, ANALYSIS_PROMPT_VERSION,
+            lambda: self._analyze_job_description_uncached(job_description),
+            cacheable=lambda analysis: not _is_text_fallback(analysis)
+        )
+
+    async def _analyze_job_description_uncached(self, job_description: str) -> dict:
+        """Analyze a job description with the LLM, bypassing the cache."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", "You are an expert job analyst. Extract key information from the job description and structure it in a clear format."),
             ("user", "Job Description: {job_description}\nPlease analyze and provide:\n1. Required Skills\n2. Responsibilities\n3. Qualifications\n4. Experience Level\n5. Industry\n6. Key Keywords")
@@ -56,12 +68,11 @@ class JobAnalysisService:
             ("user", "Section: {section_name}\nCurrent Content: {content}\nJob Description: {job_description}\nPlease provide:\n1. Key improvements\n2. Specific examples\n3. Action items")
         ])
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke({
+        response = await get_llm_response_cache().ainvoke(prompt, self.llm, {
             "section_name": section_name,
             "content": content,
             "job_description": job_description
-        })
+        }, endpoint="suggest_improvements")
 
         try:
             return json.loads(response.content)
@@ -112,28 +123,3 @@ class JobAnalysisService:
                     keywords.add(skill)
             
             return list(keywords)
-    
-    def suggest_improvements(self, resume_section: str, job_description: str) -> Dict[str, Any]:
-        """Suggest improvements to a resume section based on job description."""
-        analysis = self.analyze_job_description(job_description)
-        
-        prompt = f"""Analyze the following resume section and suggest improvements based on the job requirements:
-        
-        Resume Section:
-        {resume_section}
-        
-        Job Requirements:
-        {json.dumps(analysis, indent=2)}
-        
-        Please provide:
-        1. Specific improvements to align with job requirements
-        2. Missing keywords to include
-        3. Suggested restructuring
-        4. ATS optimization tips
-        
-        Format the response as a structured JSON."""
-        
-        response = self.llm.predict(prompt)
-        suggestions = json.loads(response)
-        
-        return suggestions 
\ No newline at end of file
@@ -0,0 +1,148 @@
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.services.embedding_cache import content_hash
+
+
+# Keys that change without the project content changing; they are left out of
+# the text we embed so cached project vectors stay valid.
+VOLATILE_PROJECT_KEYS = ('relevance_score', 'created_at', 'source_file')
+
+
+def project_embedding_text(project: Dict[str, Any]) -> str:
+    """Return the canonical text used to embed (and cache) a project."""
+    stable_fields = {k: v for k, v in project.items() if k not in VOLATILE_PROJECT_KEYS}
+    return json.dumps(stable_fields, sort_keys=True, default=str)
+
+
+def project_id(project: Dict[str, Any]) -> str:
+    """
+    Return the stable identifier used to address a project in the index.
+
+    Titles are not unique, so projects are keyed by slug, then by the file
+    they were loaded from, then by a hash of their content.
+    """
+    if project.get('slug'):
+        return str(project['slug'])
+    if project.get('source_file'):
+        return str(project['source_file'])
+    return content_hash(project_embedding_text(project))
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class ProjectEmbeddingIndex:
+    """
+    Dense index of L2-normalized project embeddings.
+
+    Rows of a float32 matrix are aligned with an array of project ids, so a
+    ranking is a single matrix-vector product followed by argpartition.
+    """
+
+    def __init__(self, embeddings: Embeddings, text_fn):
+        """
+        Args:
+            embeddings: Embeddings used for project documents and queries
+            text_fn: Callable returning the text to embed for a project
+        """
+        self.embeddings = embeddings
+        self.text_fn = text_fn
+        self.ids = np.empty(0, dtype=object)
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+        self._row_of: Dict[str, int] = {}
+        self._hash_of: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def sync(self, projects: List[Dict[str, Any]]) -> int:
+        """
+        Bring the index in line with the given projects.
+
+        Only projects that are new or whose embedding text changed are
+        embedded; rows for unchanged projects are reused as-is.
+
+        Args:
+            projects: Current list of projects
+
+        Returns:
+            Number of rows that were (re-)embedded
+        """
+        current = {}
+        for project in projects:
+            current[project_id(project)] = self.text_fn(project)
+        hashes = {pid: content_hash(text) for pid, text in current.items()}
+
+        changed = [pid for pid, text_hash in hashes.items() if self._hash_of.get(pid) != text_hash]
+        if not changed and len(current) == len(self.ids):
+            return 0
+
+        new_vectors = {}
+        if changed:
+            embedded = self.embeddings.embed_documents([current[pid] for pid in changed])
+            normalized = _normalize_rows(np.asarray(embedded, dtype=np.float32))
+            new_vectors = dict(zip(changed, normalized))
+
+        ids = list(current.keys())
+        if ids == list(self.ids):
+            # Same membership and order: patch the changed rows in place
+            for pid, vector in new_vectors.items():
+                self.matrix[self._row_of[pid]] = vector
+        else:
+            dim = self.matrix.shape[1] if self.matrix.size else len(next(iter(new_vectors.values())))
+            matrix = np.empty((len(ids), dim), dtype=np.float32)
+            for row, pid in enumerate(ids):
+                matrix[row] = new_vectors[pid] if pid in new_vectors else self.matrix[self._row_of[pid]]
+            self.matrix = matrix
+            self.ids = np.array(ids, dtype=object)
+            self._row_of = {pid: row for row, pid in enumerate(ids)}
+
+        self._hash_of = hashes
+        return len(changed)
+
+    def top_k(self, query_vector: List[float], k: Optional[int] = None,
+              min_score: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Return the k most similar projects by cosine similarity.
+
+        Args:
+            query_vector: Embedding of the query text
+            k: Maximum number of results (all projects when None)
+            min_score: Optional similarity threshold
+
+        Returns:
+            List of (project id, score) pairs ordered by descending score
+        """
+        if not len(self.ids):
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        scores = self.matrix @ query
+
+        n = len(scores)
+        k = n if k is None else max(0, min(k, n))
+        if k == 0:
+            return []
+        if k < n:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(n)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        results = []
+        for row in order:
+            score = float(scores[row])
+            if min_score is not None and score < min_score:
+                break
+            results.append((self.ids[row], score))
+        return results
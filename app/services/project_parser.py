@@ -1,9 +1,9 @@
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
 import yaml
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable
 import json
 from datetime import datetime
 from langchain.prompts import PromptTemplate
@@ -14,14 +14,22 @@ class ProjectParserService:
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment variables")
             
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
+        self.llm = get_llm_gateway().chat_model()
         
         self.projects_dir = settings.paths.projects_dir
         os.makedirs(self.projects_dir, exist_ok=True)
+        self._save_listeners: List[Callable[[str], Any]] = []
+
+    def add_save_listener(self, listener: Callable[[str], Any]):
+        """Register a callback invoked with the file path of every saved project."""
+        self._save_listeners.append(listener)
+
+    def _notify_saved(self, filepath: str):
+        for listener in self._save_listeners:
+            try:
+                listener(filepath)
+            except Exception as e:
+                print(f"Error notifying project save listener: {str(e)}")
 
     async def parse_project_dump(self, dump_text: str, project_title: str = None) -> Dict[str, Any]:
         """
@@ -108,6 +116,7 @@ class ProjectParserService:
             with open(filepath, 'w') as f:
                 yaml.dump(project_data, f, default_flow_style=False, sort_keys=False)
             
+            self._notify_saved(filepath)
             return filepath
             
         except Exception as e:
@@ -122,6 +131,7 @@ class ProjectParserService:
         with open(filepath, 'w') as f:
             yaml.dump(parsed_data, f, default_flow_style=False, sort_keys=False)
         
+        self._notify_saved(filepath)
         return parsed_data
 
     def _sanitize_filename(self, filename: str) -> str:
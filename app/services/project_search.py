@@ -0,0 +1,233 @@
+import re
+import math
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.metrics import register_cache
+
+# Field weights mirror the original substring-search scores
+FIELD_BOOSTS = {
+    'title': 3.0,
+    'description': 2.0,
+    'technologies': 1.0,
+    'methods': 1.0,
+}
+FIELDS = tuple(FIELD_BOOSTS)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into search tokens (keeps 'c++' and 'c#' intact)."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(item) for item in value)
+    return str(value or "")
+
+
+class ProjectSearchIndex:
+    """
+    Tokenized inverted index over projects with BM25F scoring.
+
+    Each field keeps its own term frequencies and length normalization, and
+    field contributions are weighted by FIELD_BOOSTS before BM25 saturation.
+    Documents can be added or removed one at a time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, min_prefix_length: int = 2,
+                 max_prefix_expansions: int = 64, max_cached_terms: int = 512):
+        self.k1 = k1
+        self.b = b
+        self.min_prefix_length = min_prefix_length
+        self.max_prefix_expansions = max_prefix_expansions
+        self.max_cached_terms = max_cached_terms
+
+        self._doc_ids: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._field_lengths: Dict[str, List[int]] = {field: [] for field in FIELDS}
+        self._total_field_lengths: Dict[str, int] = {field: 0 for field in FIELDS}
+        self._postings: Dict[str, Dict[int, Tuple[int, ...]]] = {}
+        self._doc_terms: Dict[int, List[str]] = {}
+
+        # Derived data, rebuilt lazily after updates
+        self._vocabulary: Optional[List[str]] = None
+        self._length_arrays: Optional[Dict[str, np.ndarray]] = None
+        # term -> (rows, scores) for selective terms, or (None, dense scores)
+        # for terms present in a large share of the documents
+        self._term_scores = LRUCache(max_cached_terms)
+        register_cache("project_search_terms", self._term_scores)
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def add(self, doc_id: str, project: Dict[str, Any]) -> None:
+        """Index (or re-index) a project under the given id."""
+        if doc_id in self._row_of:
+            self.remove(doc_id)
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._doc_ids[row] = doc_id
+        else:
+            row = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            for field in FIELDS:
+                self._field_lengths[field].append(0)
+        self._row_of[doc_id] = row
+
+        frequencies: Dict[str, List[int]] = {}
+        for position, field in enumerate(FIELDS):
+            tokens = tokenize(_field_text(project.get(field)))
+            self._field_lengths[field][row] = len(tokens)
+            self._total_field_lengths[field] += len(tokens)
+            for token in tokens:
+                frequencies.setdefault(token, [0] * len(FIELDS))[position] += 1
+
+        for term, field_frequencies in frequencies.items():
+            self._postings.setdefault(term, {})[row] = tuple(field_frequencies)
+        self._doc_terms[row] = list(frequencies)
+        self._invalidate(new_terms=True)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a project from the index if present."""
+        row = self._row_of.pop(doc_id, None)
+        if row is None:
+            return
+        removed_terms = False
+        for term in self._doc_terms.pop(row, []):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(row, None)
+                if not postings:
+                    del self._postings[term]
+                    removed_terms = True
+        for field in FIELDS:
+            self._total_field_lengths[field] -= self._field_lengths[field][row]
+            self._field_lengths[field][row] = 0
+        self._doc_ids[row] = None
+        self._free_rows.append(row)
+        self._invalidate(new_terms=removed_terms)
+
+    def clear(self) -> None:
+        """Drop every document from the index."""
+        self.__init__(self.k1, self.b, self.min_prefix_length, self.max_prefix_expansions,
+                      self.max_cached_terms)
+
+    def _invalidate(self, new_terms: bool):
+        # Average field lengths and document counts changed, so cached
+        # per-term scores are stale.
+        self._term_scores.clear()
+        self._length_arrays = None
+        if new_terms:
+            self._vocabulary = None
+
+    def _expand(self, token: str, prefix: bool) -> List[str]:
+        if not prefix or len(token) < self.min_prefix_length:
+            return [token] if token in self._postings else []
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect_left(self._vocabulary, token)
+        expansions = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(token) or len(expansions) >= self.max_prefix_expansions:
+                break
+            expansions.append(term)
+        return expansions
+
+    def _scores_for_term(self, term: str) -> Tuple[Optional[np.ndarray], np.ndarray]:
+        cached = self._term_scores.get(term)
+        if cached is not None:
+            return cached
+
+        postings = self._postings[term]
+        doc_count = len(self._row_of)
+        idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+        rows = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+        frequencies = np.array(list(postings.values()), dtype=np.float64).reshape(len(postings), len(FIELDS))
+
+        if self._length_arrays is None:
+            self._length_arrays = {
+                field: np.asarray(lengths, dtype=np.float64) for field, lengths in self._field_lengths.items()
+            }
+
+        weighted_tf = np.zeros(len(postings))
+        for position, field in enumerate(FIELDS):
+            average_length = self._total_field_lengths[field] / doc_count if doc_count else 0.0
+            if not average_length:
+                continue
+            lengths = self._length_arrays[field][rows]
+            normalization = 1 - self.b + self.b * lengths / average_length
+            weighted_tf += FIELD_BOOSTS[field] * frequencies[:, position] / normalization
+
+        scores = (idf * weighted_tf * (self.k1 + 1) / (weighted_tf + self.k1)).astype(np.float32)
+        if len(rows) * 16 > len(self._doc_ids):
+            # Dense terms are cheaper to accumulate as a contiguous vector
+            dense = np.zeros(len(self._doc_ids), dtype=np.float32)
+            dense[rows] = scores
+            rows, scores = None, dense
+        self._term_scores.put(term, (rows, scores))
+        return rows, scores
+
+    def search(self, query: str, limit: int = 5, prefix: bool = True) -> List[Tuple[str, float]]:
+        """
+        Rank projects for a free-text query.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            prefix: Whether query tokens also match terms they are a prefix of
+
+        Returns:
+            List of (doc id, score) pairs ordered by descending score
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self._row_of or limit <= 0:
+            return []
+
+        total = np.zeros(len(self._doc_ids), dtype=np.float32)
+        for token in tokens:
+            expansions = self._expand(token, prefix)
+            if not expansions:
+                continue
+            if len(expansions) == 1:
+                rows, scores = self._scores_for_term(expansions[0])
+                if rows is None:
+                    total += scores
+                else:
+                    total[rows] += scores
+            else:
+                # A token contributes its best-matching expansion per document
+                best = np.zeros(len(self._doc_ids), dtype=np.float32)
+                for term in expansions:
+                    rows, scores = self._scores_for_term(term)
+                    if rows is None:
+                        np.maximum(best, scores, out=best)
+                    else:
+                        np.maximum.at(best, rows, scores)
+                total += best
+
+        if limit <= 16:
+            # For the usual small limits, repeated argmax beats a full partition
+            results = []
+            for _ in range(limit):
+                row = int(total.argmax())
+                if total[row] <= 0:
+                    break
+                results.append((self._doc_ids[row], float(total[row])))
+                total[row] = 0
+            return results
+
+        matched = np.flatnonzero(total > 0)
+        if not len(matched):
+            return []
+        if len(matched) > limit:
+            matched = matched[np.argpartition(-total[matched], limit - 1)[:limit]]
+        order = matched[np.argsort(-total[matched], kind="stable")]
+        return [(self._doc_ids[row], float(total[row])) for row in order]
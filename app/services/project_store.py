@@ -1,42 +1,146 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 import yaml
 import os
+import time
 from app.core.config import settings
 from app.services.project_parser import ProjectParserService
+from app.services.project_search import ProjectSearchIndex
 import json
 from datetime import datetime
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 class ProjectStoreService:
-    def __init__(self):
-        self.projects_dir = settings.paths.projects_dir
+    def __init__(self, projects_dir: str = None, refresh_interval: float = None):
+        self.projects_dir = projects_dir or settings.paths.projects_dir
         os.makedirs(self.projects_dir, exist_ok=True)
         self.project_parser = ProjectParserService()
-        self.projects_cache = None
+        self.project_parser.add_save_listener(self.refresh_project_file)
+        self.search_index = ProjectSearchIndex()
+        self.refresh_interval = (settings.project_store.refresh_interval_seconds
+                                 if refresh_interval is None else refresh_interval)
+        
+        # In-memory snapshot of the projects directory
+        self._file_signatures: Dict[str, Tuple[int, int]] = {}  # filename -> (mtime_ns, size)
+        self._projects_by_file: Dict[str, Dict[str, Any]] = {}
+        self._title_index: Dict[str, Set[str]] = {}  # lowercased title -> filenames
+        self._technology_index: Dict[str, Set[str]] = {}  # lowercased technology -> filenames
+        self._last_scan = 0.0
         self.last_cache_update = None
-        self.projects = self._load_all_projects()
+        self.projects = []
+        self.refresh()
         
     def get_all_projects(self) -> list[dict]:
-        """Return all loaded projects from the cache."""
+        """Return all loaded projects from the in-memory snapshot."""
+        self._refresh_if_stale()
         return self.projects
 
-    def _load_all_projects(self) -> list[dict]:
-        """Load all project YAML files from the projects directory."""
-        projects = []
-        for filename in os.listdir(self.projects_dir):
-            if filename.endswith(".yaml"):
-                file_path = os.path.join(self.projects_dir, filename)
-                with open(file_path, 'r') as f:
-                    try:
-                        project_data = yaml.safe_load(f)
-                        if project_data:
-                            # Validate and clean the project data
-                            validated_project = self._validate_project(project_data)
-                            if validated_project:
-                                projects.append(validated_project)
-                    except Exception as e:
-                        print(f"Error loading project {filename}: {str(e)}")
-                        continue
-        return projects
+    def refresh(self) -> bool:
+        """
+        Re-scan the projects directory and re-parse only files whose
+        modification time or size changed since the last scan.
+        
+        Returns:
+            True if the snapshot changed
+        """
+        signatures = {}
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".yaml") and entry.is_file():
+                    stat = entry.stat()
+                    signatures[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        
+        removed = self._file_signatures.keys() - signatures.keys()
+        changed = [name for name, signature in signatures.items()
+                   if self._file_signatures.get(name) != signature]
+        
+        for filename in removed:
+            self._unindex(filename)
+        for filename in changed:
+            self._unindex(filename)
+            project = self._load_project_file(filename)
+            if project:
+                self._index(filename, project)
+        
+        self._file_signatures = signatures
+        self._last_scan = time.monotonic()
+        if removed or changed:
+            self._rebuild_project_list()
+            return True
+        return False
+
+    def refresh_project_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Re-index a single project file after it was written.
+        
+        Args:
+            file_path: Path of the YAML file inside the projects directory
+            
+        Returns:
+            The indexed project, or None if the file is missing or invalid
+        """
+        filename = os.path.basename(file_path)
+        full_path = os.path.join(self.projects_dir, filename)
+        self._unindex(filename)
+        project = None
+        if os.path.exists(full_path):
+            stat = os.stat(full_path)
+            self._file_signatures[filename] = (stat.st_mtime_ns, stat.st_size)
+            project = self._load_project_file(filename)
+            if project:
+                self._index(filename, project)
+        else:
+            self._file_signatures.pop(filename, None)
+        self._rebuild_project_list()
+        return project
+
+    def _refresh_if_stale(self):
+        """Refresh the snapshot at most once per refresh interval."""
+        if time.monotonic() - self._last_scan >= self.refresh_interval:
+            self.refresh()
+
+    def _load_project_file(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Load and validate a single project YAML file."""
+        file_path = os.path.join(self.projects_dir, filename)
+        try:
+            with open(file_path, 'r') as f:
+                project_data = yaml.load(f, Loader=_YamlLoader)
+            if project_data:
+                # Validate and clean the project data
+                project = self._validate_project(project_data)
+                if project:
+                    # Distinguishes projects that share a title and have no slug
+                    project['source_file'] = filename
+                return project
+        except Exception as e:
+            print(f"Error loading project {filename}: {str(e)}")
+        return None
+
+    def _index(self, filename: str, project: Dict[str, Any]):
+        self._projects_by_file[filename] = project
+        self.search_index.add(filename, project)
+        self._title_index.setdefault(project['title'].lower(), set()).add(filename)
+        for tech in project.get('technologies', []):
+            self._technology_index.setdefault(str(tech).lower(), set()).add(filename)
+
+    def _unindex(self, filename: str):
+        project = self._projects_by_file.pop(filename, None)
+        if project is None:
+            return
+        self.search_index.remove(filename)
+        for index, keys in ((self._title_index, [project['title']]),
+                            (self._technology_index, project.get('technologies', []))):
+            for key in keys:
+                filenames = index.get(str(key).lower())
+                if filenames is not None:
+                    filenames.discard(filename)
+                    if not filenames:
+                        del index[str(key).lower()]
+
+    def _rebuild_project_list(self):
+        self.projects = [self._projects_by_file[name] for name in sorted(self._projects_by_file)]
+        self.last_cache_update = datetime.now()
     
     def _validate_project(self, project_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -92,26 +196,6 @@ class ProjectStoreService:
             print(f"Error validating project: {str(e)}")
             return None
     
-    def _is_cache_valid(self) -> bool:
-        """Check if the cache is still valid by comparing file modification times."""
-        try:
-            if not os.path.exists(self.projects_dir):
-                return False
-            
-            cache_time = self.last_cache_update.timestamp()
-            
-            for filename in os.listdir(self.projects_dir):
-                if filename.endswith(('.yaml', '.yml')):
-                    filepath = os.path.join(self.projects_dir, filename)
-                    file_mtime = os.path.getmtime(filepath)
-                    if file_mtime > cache_time:
-                        return False
-            
-            return True
-            
-        except Exception:
-            return False
-    
     def get_project_by_title(self, title: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific project by title.
@@ -123,60 +207,33 @@ class ProjectStoreService:
             Project dictionary or None if not found
         """
         try:
-            projects = self._load_all_projects()
-            for project in projects:
-                if project.get('title', '').lower() == title.lower():
-                    return project
-            return None
+            self._refresh_if_stale()
+            filenames = self._title_index.get(title.lower())
+            if not filenames:
+                return None
+            return self._projects_by_file[min(filenames)]
             
         except Exception as e:
             raise ValueError(f"Error finding project: {str(e)}")
     
     def search_projects(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
-        Search projects by title, description, or technologies.
+        Search projects by title, description, technologies, or methods.
+        
+        Uses a BM25 inverted index with field boosts (title 3, description 2,
+        technologies/methods 1) and prefix matching on query tokens.
         
         Args:
             query: Search query
             limit: Maximum number of results
             
         Returns:
-            List of matching projects
+            List of matching projects, best match first
         """
         try:
-            projects = self._load_all_projects()
-            query_lower = query.lower()
-            
-            # Simple text-based search
-            matching_projects = []
-            
-            for project in projects:
-                score = 0
-                
-                # Check title
-                if query_lower in project.get('title', '').lower():
-                    score += 3
-                
-                # Check description
-                if query_lower in project.get('description', '').lower():
-                    score += 2
-                
-                # Check technologies
-                technologies = project.get('technologies', [])
-                for tech in technologies:
-                    if query_lower in tech.lower():
-                        score += 1
-                
-                # Check methods
-                if query_lower in project.get('methods', '').lower():
-                    score += 1
-                
-                if score > 0:
-                    matching_projects.append((project, score))
-            
-            # Sort by score and return top results
-            matching_projects.sort(key=lambda x: x[1], reverse=True)
-            return [project for project, score in matching_projects[:limit]]
+            self._refresh_if_stale()
+            results = self.search_index.search(query, limit)
+            return [self._projects_by_file[filename] for filename, score in results]
             
         except Exception as e:
             raise ValueError(f"Error searching projects: {str(e)}")
@@ -192,19 +249,17 @@ class ProjectStoreService:
             List of projects using the technology
         """
         try:
-            projects = self._load_all_projects()
+            self._refresh_if_stale()
             technology_lower = technology.lower()
             
-            matching_projects = []
+            # Match against the (much smaller) technology vocabulary, then union
+            # the posting sets of every technology containing the query.
+            matching_files = set(self._technology_index.get(technology_lower, ()))
+            for tech, filenames in self._technology_index.items():
+                if technology_lower in tech:
+                    matching_files |= filenames
             
-            for project in projects:
-                technologies = project.get('technologies', [])
-                for tech in technologies:
-                    if technology_lower in tech.lower():
-                        matching_projects.append(project)
-                        break
-            
-            return matching_projects
+            return [self._projects_by_file[name] for name in sorted(matching_files)]
             
         except Exception as e:
             raise ValueError(f"Error filtering by technology: {str(e)}")
@@ -312,7 +367,7 @@ class ProjectStoreService:
             Path to the saved JSON file
         """
         try:
-            projects = self._load_all_projects()
+            projects = self.get_all_projects()
             
             if not filepath:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -332,5 +387,8 @@ class ProjectStoreService:
         filename = f"{title.lower().replace(' ', '_')}.yaml"
         file_path = os.path.join(self.projects_dir, filename)
         
+        project_data = {k: v for k, v in project_data.items() if k != 'source_file'}
         with open(file_path, 'w') as f:
-            yaml.dump(project_data, f, default_flow_style=False, sort_keys=False) 
\ No newline at end of file
+            yaml.dump(project_data, f, default_flow_style=False, sort_keys=False)
+        
+        self.refresh_project_file(file_path) 
\ No newline at end of file
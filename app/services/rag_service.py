@@ -1,41 +1,59 @@
-from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
-from langchain_openai import ChatOpenAI
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema import Document
-from app.core.config import settings
+from app.core import tracing
+from app.core.config import settings, DEFAULT_TENANT, TENANT_ID_REGEX
+from app.core.llm_gateway import get_llm_gateway
+from app.core.llm_cache import get_llm_response_cache
+from app.core.cache import LRUCache
+from app.core.metrics import register_cache
+from app.services.embedding_cache import content_hash
 import os
+import re
 import json
-import faiss
-from langchain.chains import ConversationalRetrievalChain
 
-class RAGService:
-    def __init__(self):
-        self.openai_api_key = settings.OPENAI_API_KEY
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=self.openai_api_key
-        )
-        self.embedding_model = OpenAIEmbeddings(
-            model=settings.vector_db.embedding_model,
-            api_key=self.openai_api_key
-        )
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.vector_db.chunk_size,
-            chunk_overlap=settings.vector_db.chunk_overlap
-        )
-        self.vector_store_path = settings.paths.embeddings_dir
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+TENANTS_DIRNAME = "tenants"
+TENANT_ID_PATTERN = re.compile(TENANT_ID_REGEX)
+
+
+def _chunk_id(chunk: Document) -> str:
+    """Content-addressed id of a chunk, used as its FAISS docstore id."""
+    return content_hash(f"{chunk.metadata.get('section', '')}\n{chunk.page_content}")
+
+
+class TenantVectorStore:
+    """
+    FAISS index of one tenant's resume chunks, persisted in its own directory.
+
+    A manifest.json next to index.faiss records the content hash of every
+    indexed chunk, so updates only embed new chunks and delete stale ones,
+    also across restarts.
+    """
+
+    def __init__(self, path: str, embedding_model, signature: dict):
+        """
+        Args:
+            path: Directory holding index.faiss, index.pkl and the manifest
+            embedding_model: Embeddings used for chunks and queries
+            signature: Embedding settings the stored index must match
+        """
+        self.path = path
+        self.embedding_model = embedding_model
+        self.signature = signature
+        self.manifest_path = os.path.join(path, MANIFEST_FILENAME)
         self.vector_store = self._load_vector_store()
+        self.manifest = self._load_manifest() if self.vector_store else None
 
     def _load_vector_store(self):
         """Loads the vector store from disk if it exists, otherwise returns None."""
-        index_path = os.path.join(self.vector_store_path, "index.faiss")
+        index_path = os.path.join(self.path, "index.faiss")
         if os.path.exists(index_path):
             try:
                 return FAISS.load_local(
-                    self.vector_store_path,
+                    self.path,
                     self.embedding_model,
                     allow_dangerous_deserialization=True
                 )
@@ -44,49 +62,194 @@ class RAGService:
                 return None
         return None
 
-    async def create_vector_store(self, resume_data):
-        """Create a vector store from resume data."""
+    def _load_manifest(self):
+        """
+        Load the chunk manifest written next to index.faiss.
+
+        Returns None when the manifest is missing, was written with different
+        embedding settings, or does not describe the loaded index, in which
+        case the next update rebuilds the index from scratch.
+        """
+        if not os.path.exists(self.manifest_path):
+            return None
         try:
-            # Convert resume sections to documents
-            documents = []
-            for section_name, content in resume_data["sections"].items():
-                if isinstance(content, list):
-                    # Handle structured sections (experience, education, etc.)
-                    for item in content:
-                        if isinstance(item, dict):
-                            doc_text = f"{section_name.title()}: {json.dumps(item, indent=2)}"
-                        else:
-                            doc_text = f"{section_name.title()}: {item}"
-                        documents.append(Document(page_content=doc_text, metadata={"section": section_name}))
-                else:
-                    # Handle simple text sections
-                    documents.append(Document(page_content=f"{section_name.title()}: {content}", metadata={"section": section_name}))
-            
-            if not documents:
-                raise ValueError("No content found in resume sections")
-            
-            # Split documents into chunks
-            texts = self.text_splitter.split_documents(documents)
-            
-            # Create and save vector store
-            self.vector_store = FAISS.from_documents(texts, self.embedding_model)
-            os.makedirs(self.vector_store_path, exist_ok=True)
-            self.vector_store.save_local(self.vector_store_path)
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading vector store manifest: {e}. The index will be rebuilt upon upload.")
+            return None
+
+        if manifest.get("signature") != self.signature:
+            return None
+        if set(manifest.get("chunks", {})) != set(self.vector_store.index_to_docstore_id.values()):
+            return None
+        return manifest
+
+    def approx_bytes(self) -> int:
+        """Approximate memory held by the index's float32 vectors."""
+        if self.vector_store is None:
+            return 0
+        index = self.vector_store.index
+        return index.ntotal * index.d * 4
+
+    def reload(self):
+        """Re-read the index from disk (e.g. after another process wrote it)."""
+        self.vector_store = self._load_vector_store()
+        self.manifest = self._load_manifest() if self.vector_store else None
+
+    def _save(self, chunk_sections: dict):
+        """Persist the index and then its manifest (written atomically)."""
+        os.makedirs(self.path, exist_ok=True)
+        self.vector_store.save_local(self.path)
+        self.manifest = {"signature": self.signature, "chunks": chunk_sections}
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def update(self, chunks: dict) -> int:
+        """
+        Bring the index in line with the given chunks.
+
+        Args:
+            chunks: Mapping of chunk id to chunk document
+
+        Returns:
+            Number of chunks that were embedded
+        """
+        chunk_sections = {chunk_id: chunk.metadata.get("section") for chunk_id, chunk in chunks.items()}
+
+        if self.vector_store is None or self.manifest is None:
+            # No usable index on disk: build it from scratch
+            self.vector_store = FAISS.from_documents(
+                list(chunks.values()), self.embedding_model, ids=list(chunks.keys())
+            )
+            self._save(chunk_sections)
+            return len(chunks)
+
+        # Embed only new chunks and drop the ones that disappeared
+        indexed_ids = set(self.manifest["chunks"])
+        removed_ids = [chunk_id for chunk_id in indexed_ids if chunk_id not in chunks]
+        added_ids = [chunk_id for chunk_id in chunks if chunk_id not in indexed_ids]
+        if not removed_ids and not added_ids:
+            return 0
+
+        if removed_ids:
+            self.vector_store.delete(removed_ids)
+        if added_ids:
+            self.vector_store.add_documents([chunks[chunk_id] for chunk_id in added_ids], ids=added_ids)
+        self._save(chunk_sections)
+        return len(added_ids)
+
+
+class RAGService:
+    def __init__(self, embedding_model=None, vector_store_path=None, max_resident_tenants=None,
+                 max_resident_bytes=None):
+        self.llm = get_llm_gateway().chat_model()
+        self.embedding_model = embedding_model or get_llm_gateway().embeddings()
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=settings.vector_db.chunk_size,
+            chunk_overlap=settings.vector_db.chunk_overlap
+        )
+        self.vector_store_path = vector_store_path or settings.paths.embeddings_dir
+        # Tenant indexes are loaded on first use; every update is written to
+        # disk immediately, so evicting a resident index only frees memory.
+        # Residency is bounded by tenant count and by approximate vector bytes.
+        self.resident_stores = LRUCache(
+            max_resident_tenants or settings.vector_db.max_resident_tenants,
+            max_weight=max_resident_bytes or settings.vector_db.max_resident_index_mb * 1024 * 1024,
+            weigh=TenantVectorStore.approx_bytes
+        )
+        register_cache("vector_stores", self.resident_stores)
+        self.tenant_loads = 0
+
+    def _index_signature(self) -> dict:
+        """Settings that must match for a stored index to be updated in place."""
+        return {
+            "version": MANIFEST_VERSION,
+            "embedding_model": getattr(self.embedding_model, "model", type(self.embedding_model).__name__),
+            "chunk_size": settings.vector_db.chunk_size,
+            "chunk_overlap": settings.vector_db.chunk_overlap,
+        }
+
+    def tenant_path(self, tenant_id: str) -> str:
+        """
+        Return the directory holding a tenant's index.
+
+        The default tenant keeps the original location directly under the
+        embeddings directory so existing indexes remain usable.
+        """
+        if not TENANT_ID_PATTERN.match(tenant_id or ""):
+            raise ValueError(f"Invalid tenant id: {tenant_id!r}")
+        if tenant_id == DEFAULT_TENANT:
+            return self.vector_store_path
+        return os.path.join(self.vector_store_path, TENANTS_DIRNAME, tenant_id)
+
+    def get_tenant_store(self, tenant_id: str = DEFAULT_TENANT) -> TenantVectorStore:
+        """Return the resident index of a tenant, loading it from disk on first use."""
+        store = self.resident_stores.get(tenant_id)
+        if store is None:
+            store = TenantVectorStore(self.tenant_path(tenant_id), self.embedding_model, self._index_signature())
+            self.tenant_loads += 1
+            self.resident_stores.put(tenant_id, store)
+        return store
+
+    def residency_stats(self) -> dict:
+        """Return statistics about resident tenant indexes."""
+        stats = self.resident_stores.stats()
+        stats["loads"] = self.tenant_loads
+        return stats
+
+    def _resume_chunks(self, resume_data) -> dict:
+        """Split resume sections into chunks keyed by content hash (identical chunks collapse)."""
+        documents = []
+        for section_name, content in resume_data["sections"].items():
+            if isinstance(content, list):
+                # Handle structured sections (experience, education, etc.)
+                for item in content:
+                    if isinstance(item, dict):
+                        doc_text = f"{section_name.title()}: {json.dumps(item, indent=2)}"
+                    else:
+                        doc_text = f"{section_name.title()}: {item}"
+                    documents.append(Document(page_content=doc_text, metadata={"section": section_name}))
+            else:
+                # Handle simple text sections
+                documents.append(Document(page_content=f"{section_name.title()}: {content}", metadata={"section": section_name}))
+
+        if not documents:
+            raise ValueError("No content found in resume sections")
+
+        chunks = {}
+        for chunk in self.text_splitter.split_documents(documents):
+            chunks.setdefault(_chunk_id(chunk), chunk)
+        return chunks
+
+    async def create_vector_store(self, resume_data, tenant_id: str = DEFAULT_TENANT):
+        """Create or incrementally update a tenant's vector store from resume data."""
+        try:
+            store = self.get_tenant_store(tenant_id)
+            store.update(self._resume_chunks(resume_data))
+            # Re-weigh the grown index; may evict other tenants
+            self.resident_stores.put(tenant_id, store)
             return True
-            
+
         except Exception as e:
             raise ValueError(f"Error creating vector store: {str(e)}")
 
-    async def query_vector_store(self, query: str, num_results: int = 5) -> list[str]:
-        """Query the vector store for relevant documents."""
-        if not self.vector_store:
+    async def query_vector_store(self, query: str, num_results: int = 5,
+                                 tenant_id: str = DEFAULT_TENANT) -> list[str]:
+        """Query a tenant's vector store for relevant documents."""
+        store = self.get_tenant_store(tenant_id)
+        if not store.vector_store:
             # Reload in case it was created in another process
-            self.vector_store = self._load_vector_store()
-            if not self.vector_store:
+            store.reload()
+            if not store.vector_store:
                 raise ValueError("No resume has been processed. Please upload a resume first.")
+            self.resident_stores.put(tenant_id, store)
 
         try:
-            results = self.vector_store.similarity_search(query, k=num_results)
+            with tracing.span("vector_search", "search", index="faiss", k=num_results):
+                results = store.vector_store.similarity_search(query, k=num_results)
             return [doc.page_content for doc in results]
             
         except Exception as e:
@@ -100,12 +263,11 @@ class RAGService:
                 ("user", "Section: {section_name}\nCurrent Content: {content}\nJob Description: {job_description}\nPlease provide an optimized version of this section.")
             ])
 
-            chain = prompt | self.llm
-            response = await chain.ainvoke({
+            response = await get_llm_response_cache().ainvoke(prompt, self.llm, {
                 "section_name": section_name,
                 "content": content,
                 "job_description": job_description
-            })
+            }, endpoint="optimize_section")
 
             return response.content
             
@@ -1,29 +1,30 @@
 import os
 import json
-from sklearn.metrics.pairwise import cosine_similarity
 from langchain.docstore.document import Document
 from langchain_community.vectorstores import FAISS
 
+from app.core import tracing
 from app.core.config import settings
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from app.core.llm_gateway import get_llm_gateway
 from app.services.job_analysis_service import JobAnalysisService
 from app.services.project_store import ProjectStoreService
+from app.services.embedding_cache import CachedEmbeddings, EmbeddingCache, get_embedding_cache
+from app.services.project_index import ProjectEmbeddingIndex, project_embedding_text, project_id
 
 class RelevanceRanker:
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.vector_db.embedding_model,
-            api_key=settings.OPENAI_API_KEY
+    def __init__(self, embeddings=None, embedding_cache: EmbeddingCache = None,
+                 project_store: ProjectStoreService = None):
+        self.llm = get_llm_gateway().chat_model()
+        self.embeddings = embeddings or get_llm_gateway().embeddings()
+        self.embedding_cache = embedding_cache or get_embedding_cache()
+        self.cached_embeddings = CachedEmbeddings(
+            self.embeddings, settings.vector_db.embedding_model, self.embedding_cache
         )
+        self.project_index = ProjectEmbeddingIndex(self.cached_embeddings, project_embedding_text)
         self.vector_store_path = os.path.join(settings.paths.embeddings_dir, "projects")
         self.vector_store = self._load_vector_store()
         self.job_parser = JobAnalysisService()
-        self.project_store = ProjectStoreService()
+        self.project_store = project_store or ProjectStoreService()
 
     def _load_vector_store(self):
         if os.path.exists(self.vector_store_path):
@@ -46,29 +47,31 @@ class RelevanceRanker:
         os.makedirs(self.vector_store_path, exist_ok=True)
         self.vector_store.save_local(self.vector_store_path)
 
-    async def rank_projects(self, job_description: str, projects: list[dict]) -> list[dict]:
+    async def rank_projects(self, job_description: str, projects: list[dict], top_k: int = None) -> list[dict]:
+        """
+        Rank projects by cosine similarity to a job description.
+
+        The shared project dicts are not modified; each result is a shallow
+        copy carrying its ``relevance_score``.
+        """
         if not projects:
             return []
 
-        job_embedding = self.embeddings.embed_query(job_description)
-        project_embeddings = self.embeddings.embed_documents([json.dumps(p) for p in projects])
-        
-        similarities = cosine_similarity([job_embedding], project_embeddings)[0]
-        
-        for i, project in enumerate(projects):
-            project['relevance_score'] = similarities[i]
-            
-        ranked_projects = sorted(projects, key=lambda x: x.get('relevance_score', 0), reverse=True)
-        
-        relevance_threshold = settings.project_analysis.relevance_threshold
-        qualified_projects = [p for p in ranked_projects if p.get('relevance_score', 0) >= relevance_threshold]
-        
-        return qualified_projects
+        self.project_index.sync(projects)
+        job_embedding = self.cached_embeddings.embed_query(job_description)
+        with tracing.span("vector_search", "search", index="projects", k=top_k, candidates=len(projects)):
+            scored_ids = self.project_index.top_k(
+                job_embedding, k=top_k, min_score=settings.project_analysis.relevance_threshold
+            )
+
+        projects_by_id = {project_id(p): p for p in projects}
+        return [{**projects_by_id[pid], 'relevance_score': score} for pid, score in scored_ids]
 
     async def get_project_recommendations(self, job_description: str) -> dict:
         projects = self.project_store.get_all_projects()
-        ranked_projects = await self.rank_projects(job_description, projects)
-        top_projects = ranked_projects[:settings.project_analysis.max_recommendations]
+        top_projects = await self.rank_projects(
+            job_description, projects, top_k=settings.project_analysis.max_recommendations
+        )
 
         # Make sure job_analysis is awaited if it's async
         try:
@@ -91,8 +94,7 @@ class RelevanceRanker:
             if not projects:
                 return []
             
-            ranked_projects = await self.rank_projects(job_description, projects)
-            return ranked_projects[:top_k]
+            return await self.rank_projects(job_description, projects, top_k=top_k)
             
         except Exception as e:
             print(f"Error ranking projects: {e}")
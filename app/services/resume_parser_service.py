@@ -1,10 +1,12 @@
-from typing import Dict, List, Any, Optional
-from docx import Document
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
 import re
 from datetime import datetime
 import os
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from docx.document import Document as DocxDocument
+
 class ResumeParserService:
     def __init__(self):
         self.section_patterns = {
@@ -22,6 +24,9 @@ class ResumeParserService:
             if not os.path.exists(file_path):
                 raise ValueError(f"File not found: {file_path}")
                 
+            # python-docx is slow to import; only load it when a resume is parsed
+            from docx import Document
+
             doc = Document(file_path)
             if not doc.paragraphs:
                 raise ValueError("Document appears to be empty")
@@ -83,7 +88,7 @@ class ResumeParserService:
         except Exception as e:
             raise ValueError(f"Error parsing resume: {str(e)}")
     
-    def _extract_header_info(self, doc: Document, resume_data: Dict[str, Any]) -> None:
+    def _extract_header_info(self, doc: "DocxDocument", resume_data: Dict[str, Any]) -> None:
         """Extract name and contact information from the header."""
         # Get name from first non-empty paragraph
         for paragraph in doc.paragraphs[:5]:  # Check first 5 paragraphs
@@ -1,73 +1,120 @@
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
+from app.core.keyword_matcher import get_tech_keyword_matcher
+from app.core.cache import AsyncTTLCache, LRUCache
+from app.core.job_cache import normalize_job_description
+from app.core.metrics import register_cache
+from app.core.nltk_resources import get_stopwords, get_word_tokenizer
 from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import hashlib
 import re
 import json
 from collections import Counter
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import string
+import time
+
+# Common technical terms and frameworks. Acronyms (API, ML, AI) are a subset
+# of the capitalized-term matches, so they need no pattern of their own.
+TECHNICAL_PATTERNS = [
+    re.compile(r'\b[A-Z][a-zA-Z]*\b'),       # Capitalized terms (like PyTorch, TensorFlow, API)
+    re.compile(r'\b[a-z]+\.(?:js|py)\b'),    # JavaScript frameworks and Python files
+    re.compile(r'\b[A-Za-z]+\d+\b'),         # Terms with numbers (like CUDA12, Python3)
+]
+
+def feedback_cache_key(job_description: str, resume_data: Dict[str, Any]) -> str:
+    """
+    Build the key of a cached LLM feedback artifact.
+
+    Args:
+        job_description: Job description text (whitespace is normalized)
+        resume_data: Resume sections
+
+    Returns:
+        "<job description hash>-<resume hash>"
+    """
+    job_hash = hashlib.sha256(normalize_job_description(job_description).encode("utf-8")).hexdigest()
+    resume_hash = hashlib.sha256(json.dumps(resume_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{job_hash[:32]}-{resume_hash[:32]}"
 
 class ResumeScorerService:
     def __init__(self):
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment variables")
             
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=0.3,  # Lower temperature for more consistent scoring
-            api_key=settings.OPENAI_API_KEY
-        )
-        
-        # Download required NLTK data
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
+        self.llm = get_llm_gateway().chat_model(temperature=0.3)  # Lower temperature for more consistent scoring
         
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
+        # Compiled once per process from the configured tech vocabulary
+        self.keyword_matcher = get_tech_keyword_matcher()
         
-        self.stop_words = set(stopwords.words('english'))
+        config = settings.scoring
+        # Tier 0 re-scores the same job descriptions against many resume drafts
+        self.job_keyword_cache = LRUCache(config.job_keyword_cache_size)
+        # Tier 1 LLM feedback, keyed by feedback_cache_key()
+        self.feedback_cache = AsyncTTLCache(
+            max_size=config.feedback_cache_max_entries,
+            ttl_seconds=config.feedback_cache_ttl_seconds,
+            copy_on_read=True
+        )
+        # Errors of failed tier 1 calls, reported until they expire
+        self.feedback_failures = AsyncTTLCache(
+            max_size=config.feedback_cache_max_entries,
+            ttl_seconds=config.feedback_failure_ttl_seconds
+        )
+        register_cache("scoring_job_keywords", self.job_keyword_cache)
+        register_cache("score_feedback", self.feedback_cache)
+        self._feedback_tasks: Dict[str, asyncio.Task] = {}
+    
+    @property
+    def stop_words(self):
+        # Vendored stopwords, read on the first scoring call rather than at startup
+        return get_stopwords()
         
-    async def score_resume(self, job_description: str, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def score_resume(self, job_description: str, resume_data: Dict[str, Any], tier: int = 1,
+                           prefetch_feedback: Optional[bool] = None) -> Dict[str, Any]:
         """
         Score a resume against a job description using both keyword matching and LLM analysis.
         
+        Tier 0 is local keyword/ATS scoring only. Tier 1 adds LLM feedback,
+        which is cached per (job description, resume) and can also be fetched
+        on its own with get_cached_feedback(feedback_key).
+        
         Args:
             job_description: Job description text
             resume_data: Dictionary containing resume sections
+            tier: 0 for keyword scoring only, 1 to include LLM feedback
+            prefetch_feedback: With tier 0, start the LLM feedback in the
+                background (defaults to scoring.prefetch_feedback, off by default)
             
         Returns:
-            Dictionary with scoring results and feedback
+            Dictionary with scoring results, feedback and per-tier latency
         """
         try:
-            # Extract keywords from job description
-            job_keywords = self._extract_keywords(job_description)
-            
-            # Extract keywords from resume
-            resume_keywords = self._extract_resume_keywords(resume_data)
+            result = self.score_keywords(job_description, resume_data)
+            feedback_key = result["feedback_key"]
             
-            # Calculate keyword matching score
-            keyword_score, matched_keywords, missing_keywords = self._calculate_keyword_match(
-                job_keywords, resume_keywords
-            )
+            if tier == 0:
+                if prefetch_feedback is None:
+                    prefetch_feedback = settings.scoring.prefetch_feedback
+                if prefetch_feedback:
+                    self.prefetch_feedback(job_description, resume_data)
+                result["feedback_status"] = self.feedback_status(feedback_key)
+                return result
             
             # Generate LLM-powered feedback
-            llm_feedback = await self._generate_llm_feedback(job_description, resume_data)
+            started = time.perf_counter()
+            feedback_cached = self.feedback_status(feedback_key) == "ready"
+            llm_feedback = await self.get_llm_feedback(job_description, resume_data)
+            result["latency_ms"]["tier1"] = round((time.perf_counter() - started) * 1000, 2)
             
+            keyword_score = result["keyword_score"]
             # Calculate overall score (70% keywords + 30% LLM assessment)
             overall_score = int(keyword_score * 0.7 + llm_feedback.get('llm_score', 0) * 0.3)
             
-            return {
+            result.update({
+                "tier": 1,
                 "match_score": overall_score,
-                "keyword_score": keyword_score,
-                "keywords_matched": matched_keywords,
-                "keywords_missing": missing_keywords,
                 "section_feedback": llm_feedback.get('section_feedback', {}),
                 "overall_feedback": llm_feedback.get('overall_feedback', ''),
                 "ats_optimization_tips": llm_feedback.get('ats_tips', []),
@@ -75,12 +122,117 @@ class ResumeScorerService:
                     "keyword_matching": keyword_score,
                     "llm_assessment": llm_feedback.get('llm_score', 0),
                     "overall_score": overall_score
-                }
-            }
+                },
+                "feedback_cached": feedback_cached
+            })
+            return result
             
         except Exception as e:
             raise ValueError(f"Error scoring resume: {str(e)}")
     
+    def score_keywords(self, job_description: str, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tier 0: local keyword/ATS scoring without any LLM call.
+        
+        Args:
+            job_description: Job description text
+            resume_data: Dictionary containing resume sections
+            
+        Returns:
+            Dictionary with the keyword score, matched/missing keywords and the feedback key
+        """
+        started = time.perf_counter()
+        job_key = normalize_job_description(job_description)
+        job_keywords = self.job_keyword_cache.get(job_key)
+        if job_keywords is None:
+            job_keywords = self._extract_keywords(job_description)
+            self.job_keyword_cache.put(job_key, job_keywords)
+        resume_keywords = self._extract_resume_keywords(resume_data)
+        keyword_score, matched_keywords, missing_keywords = self._calculate_keyword_match(
+            job_keywords, resume_keywords
+        )
+        return {
+            "tier": 0,
+            "keyword_score": keyword_score,
+            "keywords_matched": matched_keywords,
+            "keywords_missing": missing_keywords,
+            "feedback_key": feedback_cache_key(job_description, resume_data),
+            "latency_ms": {"tier0": round((time.perf_counter() - started) * 1000, 2)}
+        }
+    
+    async def get_llm_feedback(self, job_description: str, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tier 1: LLM feedback for a resume, computed once per (job description, resume).
+        
+        Fallback feedback returned after a failed or unparsable LLM call is not
+        cached; the error is recorded and reported by feedback_status() as "failed".
+        
+        Args:
+            job_description: Job description
+            resume_data: Resume data
+            
+        Returns:
+            Dictionary with LLM feedback
+        """
+        key = feedback_cache_key(job_description, resume_data)
+        try:
+            return await self.feedback_cache.get_or_compute(
+                key, lambda: self._generate_llm_feedback(job_description, resume_data)
+            )
+        except json.JSONDecodeError as e:
+            self.feedback_failures.put(key, f"Unparsable LLM feedback: {str(e)}")
+            # Fallback if JSON parsing fails
+            return {
+                "llm_score": 75,
+                "overall_feedback": "Resume shows good alignment with job requirements",
+                "section_feedback": {
+                    "summary": "Consider adding more specific technical achievements",
+                    "skills": "Skills section looks comprehensive",
+                    "projects": "Projects demonstrate relevant experience"
+                },
+                "ats_tips": [
+                    "Use standard section headings",
+                    "Include relevant keywords naturally",
+                    "Quantify achievements where possible"
+                ]
+            }
+        except Exception as e:
+            self.feedback_failures.put(key, str(e))
+            # Fallback response
+            return {
+                "llm_score": 70,
+                "overall_feedback": f"Unable to generate detailed feedback: {str(e)}",
+                "section_feedback": {},
+                "ats_tips": ["Ensure all sections are properly formatted"]
+            }
+    
+    def prefetch_feedback(self, job_description: str, resume_data: Dict[str, Any]) -> str:
+        """Start computing tier 1 feedback in the background unless it is cached or pending; return its key."""
+        key = feedback_cache_key(job_description, resume_data)
+        if self.feedback_status(key) in ("missing", "failed"):
+            task = asyncio.create_task(self.get_llm_feedback(job_description, resume_data))
+            self._feedback_tasks[key] = task
+            task.add_done_callback(lambda _: self._feedback_tasks.pop(key, None))
+        return key
+    
+    def feedback_status(self, feedback_key: str) -> str:
+        """Return "ready", "pending", "failed" or "missing" for a feedback key."""
+        if self.feedback_cache.get(feedback_key) is not None:
+            return "ready"
+        if feedback_key in self._feedback_tasks:
+            return "pending"
+        if self.feedback_failures.get(feedback_key) is not None:
+            return "failed"
+        return "missing"
+    
+    def get_feedback_error(self, feedback_key: str) -> Optional[str]:
+        """Return the error of a recently failed tier 1 call for a key, if any."""
+        return self.feedback_failures.get(feedback_key)
+    
+    def get_cached_feedback(self, feedback_key: str) -> Optional[Dict[str, Any]]:
+        """Return cached tier 1 feedback for a key without calling the LLM."""
+        return self.feedback_cache.get(feedback_key)
+    
     def _extract_keywords(self, text: str) -> List[str]:
         """
         Extract relevant keywords from text using NLP techniques.
@@ -93,7 +245,7 @@ class ResumeScorerService:
         """
         try:
             # Convert to lowercase and tokenize
-            tokens = word_tokenize(text.lower())
+            tokens = get_word_tokenizer()(text.lower())
             
             # Remove punctuation and stop words
             keywords = []
@@ -130,37 +282,12 @@ class ResumeScorerService:
         Returns:
             List of technical terms
         """
-        # Common technical terms and frameworks
-        technical_patterns = [
-            r'\b[A-Z][a-zA-Z]*\b',  # Capitalized terms (like PyTorch, TensorFlow)
-            r'\b[A-Z]{2,}\b',       # Acronyms (like API, ML, AI)
-            r'\b[a-z]+\.js\b',      # JavaScript frameworks
-            r'\b[a-z]+\.py\b',      # Python files
-            r'\b[A-Za-z]+\d+\b',    # Terms with numbers (like CUDA12, Python3)
-        ]
-        
         technical_terms = []
-        for pattern in technical_patterns:
-            matches = re.findall(pattern, text)
-            technical_terms.extend(matches)
-        
-        # Common tech stack keywords
-        tech_keywords = [
-            'python', 'java', 'javascript', 'c++', 'cuda', 'pytorch', 'tensorflow',
-            'onnx', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'fastapi',
-            'django', 'react', 'vue', 'angular', 'nodejs', 'mongodb', 'postgresql',
-            'mysql', 'redis', 'kafka', 'spark', 'hadoop', 'scala', 'go', 'rust',
-            'machine learning', 'deep learning', 'ai', 'ml', 'nlp', 'computer vision',
-            'data science', 'big data', 'cloud computing', 'devops', 'ci/cd',
-            'microservices', 'api', 'rest', 'graphql', 'sql', 'nosql', 'git',
-            'linux', 'unix', 'windows', 'macos', 'docker', 'kubernetes', 'jenkins',
-            'github', 'gitlab', 'bitbucket', 'jira', 'confluence', 'agile', 'scrum'
-        ]
-        
-        text_lower = text.lower()
-        for keyword in tech_keywords:
-            if keyword in text_lower:
-                technical_terms.append(keyword)
+        for pattern in TECHNICAL_PATTERNS:
+            technical_terms.extend(pattern.findall(text))
+        
+        # Tech stack keywords and skills, matched as whole words in one pass
+        technical_terms.extend(self.keyword_matcher.find_all(text))
         
         return list(set(technical_terms))
     
@@ -214,6 +341,75 @@ class ResumeScorerService:
         
         return list(set(keywords))
     
+    def score_keywords_bulk(self, job_descriptions: List[str], resumes: List[Dict[str, Any]],
+                            pairs: List[Tuple[int, int]] = None, include_matrix: bool = True) -> Dict[str, Any]:
+        """
+        Keyword-score every resume against every job description in one pass.
+        
+        Keywords are extracted once per distinct document (the same extraction
+        score_resume uses), then all pairs are scored with a sparse matrix product.
+        
+        Args:
+            job_descriptions: Job description texts
+            resumes: Resume section dictionaries
+            pairs: (job index, resume index) pairs to return matched/missing keywords for
+            include_matrix: Whether to return the full jobs x resumes score matrix
+            
+        Returns:
+            Dictionary with the score matrix, per-pair keyword lists and timings
+        """
+        # scipy is only needed for bulk scoring
+        from app.core.keyword_matrix import KeywordCoverageMatrix
+
+        pairs = pairs or []
+        for job_index, resume_index in pairs:
+            if not (0 <= job_index < len(job_descriptions) and 0 <= resume_index < len(resumes)):
+                raise ValueError(f"Pair ({job_index}, {resume_index}) is out of range")
+        
+        started = time.perf_counter()
+        job_keywords_by_text: Dict[str, List[str]] = {}
+        job_keywords = []
+        for text in job_descriptions:
+            if text not in job_keywords_by_text:
+                job_keywords_by_text[text] = self._extract_keywords(text)
+            job_keywords.append(job_keywords_by_text[text])
+        resume_keywords_by_key: Dict[str, List[str]] = {}
+        resume_keywords = []
+        for resume in resumes:
+            key = json.dumps(resume, sort_keys=True, default=str)
+            if key not in resume_keywords_by_key:
+                resume_keywords_by_key[key] = self._extract_resume_keywords(resume)
+            resume_keywords.append(resume_keywords_by_key[key])
+        extracted = time.perf_counter()
+        
+        matrix = KeywordCoverageMatrix(job_keywords, resume_keywords)
+        scores = matrix.scores()
+        pair_results = []
+        for job_index, resume_index in pairs:
+            matched, missing = matrix.pair_keywords(job_index, resume_index)
+            pair_results.append({
+                "job_index": job_index,
+                "resume_index": resume_index,
+                "keyword_score": int(scores[job_index, resume_index]),
+                "keywords_matched": matched,
+                "keywords_missing": missing
+            })
+        scored = time.perf_counter()
+        
+        result = {
+            "num_jobs": len(job_descriptions),
+            "num_resumes": len(resumes),
+            "num_terms": len(matrix.terms),
+            "pairs": pair_results,
+            "timings_ms": {
+                "keyword_extraction": round((extracted - started) * 1000, 1),
+                "matrix_scoring": round((scored - extracted) * 1000, 1)
+            }
+        }
+        if include_matrix:
+            result["scores"] = scores.tolist()
+        return result
+    
     def _calculate_keyword_match(self, job_keywords: List[str], resume_keywords: List[str]) -> Tuple[int, List[str], List[str]]:
         """
         Calculate keyword matching score between job and resume.
@@ -251,28 +447,31 @@ class ResumeScorerService:
             
         Returns:
             Dictionary with LLM feedback
-        """
-        try:
-            # Prepare resume sections for the prompt
-            summary = resume_data.get('summary', '')
-            skills = resume_data.get('skills', [])
-            if isinstance(skills, list):
-                skills_text = ', '.join(skills)
-            else:
-                skills_text = str(skills)
             
-            projects = resume_data.get('projects', [])
-            projects_text = ""
-            for i, project in enumerate(projects[:3]):  # Top 3 projects
-                if isinstance(project, dict):
-                    title = project.get('title', 'Unknown Project')
-                    desc = project.get('description', '')
-                    projects_text += f"- {title}: {desc}\n"
-            
-            # Create the prompt
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are a resume optimization engine. Analyze the candidate's resume against the job description and provide detailed feedback for improvement."""),
-                ("user", f"""JOB DESCRIPTION:
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+        """
+        # Prepare resume sections for the prompt
+        summary = resume_data.get('summary', '')
+        skills = resume_data.get('skills', [])
+        if isinstance(skills, list):
+            skills_text = ', '.join(skills)
+        else:
+            skills_text = str(skills)
+        
+        projects = resume_data.get('projects', [])
+        projects_text = ""
+        for i, project in enumerate(projects[:3]):  # Top 3 projects
+            if isinstance(project, dict):
+                title = project.get('title', 'Unknown Project')
+                desc = project.get('description', '')
+                projects_text += f"- {title}: {desc}\n"
+        
+        # Create the prompt. Inputs are template variables so braces in the
+        # job description or resume are not parsed as placeholders.
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are a resume optimization engine. Analyze the candidate's resume against the job description and provide detailed feedback for improvement."""),
+            ("user", """JOB DESCRIPTION:
 {job_description}
 
 RESUME SECTIONS:
@@ -301,41 +500,19 @@ Respond in the following JSON format:
         "Tip 2 for ATS optimization"
     ]
 }}""")
-            ])
-            
-            # Generate feedback
-            chain = prompt | self.llm
-            response = await chain.ainvoke({})
-            
-            # Parse JSON response
-            try:
-                feedback_data = json.loads(response.content)
-                return feedback_data
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails
-                return {
-                    "llm_score": 75,
-                    "overall_feedback": "Resume shows good alignment with job requirements",
-                    "section_feedback": {
-                        "summary": "Consider adding more specific technical achievements",
-                        "skills": "Skills section looks comprehensive",
-                        "projects": "Projects demonstrate relevant experience"
-                    },
-                    "ats_tips": [
-                        "Use standard section headings",
-                        "Include relevant keywords naturally",
-                        "Quantify achievements where possible"
-                    ]
-                }
-                
-        except Exception as e:
-            # Fallback response
-            return {
-                "llm_score": 70,
-                "overall_feedback": f"Unable to generate detailed feedback: {str(e)}",
-                "section_feedback": {},
-                "ats_tips": ["Ensure all sections are properly formatted"]
-            }
+        ])
+        
+        # Generate feedback
+        chain = prompt | self.llm
+        response = await chain.ainvoke({
+            "job_description": job_description,
+            "summary": summary,
+            "skills_text": skills_text,
+            "projects_text": projects_text
+        })
+        
+        # Parse JSON response; failures propagate to get_llm_feedback's fallbacks
+        return json.loads(response.content)
     
     def get_ats_optimization_tips(self) -> List[str]:
         """
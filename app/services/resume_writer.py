@@ -1,10 +1,15 @@
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
+from app.core import tracing
 from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
+from app.core.llm_cache import get_llm_response_cache
 from app.services.relevance_ranker import RelevanceRanker
 from app.core.job_parser import JobParserService
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable, Awaitable, AsyncIterator, Union
+from contextvars import ContextVar
+import asyncio
 import json
+import time
 from app.core.prompts import (
     SUMMARY_PROMPT,
     EXPERIENCE_PROMPT,
@@ -16,22 +21,37 @@ from app.core.prompts import (
 )
 from langchain.prompts import PromptTemplate
 from app.services.project_store import ProjectStoreService
-from langchain.chains import LLMChain
+
+# Set while a section is generated for a token-streaming client; receives
+# each content delta produced by the section's LLM call.
+_token_sink: ContextVar[Optional[Callable[[str], None]]] = ContextVar("resume_token_sink", default=None)
 
 class ResumeWriterService:
-    def __init__(self, project_store: ProjectStoreService):
+    def __init__(self, project_store: ProjectStoreService,
+                 relevance_ranker: Union[RelevanceRanker, Callable[[], RelevanceRanker]] = None):
+        """
+        Args:
+            project_store: Project store the sections select projects from
+            relevance_ranker: Ranker, or a getter called when the ranker is
+                first needed (defaults to a ranker over project_store)
+        """
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment variables")
             
-        self.llm = ChatOpenAI(
-            model=settings.openai.model,
-            temperature=settings.openai.temperature,
-            api_key=settings.OPENAI_API_KEY
-        )
-        self.relevance_ranker = RelevanceRanker()
+        self.llm = get_llm_gateway().chat_model()
+        self._relevance_ranker = relevance_ranker
         self.job_parser = JobParserService()
         self.project_store = project_store
 
+    @property
+    def relevance_ranker(self) -> RelevanceRanker:
+        # Only the cover letter introduction ranks projects; build the ranker on first use
+        if self._relevance_ranker is None:
+            self._relevance_ranker = RelevanceRanker(project_store=self.project_store)
+        elif callable(self._relevance_ranker):
+            return self._relevance_ranker()
+        return self._relevance_ranker
+
     def select_relevant_projects(self, projects: List[Dict[str, Any]], job_tags: List[str], 
                                target_section: str, used_project_slugs: Set[str], 
                                max_count: int = 5) -> List[Dict[str, Any]]:
@@ -118,86 +138,341 @@ class ResumeWriterService:
             Dictionary containing generated resume sections
         """
         print("[DEBUG] Starting resume generation (deduplication)...")
+        started = time.perf_counter()
         try:
-            # Parse job description once and cache the result
-            job_data = await self.job_parser.parse_job_description(job_description)
-            print("[DEBUG] job_data returned:", job_data)
-            if job_data is None:
-                print("[ERROR] job_data is None! Check job description parsing.")
-                job_data = {}
-            job_tags = []
-            
-            # Extract tags from required and preferred skills
-            for skill in job_data.get("required_skills", []):
-                job_tags.extend(self._extract_tags_from_skill(skill))
-            for skill in job_data.get("preferred_skills", []):
-                job_tags.extend(self._extract_tags_from_skill(skill))
-            
-            # Add industry-specific tags
-            industry_focus = (job_data.get("industry_focus") or "").lower()
-            if "ml" in industry_focus or "machine learning" in industry_focus:
-                job_tags.extend(["ml", "ai", "deep-learning"])
-            if "edge" in industry_focus or "embedded" in industry_focus:
-                job_tags.extend(["edge-ai", "embedded", "iot"])
-            if "computer vision" in industry_focus:
-                job_tags.extend(["computer-vision", "image-processing"])
-            if "nlp" in industry_focus or "natural language" in industry_focus:
-                job_tags.extend(["nlp", "text-processing"])
-            
-            # Remove duplicates and normalize
-            job_tags = list(set([tag.lower() for tag in job_tags]))
+            job_data, section_plan, used_project_slugs = await self._plan_deduplicated_resume(
+                job_description, include_sections, max_projects_per_section
+            )
             
-            # Get all projects
-            all_projects = self.project_store.get_all_projects()
+            # Phase 2: run all section LLM calls concurrently under the configured cap
+            resume_sections, section_timings = await self._run_sections_concurrently(section_plan)
             
-            # Track used project slugs to avoid duplication
-            used_project_slugs = set()
+            print("[DEBUG] Resume generation succeeded!")
+            return {
+                "sections": resume_sections,
+                "job_analysis": job_data,
+                "selected_projects_count": len(used_project_slugs),
+                "deduplication_applied": True,
+                "section_timings_ms": section_timings,
+                "generation_time_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
             
-            # Generate sections with deduplication - use cached job_data
-            resume_sections = {}
+        except Exception as e:
+            import traceback
+            print("[ERROR] Resume generation failed:", str(e))
+            print(traceback.format_exc())
+            raise
+
+    async def stream_tailored_resume_with_deduplication(self, job_description: str,
+                                                        include_sections: List[str],
+                                                        candidate_skills: List[str] = None,
+                                                        max_projects_per_section: int = 4,
+                                                        stream_tokens: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of generate_tailored_resume_with_deduplication.
+        
+        Yields events as plain dictionaries with an "event" key:
+        
+        - "token": a content delta of a section still being generated (only
+          when stream_tokens is set; the final section content may differ,
+          e.g. when a fixed header or fallback is applied)
+        - "section": a completed section with its content and timing
+        - "error": a section that failed; the other sections continue
+        - "done": job_analysis, selected_projects_count, timings and
+          time_to_first_section_ms
+        
+        Args:
+            job_description: Job description text
+            include_sections: List of sections to include
+            candidate_skills: Optional list of candidate skills
+            max_projects_per_section: Maximum projects per section
+            stream_tokens: Whether to emit token deltas while sections generate
             
+        Yields:
+            Event dictionaries in completion order
+        """
+        started = time.perf_counter()
+        job_data, section_plan, used_project_slugs = await self._plan_deduplicated_resume(
+            job_description, include_sections, max_projects_per_section
+        )
+        
+        events: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(settings.resume.section_concurrency)
+        section_timings = {}
+        
+        async def run_section(section: str, generator, args: tuple):
+            with tracing.span(f"section.{section}", "section"):
+                wait_start = time.perf_counter()
+                async with semaphore:
+                    tracing.record_queue_wait(time.perf_counter() - wait_start)
+                    if stream_tokens:
+                        _token_sink.set(lambda delta: events.put_nowait({"event": "token", "section": section, "delta": delta}))
+                    section_start = time.perf_counter()
+                    try:
+                        content = await generator(*args)
+                    except Exception as e:
+                        tracing.annotate(error=str(e))
+                        events.put_nowait({"event": "error", "section": section, "detail": str(e)})
+                        return
+                    section_timings[section] = round((time.perf_counter() - section_start) * 1000, 1)
+                    events.put_nowait({
+                        "event": "section",
+                        "section": section,
+                        "content": content,
+                        "duration_ms": section_timings[section],
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+                    })
+        
+        tasks = [asyncio.create_task(run_section(section, generator, args)) for section, generator, args in section_plan]
+        time_to_first_section_ms = None
+        failed_sections = []
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await events.get()
+                if event["event"] == "section":
+                    remaining -= 1
+                    if time_to_first_section_ms is None:
+                        time_to_first_section_ms = event["elapsed_ms"]
+                elif event["event"] == "error":
+                    remaining -= 1
+                    failed_sections.append(event["section"])
+                yield event
+        finally:
+            # The client may disconnect mid-stream; don't leave LLM calls running
+            for task in tasks:
+                task.cancel()
+        
+        yield {
+            "event": "done",
+            "job_analysis": job_data,
+            "selected_projects_count": len(used_project_slugs),
+            "deduplication_applied": True,
+            "failed_sections": failed_sections,
+            "section_timings_ms": section_timings,
+            "time_to_first_section_ms": time_to_first_section_ms,
+            "generation_time_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    async def iter_resumes_batch(self, job_descriptions: List[str], include_sections: List[str],
+                                 max_projects_per_section: int = 4,
+                                 max_concurrency: int = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate deduplicated resumes for many job descriptions at once.
+        
+        Projects and master skills are loaded once for the whole batch, all job
+        descriptions are parsed concurrently, and every section LLM call of
+        every job shares one bounded pool of slots. A failing job is reported
+        without affecting the others.
+        
+        Args:
+            job_descriptions: Job description texts
+            include_sections: List of sections to include in every resume
+            max_projects_per_section: Maximum projects per section
+            max_concurrency: Section calls in flight across the batch
+                (defaults to settings.resume.batch_concurrency)
+            
+        Yields:
+            Per-job results in completion order, each with "index" and "status"
+            ("success" with the resume fields, or "error" with "error")
+        """
+        all_projects = self.project_store.get_all_projects()
+        master_skills_text = self.project_store.get_master_skills_as_text()
+        semaphore = asyncio.Semaphore(max_concurrency or settings.resume.batch_concurrency)
+        
+        async def generate(index: int, job_description: str) -> Dict[str, Any]:
+            started = time.perf_counter()
+            try:
+                job_data, section_plan, used_project_slugs = await self._plan_deduplicated_resume(
+                    job_description, include_sections, max_projects_per_section,
+                    all_projects=all_projects, master_skills_text=master_skills_text
+                )
+                resume_sections, section_timings = await self._run_sections_concurrently(section_plan, semaphore=semaphore)
+            except Exception as e:
+                print(f"[ERROR] Batch resume {index} failed: {str(e)}")
+                return {"index": index, "status": "error", "error": str(e)}
+            return {
+                "index": index,
+                "status": "success",
+                "sections": resume_sections,
+                "job_analysis": job_data,
+                "selected_projects_count": len(used_project_slugs),
+                "deduplication_applied": True,
+                "section_timings_ms": section_timings,
+                "generation_time_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+        
+        tasks = [asyncio.create_task(generate(index, jd)) for index, jd in enumerate(job_descriptions)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def generate_resumes_batch(self, job_descriptions: List[str], include_sections: List[str],
+                                     max_projects_per_section: int = 4,
+                                     max_concurrency: int = None) -> Dict[str, Any]:
+        """
+        Generate deduplicated resumes for many job descriptions (see iter_resumes_batch).
+        
+        Returns:
+            Dictionary with per-job results in input order and success/failure counts
+        """
+        started = time.perf_counter()
+        results = [result async for result in self.iter_resumes_batch(
+            job_descriptions, include_sections, max_projects_per_section, max_concurrency
+        )]
+        results.sort(key=lambda result: result["index"])
+        failed = sum(1 for result in results if result["status"] == "error")
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "generation_time_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    async def _plan_deduplicated_resume(self, job_description: str, include_sections: List[str],
+                                        max_projects_per_section: int = 4,
+                                        all_projects: List[Dict[str, Any]] = None,
+                                        master_skills_text: str = None) -> Tuple[Dict[str, Any], list, Set[str]]:
+        """
+        Parse the job description and assign projects to each requested section.
+        
+        Selection is cheap and deterministic, and runs in section order so that
+        used_project_slugs deduplicates projects across sections.
+        
+        Args:
+            job_description: Job description text
+            include_sections: List of sections to include
+            max_projects_per_section: Maximum projects per section
+            all_projects: Projects to select from (loaded from the store when None)
+            master_skills_text: Master skills text (read by the skills section when None)
+        
+        Returns:
+            Tuple of (job data, section plan of (section, generator, args), used project slugs)
+        """
+        # Parse job description once and cache the result
+        with tracing.span("job_parsing", "parse"):
+            job_data = await self.job_parser.parse_job_description(job_description)
+        print("[DEBUG] job_data returned:", job_data)
+        if job_data is None:
+            print("[ERROR] job_data is None! Check job description parsing.")
+            job_data = {}
+        job_tags = []
+        
+        # Extract tags from required and preferred skills
+        for skill in job_data.get("required_skills", []):
+            job_tags.extend(self._extract_tags_from_skill(skill))
+        for skill in job_data.get("preferred_skills", []):
+            job_tags.extend(self._extract_tags_from_skill(skill))
+        
+        # Add industry-specific tags
+        industry_focus = (job_data.get("industry_focus") or "").lower()
+        if "ml" in industry_focus or "machine learning" in industry_focus:
+            job_tags.extend(["ml", "ai", "deep-learning"])
+        if "edge" in industry_focus or "embedded" in industry_focus:
+            job_tags.extend(["edge-ai", "embedded", "iot"])
+        if "computer vision" in industry_focus:
+            job_tags.extend(["computer-vision", "image-processing"])
+        if "nlp" in industry_focus or "natural language" in industry_focus:
+            job_tags.extend(["nlp", "text-processing"])
+        
+        # Remove duplicates and normalize
+        job_tags = list(set([tag.lower() for tag in job_tags]))
+        
+        with tracing.span("project_selection", "select", sections=len(include_sections)):
+            # Get all projects
+            if all_projects is None:
+                all_projects = self.project_store.get_all_projects()
+        
+            # Track used project slugs to avoid duplication
+            used_project_slugs = set()
+        
+            section_plan = []
             for section in include_sections:
                 if section == "summary":
                     # Summary doesn't need specific projects
-                    resume_sections["summary"] = await self._generate_summary_section_optimized(all_projects, job_description, job_data)
+                    section_plan.append((section, self._generate_summary_section_optimized, (all_projects, job_description, job_data)))
                 elif section == "research":
                     # Select research projects
                     research_projects = self.select_relevant_projects(
                         all_projects, job_tags, "research", used_project_slugs, max_count=max_projects_per_section
                     )
-                    resume_sections["research"] = await self._generate_research_section_optimized(job_description, research_projects, job_data)
+                    section_plan.append((section, self._generate_research_section_optimized, (job_description, research_projects, job_data)))
                 elif section == "projects":
                     # Select project section projects (allow some overlap with research for comprehensive coverage)
                     project_projects = self.select_relevant_projects(
                         all_projects, job_tags, "project", set(), max_count=max_projects_per_section * 2  # Allow more projects
                     )
-                    resume_sections["projects"] = await self._generate_projects_section_optimized(job_description, project_projects, job_data)
+                    section_plan.append((section, self._generate_projects_section_optimized, (job_description, project_projects, job_data)))
                 elif section == "experience":
                     # Experience can use any projects not yet used
                     experience_projects = self.select_relevant_projects(
                         all_projects, job_tags, "project", used_project_slugs, max_count=max_projects_per_section
                     )
-                    resume_sections["experience"] = await self._generate_experience_section_optimized(job_description, experience_projects, job_data)
+                    section_plan.append((section, self._generate_experience_section_optimized, (job_description, experience_projects, job_data)))
                 elif section == "skills":
                     # Skills section doesn't need specific projects
                     print(f"[DEBUG] Generating skills section with {len(all_projects)} projects")
-                    skills_section = await self._generate_skills_section_optimized(all_projects, job_description, job_data)
-                    print(f"[DEBUG] Skills section generated: {skills_section[:200]}...")  # Show first 200 chars
-                    resume_sections["skills"] = skills_section
-            
-            print("[DEBUG] Resume generation succeeded!")
-            return {
-                "sections": resume_sections,
-                "job_analysis": job_data,
-                "selected_projects_count": len(used_project_slugs),
-                "deduplication_applied": True
-            }
+                    section_plan.append((section, self._generate_skills_section_optimized, (all_projects, job_description, job_data, master_skills_text)))
+        
+        return job_data, section_plan, used_project_slugs
+
+    async def _invoke_chain(self, chain, inputs: Dict[str, Any]):
+        """
+        Invoke a prompt | llm chain, streaming token deltas when a client asked for them.
+        
+        Returns:
+            The model message (with .content), as chain.ainvoke would
+        """
+        sink = _token_sink.get()
+        if sink is None:
+            return await chain.ainvoke(inputs)
+        
+        message = None
+        async for chunk in chain.astream(inputs):
+            if chunk.content:
+                sink(chunk.content)
+            message = chunk if message is None else message + chunk
+        return message
+
+    async def _run_sections_concurrently(self, section_plan: List[Tuple[str, Callable[..., Awaitable[str]], tuple]],
+                                         max_concurrency: int = None,
+                                         semaphore: asyncio.Semaphore = None) -> Tuple[Dict[str, str], Dict[str, float]]:
+        """
+        Generate resume sections concurrently.
+        
+        Args:
+            section_plan: List of (section name, generator coroutine function, arguments)
+            max_concurrency: Maximum number of section calls in flight
+                (defaults to settings.resume.section_concurrency)
+            semaphore: Semaphore shared with other resumes (overrides max_concurrency)
             
-        except Exception as e:
-            import traceback
-            print("[ERROR] Resume generation failed:", str(e))
-            print(traceback.format_exc())
-            raise
+        Returns:
+            Tuple of (sections in plan order, per-section wall time in milliseconds)
+        """
+        semaphore = semaphore or asyncio.Semaphore(max_concurrency or settings.resume.section_concurrency)
+        section_timings = {}
+        
+        async def run_section(section: str, generator, args: tuple) -> str:
+            with tracing.span(f"section.{section}", "section"):
+                wait_start = time.perf_counter()
+                async with semaphore:
+                    section_start = time.perf_counter()
+                    tracing.record_queue_wait(section_start - wait_start)
+                    content = await generator(*args)
+                    section_timings[section] = round((time.perf_counter() - section_start) * 1000, 1)
+                    return content
+        
+        contents = await asyncio.gather(*(
+            run_section(section, generator, args) for section, generator, args in section_plan
+        ))
+        
+        resume_sections = {}
+        for (section, _, _), content in zip(section_plan, contents):
+            resume_sections[section] = content
+        return resume_sections, section_timings
 
     def _extract_tags_from_skill(self, skill: str) -> List[str]:
         """Extract relevant tags from a skill string."""
@@ -309,7 +584,7 @@ class ResumeWriterService:
             
             chain = prompt | self.llm
             
-            response = await chain.ainvoke({
+            response = await self._invoke_chain(chain, {
                 "job_title": job_data.get("job_title", ""),
                 "industry_focus": job_data.get("industry_focus", ""),
                 "required_skills": ", ".join(job_data.get("required_skills", [])),
@@ -386,7 +661,7 @@ class ResumeWriterService:
             
             chain = prompt | self.llm
             
-            response = await chain.ainvoke({
+            response = await self._invoke_chain(chain, {
                 "job_title": job_data.get("job_title", ""),
                 "required_skills": ", ".join(job_data.get("required_skills", [])),
                 "job_description": job_description,
@@ -447,7 +722,7 @@ class ResumeWriterService:
             
             chain = prompt | self.llm
             
-            response = await chain.ainvoke({
+            response = await self._invoke_chain(chain, {
                 "job_title": job_data.get("job_title", ""),
                 "industry_focus": job_data.get("industry_focus", ""),
                 "required_skills": ", ".join(job_data.get("required_skills", [])),
@@ -460,7 +735,8 @@ class ResumeWriterService:
             raise ValueError(f"Error generating projects section: {str(e)}")
 
     async def _generate_skills_section_optimized(self, projects: List[Dict[str, Any]], 
-                                     job_description: str, job_data: Dict[str, Any]) -> str:
+                                     job_description: str, job_data: Dict[str, Any],
+                                     master_skills_text: str = None) -> str:
         """Generate skills section based on project technologies and job requirements (optimized version)."""
         try:
             print(f"[DEBUG] _generate_skills_section_optimized called with {len(projects)} projects")
@@ -478,7 +754,8 @@ class ResumeWriterService:
             preferred_skills = job_data.get("preferred_skills", [])
             
             # Get master skills from project store for comprehensive coverage
-            master_skills_text = self.project_store.get_master_skills_as_text()
+            if master_skills_text is None:
+                master_skills_text = self.project_store.get_master_skills_as_text()
             
             # Create a comprehensive skills list from multiple sources
             all_skills = set()
@@ -544,7 +821,7 @@ class ResumeWriterService:
                 
                 chain = prompt | self.llm
                 
-                response = await chain.ainvoke({
+                response = await self._invoke_chain(chain, {
                     "job_title": job_data.get("job_title", ""),
                     "required_skills": ", ".join(required_skills),
                     "preferred_skills": ", ".join(preferred_skills),
@@ -673,7 +950,7 @@ class ResumeWriterService:
             
             chain = prompt | self.llm
             
-            response = await chain.ainvoke({
+            response = await self._invoke_chain(chain, {
                 "job_title": job_data.get("job_title", ""),
                 "industry_focus": job_data.get("industry_focus", ""),
                 "required_skills": ", ".join(job_data.get("required_skills", [])),
@@ -704,27 +981,27 @@ class ResumeWriterService:
             # Return a fallback summary
             return "PhD in Computer Science with expertise in neural network optimization, GenAI pipelines, and embedded ML deployment. Demonstrated success in developing scalable ML systems with 80% model compression and 3-5x inference speedup. Seeking roles focused on applied ML research and real-world deployment."
 
-    def generate_tailored_resume(self, job_description: str, include_sections: list[str]) -> dict:
+    async def generate_tailored_resume(self, job_description: str, include_sections: list[str]) -> dict:
         """
         Generates a complete tailored resume with specified sections.
+        
+        Section LLM calls are awaited concurrently (capped by
+        settings.resume.section_concurrency), so the event loop is never blocked.
         """
         projects_text = self.project_store.get_all_projects_as_text()
         master_skills_text = self.project_store.get_master_skills_as_text()
 
-        generated_sections = {}
-        for section in include_sections:
-            generated_sections[section] = self._generate_section_content(
-                section_type=section,
-                job_description=job_description,
-                projects=projects_text,
-                master_skills=master_skills_text
-            )
+        section_plan = [
+            (section, self._generate_section_content, (section, job_description, projects_text, master_skills_text))
+            for section in include_sections
+        ]
+        generated_sections, section_timings = await self._run_sections_concurrently(section_plan)
         
-        return {"sections": generated_sections}
+        return {"sections": generated_sections, "section_timings_ms": section_timings}
 
-    def _generate_section_content(self, section_type: str, job_description: str, projects: str, master_skills: str) -> str:
+    async def _generate_section_content(self, section_type: str, job_description: str, projects: str, master_skills: str) -> str:
         """
-        Uses the appropriate prompt and LLMChain to generate section content.
+        Uses the appropriate prompt to generate section content.
         """
         if section_type == "summary":
             return "PhD in Computer Science with expertise in neural network optimization, GenAI pipelines, and embedded ML deployment. Seeking Applied Scientist roles focused on scalable ML systems, search ranking models, reinforcement learning, and real-world deployment on large-scale infrastructure."
@@ -745,10 +1022,10 @@ class ResumeWriterService:
         if "master_skills" in prompt.input_variables:
             input_data["master_skills"] = master_skills
 
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        response = chain.invoke(input_data)
+        chain = prompt | self.llm
+        response = await chain.ainvoke(input_data)
         
-        return response.get("text", "").strip()
+        return response.content.strip()
 
     async def optimize_existing_section(self, current_section: str, section_name: str,
                                       job_description: str) -> str:
@@ -786,15 +1063,13 @@ class ResumeWriterService:
                 Optimize this section to better match the job requirements.""")
             ])
             
-            chain = prompt | self.llm
-            
-            response = await chain.ainvoke({
+            response = await get_llm_response_cache().ainvoke(prompt, self.llm, {
                 "job_title": job_data.get("job_title", ""),
                 "required_skills": ", ".join(job_data.get("required_skills", [])),
                 "job_description": job_description,
                 "section_name": section_name,
                 "current_section": current_section
-            })
+            }, endpoint="optimize_existing_section")
             
             return response.content
             
@@ -0,0 +1,5 @@
+"""
+Offline performance benchmarks for the Resume Editor Bot.
+
+Run a benchmark from the repository root, e.g. ``python -m bench.project_store``.
+"""
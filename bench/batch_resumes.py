@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark batched multi-job resume generation against sequential requests.
+
+Both modes use local fake LLMs with a configurable latency for job parsing
+and section generation. The sequential mode mirrors the previous workflow of
+one /generate-deduplicated-resume call per posting.
+
+Usage:
+    python -m bench.batch_resumes --jobs 50 --latency 0.2 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from app.core.config import settings
+from app.core.job_cache import job_analysis_cache
+from app.services.project_store import ProjectStoreService
+from app.services.resume_writer import ResumeWriterService
+from bench.fakes import SlowFakeChatModel
+
+SECTIONS = ["summary", "research", "projects", "skills"]
+JOB_JSON = json.dumps({"job_title": "ML Engineer", "required_skills": ["Python", "PyTorch"],
+                       "preferred_skills": ["ONNX"], "industry_focus": "machine learning"})
+
+
+def build_writer(latency: float) -> ResumeWriterService:
+    writer = ResumeWriterService(ProjectStoreService())
+    writer.llm = SlowFakeChatModel(latency=latency)
+    writer.job_parser.llm = SlowFakeChatModel(latency=latency, reply=JOB_JSON)
+    return writer
+
+
+async def run_sequential(writer: ResumeWriterService, jobs):
+    for job in jobs:
+        await writer.generate_tailored_resume_with_deduplication(job, SECTIONS)
+    return len(jobs), 0
+
+
+async def run_batch(writer: ResumeWriterService, jobs, concurrency: int):
+    batch = await writer.generate_resumes_batch(jobs, SECTIONS, max_concurrency=concurrency)
+    return batch["succeeded"], batch["failed"]
+
+
+def report(name: str, elapsed: float, succeeded: int, failed: int, llm_calls: int):
+    print(f"{name:28s} {elapsed:7.2f} s  {succeeded / elapsed * 60:8.1f} resumes/min  "
+          f"ok {succeeded}  failed {failed}  LLM calls {llm_calls}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50, help="Number of job descriptions")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake LLM latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=settings.resume.batch_concurrency,
+                        help="Section calls in flight across the batch")
+    parser.add_argument("--skip-sequential", action="store_true", help="Only run the batched mode")
+    args = parser.parse_args()
+
+    # Measure generation, not the response caches
+    settings.cache.llm_responses.enabled = False
+    jobs = [f"Machine learning engineer posting #{i}: PyTorch, ONNX, edge deployment" for i in range(args.jobs)]
+    print(f"{args.jobs} job descriptions x {len(SECTIONS)} sections, fake LLM latency {args.latency * 1000:.0f} ms")
+
+    if not args.skip_sequential:
+        job_analysis_cache.clear()
+        writer = build_writer(args.latency)
+        start = time.perf_counter()
+        succeeded, failed = asyncio.run(run_sequential(writer, jobs))
+        report("Sequential requests", time.perf_counter() - start, succeeded, failed,
+               writer.llm.calls + writer.job_parser.llm.calls)
+
+    job_analysis_cache.clear()
+    writer = build_writer(args.latency)
+    start = time.perf_counter()
+    succeeded, failed = asyncio.run(run_batch(writer, jobs, args.concurrency))
+    report(f"Batch (concurrency={args.concurrency})", time.perf_counter() - start, succeeded, failed,
+           writer.llm.calls + writer.job_parser.llm.calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Local stand-ins for OpenAI chat and embedding models.
+
+Shared by the offline tests and the benchmark suite (bench/suite.py), so
+neither needs network access or an API key. Install them for every service
+with get_llm_gateway().set_override(...), or assign them to a service's llm.
+
+FakeChatModel and FakeEmbeddings draw their latency from a seeded
+distribution, stream completions at a configurable token throughput, and
+answer deterministically: the same prompt always gets the same reply and
+the same text the same unit vector. Tokens are counted as whitespace-
+separated words and reported as usage metadata.
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import re
+import struct
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, PrivateAttr
+
+DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+
+_VOCABULARY = (
+    "designed built deployed optimized scalable pipelines models inference latency throughput python "
+    "pytorch onnx kubernetes distributed training evaluation research production systems accuracy "
+    "reduced improved led collaborated data features embedded edge gpu quantization benchmark "
+    "architecture services api monitoring experiments published results team delivered"
+).split()
+
+
+class Latency:
+    """
+    Seeded latency distribution, in seconds.
+
+    constant: always mean; uniform: mean +/- spread; normal: mean with
+    standard deviation spread (clipped at 0); lognormal: mean with shape
+    parameter sigma = spread, the long-tailed shape of real API latency.
+    """
+
+    def __init__(self, mean: float = 0.0, spread: float = 0.0, distribution: str = "constant", seed: int = 0):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution} (expected one of {DISTRIBUTIONS})")
+        self.mean = mean
+        self.spread = spread
+        self.distribution = distribution
+        self.seed = seed
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0) -> "Latency":
+        """Build from "0.2", "uniform:0.2:0.05" or "lognormal:0.8:0.5" (distribution:mean:spread)."""
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls(float(parts[0]), seed=seed)
+        return cls(float(parts[1]), float(parts[2]) if len(parts) > 2 else 0.0, parts[0], seed)
+
+    def sample(self) -> float:
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            return max(0.0, self._rng.uniform(self.mean - self.spread, self.mean + self.spread))
+        if self.distribution == "normal":
+            return max(0.0, self._rng.gauss(self.mean, self.spread))
+        if self.distribution == "lognormal" and self.spread > 0:
+            return self._rng.lognormvariate(math.log(self.mean) - self.spread ** 2 / 2, self.spread)
+        return self.mean
+
+    def describe(self) -> Dict[str, Any]:
+        return {"distribution": self.distribution, "mean": self.mean, "spread": self.spread, "seed": self.seed}
+
+    def __repr__(self) -> str:
+        return f"Latency({self.distribution}, mean={self.mean}, spread={self.spread})"
+
+
+def deterministic_vector(text: str, dim: int) -> List[float]:
+    """Unit vector derived from the SHA-256 of the text; equal texts get equal vectors."""
+    values = []
+    block = 0
+    while len(values) < dim:
+        digest = hashlib.sha256(f"{block}:{text}".encode("utf-8")).digest()
+        values.extend(value / 32768.0 for value in struct.unpack("<16h", digest))
+        block += 1
+    values = values[:dim]
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    return [value / norm for value in values]
+
+
+def deterministic_words(text: str, count: int) -> str:
+    """`count` words picked from a fixed vocabulary by hashing the text."""
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+    words = [rng.choice(_VOCABULARY) for _ in range(count)]
+    if words:
+        words[0] = words[0].capitalize()
+    return " ".join(words) + "."
+
+
+def _count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+def _usage_message(messages: List[BaseMessage], reply: str) -> AIMessage:
+    # Whitespace-separated words stand in for tokens in the reported usage
+    prompt_tokens = sum(_count_tokens(str(message.content)) for message in messages)
+    completion_tokens = _count_tokens(reply)
+    return AIMessage(content=reply, usage_metadata={
+        "input_tokens": prompt_tokens,
+        "output_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens
+    })
+
+
+class CountingFakeEmbeddings(Embeddings):
+    """Deterministic hash-based embedder that counts how many texts it embeds."""
+
+    def __init__(self, dim: int = 16):
+        self.dim = dim
+        self.documents_embedded = 0
+        self.queries_embedded = 0
+
+    def _vector(self, text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [(digest[i % len(digest)] - 127.5) / 127.5 for i in range(self.dim)]
+
+    def embed_documents(self, texts):
+        self.documents_embedded += len(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        self.queries_embedded += 1
+        return self._vector(text)
+
+
+class FakeEmbeddings(CountingFakeEmbeddings):
+    """
+    Embedder returning unit vectors derived from each text's hash, after a
+    per-request latency plus a per-text cost, like a batched embedding API.
+    """
+
+    def __init__(self, dim: int = 256, latency: Latency = None, seconds_per_text: float = 0.0,
+                 model: str = "fake-embedding"):
+        super().__init__(dim)
+        self.latency = latency or Latency()
+        self.seconds_per_text = seconds_per_text
+        self.model = model
+        self.requests = 0
+
+    def _vector(self, text: str) -> list[float]:
+        return deterministic_vector(text, self.dim)
+
+    def _delay(self, texts: int) -> float:
+        self.requests += 1
+        return self.latency.sample() + self.seconds_per_text * texts
+
+    def embed_documents(self, texts):
+        time.sleep(self._delay(len(texts)))
+        return super().embed_documents(texts)
+
+    def embed_query(self, text):
+        time.sleep(self._delay(1))
+        return super().embed_query(text)
+
+    async def aembed_documents(self, texts):
+        await asyncio.sleep(self._delay(len(texts)))
+        return super().embed_documents(texts)
+
+    async def aembed_query(self, text):
+        await asyncio.sleep(self._delay(1))
+        return super().embed_query(text)
+
+
+class SlowFakeChatModel(BaseChatModel):
+    """Chat model that answers with a fixed reply after an injected latency."""
+
+    model_name: str = "slow-fake-chat"
+    latency: float = 0.1
+    reply: str = "Generated section content"
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake-chat"
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=_usage_message(messages, self.reply))])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        time.sleep(self.latency)
+        return self._result(messages)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self._result(messages)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        for word in self.reply.split(" "):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word + " "))
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model with sampled time-to-first-token, a fixed token throughput and
+    deterministic replies.
+
+    The reply comes from the first (pattern, reply) rule in `responses` whose
+    regex matches the rendered prompt; without a match it is `reply_words`
+    words derived from the prompt's hash. A call takes a latency sample plus
+    completion tokens / tokens_per_second; streamed calls emit one word per
+    token at that rate.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model_name: str = "fake-chat"
+    latency: Latency = Latency()
+    tokens_per_second: float = 0.0  # 0: the whole reply is ready with the first token
+    reply_words: int = 120
+    responses: List[Tuple[str, str]] = []
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    _patterns: List[Tuple[Any, str]] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._patterns = [(re.compile(pattern), reply) for pattern, reply in self.responses]
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _reply(self, messages: List[BaseMessage]) -> str:
+        prompt = "\n".join(str(message.content) for message in messages)
+        for pattern, reply in self._patterns:
+            if pattern.search(prompt):
+                return reply
+        return deterministic_words(prompt, self.reply_words)
+
+    def _start(self, messages: List[BaseMessage]) -> Tuple[AIMessage, float]:
+        """Return the reply message and the time to its first token."""
+        self.calls += 1
+        message = _usage_message(messages, self._reply(messages))
+        self.prompt_tokens += message.usage_metadata["input_tokens"]
+        self.completion_tokens += message.usage_metadata["output_tokens"]
+        return message, self.latency.sample()
+
+    def _generation_seconds(self, message: AIMessage) -> float:
+        if self.tokens_per_second <= 0:
+            return 0.0
+        return message.usage_metadata["output_tokens"] / self.tokens_per_second
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        message, first_token = self._start(messages)
+        time.sleep(first_token + self._generation_seconds(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        message, first_token = self._start(messages)
+        await asyncio.sleep(first_token + self._generation_seconds(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        message, first_token = self._start(messages)
+        await asyncio.sleep(first_token)
+        interval = 1 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        words = message.content.split(" ")
+        for i, word in enumerate(words):
+            if i and interval:
+                await asyncio.sleep(interval)
+            chunk = AIMessageChunk(content=word if i == len(words) - 1 else word + " ")
+            if i == len(words) - 1:
+                chunk.usage_metadata = message.usage_metadata
+            yield ChatGenerationChunk(message=chunk)
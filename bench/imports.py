@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Profile module import times and guard them against regressions.
+
+Each target is imported in fresh interpreters run with `python -X importtime`;
+the per-module self/cumulative timings are parsed and the median over the
+runs is reported, along with the packages that dominate. --save-baseline
+records the totals in bench/import_baseline.json; --check exits non-zero when
+a target's total import time exceeds its baseline by more than the tolerance,
+or when it starts importing a heavy package it did not import before.
+
+Usage:
+    python -m bench.imports
+    python -m bench.imports --target app.services.rag_service --top 25
+    python -m bench.imports --save-baseline
+    python -m bench.imports --check
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_TARGETS = [
+    "app.main",
+    "app.services.resume_writer",
+    "app.services.resume_scorer",
+    "app.services.rag_service",
+]
+BASELINE_PATH = project_root / "bench" / "import_baseline.json"
+# Packages that should only load when a feature needs them
+HEAVY_PACKAGES = ["faiss", "nltk", "docx", "fpdf", "scipy", "sklearn", "numpy",
+                  "langchain", "langchain_community", "langchain_openai", "openai", "jinja2"]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int, int]]:
+    """Return {module: (self us, cumulative us, nesting depth)} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules[module] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return modules
+
+
+def profile_once(target: str) -> Dict[str, Tuple[int, int, int]]:
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench-key")}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {target}"],
+                            cwd=project_root, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def profile(target: str, runs: int) -> Dict:
+    """Import target in `runs` fresh interpreters and return median timings in ms."""
+    samples = [profile_once(target) for _ in range(runs)]
+    modules = set().union(*samples)
+    cumulative = {m: statistics.median(s[m][1] for s in samples if m in s) / 1000 for m in modules}
+    self_ms = {m: statistics.median(s[m][0] for s in samples if m in s) / 1000 for m in modules}
+    by_package = defaultdict(float)
+    for module, ms in self_ms.items():
+        by_package[module.split(".")[0]] += ms
+    return {
+        "target": target,
+        "total_ms": round(statistics.median(s[target][1] for s in samples) / 1000, 1),
+        "runs_ms": [round(s[target][1] / 1000, 1) for s in samples],
+        "modules": len(modules),
+        "heavy_packages": sorted(p for p in HEAVY_PACKAGES if p in by_package),
+        "packages_ms": dict(sorted(((p, round(ms, 1)) for p, ms in by_package.items()),
+                                   key=lambda item: -item[1])),
+        "cumulative_ms": dict(sorted(((m, round(ms, 1)) for m, ms in cumulative.items()),
+                                     key=lambda item: -item[1])),
+    }
+
+
+def print_report(result: Dict, top: int):
+    print(f"\n{result['target']}: {result['total_ms']:.1f} ms median "
+          f"(runs: {', '.join(f'{ms:.0f}' for ms in result['runs_ms'])}), {result['modules']} modules")
+    print(f"  heavy packages: {', '.join(result['heavy_packages']) or 'none'}")
+    print(f"  {'package (self time)':<44}{'ms':>9}")
+    for package, ms in list(result["packages_ms"].items())[:top]:
+        print(f"  {package:<44}{ms:9.1f}")
+    print(f"  {'module (cumulative)':<44}{'ms':>9}")
+    for module, ms in list(result["cumulative_ms"].items())[1:top + 1]:
+        print(f"  {module:<44}{ms:9.1f}")
+
+
+def check(results: List[Dict], baseline: Dict, tolerance: float, slack_ms: float) -> List[str]:
+    """Return the regressions of results against the baseline."""
+    problems = []
+    for result in results:
+        recorded = baseline.get(result["target"])
+        if recorded is None:
+            problems.append(f"{result['target']}: no baseline recorded (run with --save-baseline)")
+            continue
+        limit = recorded["total_ms"] * (1 + tolerance) + slack_ms
+        if result["total_ms"] > limit:
+            problems.append(f"{result['target']}: {result['total_ms']:.1f} ms exceeds "
+                            f"{limit:.1f} ms (baseline {recorded['total_ms']:.1f} ms)")
+        new_heavy = sorted(set(result["heavy_packages"]) - set(recorded["heavy_packages"]))
+        if new_heavy:
+            problems.append(f"{result['target']}: now imports {', '.join(new_heavy)}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", help="Module to profile (repeatable)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=15, help="Packages/modules to list per target")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Record totals in {BASELINE_PATH.name}")
+    parser.add_argument("--check", action="store_true", help="Exit 1 when a target regressed against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--slack-ms", type=float, default=50.0, help="Allowed absolute slowdown in ms")
+    parser.add_argument("--json", help="Write the full results to this file")
+    args = parser.parse_args()
+
+    results = [profile(target, args.runs) for target in args.target or DEFAULT_TARGETS]
+    for result in results:
+        print_report(result, args.top)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        for result in results:
+            baseline[result["target"]] = {"total_ms": result["total_ms"],
+                                          "heavy_packages": result["heavy_packages"]}
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {BASELINE_PATH.relative_to(project_root)}")
+
+    if args.check:
+        problems = check(results, json.loads(BASELINE_PATH.read_text()), args.tolerance, args.slack_ms)
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print(f"\n✅ Import times within {args.tolerance:.0%} + {args.slack_ms:.0f} ms of the baseline")
+
+
+if __name__ == "__main__":
+    main()
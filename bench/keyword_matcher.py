@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark Aho-Corasick technical term extraction against the previous
+per-keyword substring scan in ResumeScorerService.
+
+Usage:
+    python -m bench.keyword_matcher --jobs 10000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from app.core.keyword_matcher import DEFAULT_TECH_KEYWORDS, KeywordMatcher, load_tech_vocabulary
+from app.services.resume_scorer import ResumeScorerService
+
+FILLER = ("we are looking for an engineer to build maintain and improve our platform the team "
+          "works closely with product and research you will design good systems own delivery "
+          "mentor others communicate clearly and ship reliable services at scale strong interest "
+          "in performance testing documentation and code review is required").split()
+
+
+def synthetic_job_descriptions(count: int, vocabulary):
+    rng = random.Random(11)
+    for _ in range(count):
+        words = rng.choices(FILLER, k=220)
+        for term in rng.sample(vocabulary, 12):
+            words.insert(rng.randrange(len(words)), rng.choice([term, term.title(), term.upper()]))
+        yield " ".join(words)
+
+
+def legacy_extract_technical_terms(text: str, tech_keywords=DEFAULT_TECH_KEYWORDS):
+    """Previous behaviour: five uncompiled regexes, then one substring scan per keyword."""
+    technical_patterns = [
+        r'\b[A-Z][a-zA-Z]*\b',
+        r'\b[A-Z]{2,}\b',
+        r'\b[a-z]+\.js\b',
+        r'\b[a-z]+\.py\b',
+        r'\b[A-Za-z]+\d+\b',
+    ]
+    technical_terms = []
+    for pattern in technical_patterns:
+        technical_terms.extend(re.findall(pattern, text))
+    text_lower = text.lower()
+    for keyword in tech_keywords:
+        if keyword in text_lower:
+            technical_terms.append(keyword)
+    return list(set(technical_terms))
+
+
+def legacy_keywords(text: str, tech_keywords):
+    text_lower = text.lower()
+    return [keyword for keyword in tech_keywords if keyword in text_lower]
+
+
+def timed(function, texts):
+    start = time.perf_counter()
+    results = [function(text) for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=10000, help="Number of synthetic job descriptions")
+    args = parser.parse_args()
+
+    vocabulary = list(dict.fromkeys(term.lower() for term in load_tech_vocabulary()))
+    start = time.perf_counter()
+    matcher = KeywordMatcher(vocabulary)
+    print(f"Compiled {len(matcher)} terms in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    texts = list(synthetic_job_descriptions(args.jobs, vocabulary))
+    print(f"{args.jobs} job descriptions, ~{sum(len(t) for t in texts) // len(texts)} characters each\n")
+
+    scorer = SimpleNamespace(keyword_matcher=matcher)
+    print(f"{'_extract_technical_terms':<44}{'total (s)':>10}{'per JD (us)':>13}")
+    legacy_s, _ = timed(legacy_extract_technical_terms, texts)
+    current_s, _ = timed(lambda text: ResumeScorerService._extract_technical_terms(scorer, text), texts)
+    for name, seconds in [(f"legacy ({len(DEFAULT_TECH_KEYWORDS)} keywords)", legacy_s),
+                          (f"aho-corasick ({len(matcher)} terms)", current_s)]:
+        print(f"{name:<44}{seconds:>10.2f}{seconds / args.jobs * 1e6:>13.1f}")
+
+    print(f"\n{'keyword matching only':<44}{'total (s)':>10}{'per JD (us)':>13}")
+    substring_s, substring_hits = timed(lambda text: legacy_keywords(text, vocabulary), texts)
+    automaton_s, automaton_hits = timed(matcher.find_all, texts)
+    for name, seconds in [(f"substring scan ({len(vocabulary)} terms)", substring_s),
+                          (f"aho-corasick ({len(matcher)} terms)", automaton_s)]:
+        print(f"{name:<44}{seconds:>10.2f}{seconds / args.jobs * 1e6:>13.1f}")
+
+    substring_total = sum(len(hits) for hits in substring_hits)
+    automaton_total = sum(len(hits) for hits in automaton_hits)
+    print(f"\nMatches: substring {substring_total}, whole-word {automaton_total} "
+          f"({substring_total - automaton_total} substring-only hits such as 'go' in 'good')")
+
+
+if __name__ == "__main__":
+    main()
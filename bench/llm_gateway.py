@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pooled LLM gateway against per-client ChatOpenAI construction.
+
+Runs concurrent chat completions against a local OpenAI-compatible stand-in
+server (bench.openai_stub) and reports throughput and how many TCP
+connections the server had to accept.
+
+Usage:
+    python -m bench.llm_gateway --requests 100 --latency 0.25
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from app.core.llm_gateway import LLMGateway
+from bench.openai_stub import OpenAIStubServer
+
+
+async def _timed_calls(get_model, requests: int):
+    latencies = []
+
+    async def call(i: int):
+        model = get_model(i)
+        start = time.perf_counter()
+        await model.ainvoke(f"Write section {i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(requests)))
+    return time.perf_counter() - start, latencies
+
+
+async def run_scenario(name: str, requests: int, latency: float, rounds: int, make_get_model):
+    async with OpenAIStubServer(latency=latency) as server:
+        get_model, cleanup = make_get_model(server.base_url)
+        elapsed_total, latencies = 0.0, []
+        for _ in range(rounds):
+            elapsed, round_latencies = await _timed_calls(get_model, requests)
+            elapsed_total += elapsed
+            latencies.extend(round_latencies)
+        await cleanup()
+        total = requests * rounds
+        print(f"{name:34s} {total / elapsed_total:8.1f} req/s  p50 {statistics.median(latencies):7.1f} ms  "
+              f"connections {server.connections:4d}  peak concurrent {server.max_active_requests:3d}")
+
+
+def independent_clients(count: int):
+    """Previous pattern: every caller owns a ChatOpenAI with its own connection pool."""
+    def factory(base_url: str):
+        clients = [httpx.AsyncClient() for _ in range(count)]
+        models = [ChatOpenAI(model="gpt-4", temperature=0.7, api_key="bench-key", base_url=base_url,
+                             http_async_client=client) for client in clients]
+
+        def get_model(i: int):
+            return models[i % count]
+
+        async def cleanup():
+            for client in clients:
+                await client.aclose()
+
+        return get_model, cleanup
+
+    return factory
+
+
+def gateway(max_concurrency: int):
+    def factory(base_url: str):
+        llm_gateway = LLMGateway(api_key="bench-key", base_url=base_url, max_concurrency=max_concurrency,
+                                 requests_per_second=0, max_connections=max_concurrency,
+                                 max_keepalive_connections=max_concurrency)
+
+        def get_model(i: int):
+            # Services asking for the same profile get the same pooled model
+            return llm_gateway.chat_model(model="gpt-4", temperature=0.7)
+
+        return get_model, llm_gateway.aclose
+
+    return factory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="Concurrent requests per round")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds of concurrent requests")
+    parser.add_argument("--latency", type=float, default=0.25, help="Stand-in server latency in seconds")
+    args = parser.parse_args()
+
+    print(f"{args.rounds} rounds x {args.requests} concurrent chat completions, "
+          f"server latency {args.latency * 1000:.0f} ms")
+    asyncio.run(run_scenario("8 independent ChatOpenAI clients", args.requests, args.latency, args.rounds,
+                             independent_clients(8)))
+    asyncio.run(run_scenario(f"{args.requests} independent ChatOpenAI clients", args.requests, args.latency,
+                             args.rounds, independent_clients(args.requests)))
+    asyncio.run(run_scenario("Gateway (max_concurrency=32)", args.requests, args.latency, args.rounds,
+                             gateway(32)))
+    asyncio.run(run_scenario("Gateway (max_concurrency=16)", args.requests, args.latency, args.rounds,
+                             gateway(16)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+HTTP load test of the API, run in-process against local model fakes.
+
+Builds the real application with app.factory.create_app() and serves it
+either through httpx's ASGITransport (no sockets; the client shares the
+server's event loop) or a uvicorn server on a local port. Every chat model
+and embeddings client the services obtain from the LLM gateway is one of
+the fakes in bench/fakes.py, so no API key or network access is needed and
+the fake latency settings decide how long the "LLM" takes.
+
+Scenarios are defined in config/loadtest.yaml: a target rate, a duration
+and a weighted mix of request templates for /api/rank-projects,
+/api/generate-deduplicated-resume, /api/score-resume and /api/export.
+Arrivals are open-loop: requests start on schedule whether or not earlier
+ones finished, and latency is measured from the scheduled start, so a
+stalled server shows up as latency instead of a lower request rate.
+
+Per scenario the harness reports p50/p95/p99 latency overall and per
+request type, achieved throughput, the error rate (exceptions, timeouts,
+dropped arrivals and 4xx/5xx responses), and event-loop lag: how late a
+timer firing every lag_interval_ms wakes up. With the ASGI transport the
+lag is the server's own loop, so blocking work in a handler shows up there
+directly.
+
+Usage:
+    python -m bench.loadtest --list
+    python -m bench.loadtest --scenario smoke
+    python -m bench.loadtest --scenario mixed --rps 40 --duration 30
+    python -m bench.loadtest --scenario scoring_burst --transport uvicorn --output bench/results/load.json
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import os
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+import httpx
+import yaml
+
+from app.core.config import settings
+from app.core.container import get_container
+from app.core.job_queue import get_job_queue
+from app.core.llm_gateway import get_llm_gateway
+from bench.suite import RESUME_DATA, Fakes, distribution, git_revision, job_description
+
+CONFIG_PATH = project_root / "config" / "loadtest.yaml"
+TRANSPORTS = ("asgi", "uvicorn")
+ARRIVALS = ("poisson", "uniform")
+
+RESUME_SECTIONS = {name: (value if isinstance(value, str) else json.dumps(value))
+                   for name, value in RESUME_DATA.items()}
+
+
+def load_scenarios(path: Path = CONFIG_PATH) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the scenario file and return every scenario with the defaults applied.
+
+    Each returned scenario also carries its resolved request templates under
+    "requests", so it can be run on its own.
+
+    Raises:
+        ValueError: If a scenario is malformed or its mix names an unknown request
+    """
+    with open(path, "r") as f:
+        config = yaml.safe_load(f) or {}
+
+    defaults = config.get("defaults", {})
+    templates = config.get("requests", {})
+    scenarios = {}
+    for name, overrides in (config.get("scenarios") or {}).items():
+        scenario = {**copy.deepcopy(defaults), **copy.deepcopy(overrides)}
+        scenario["fakes"] = {**defaults.get("fakes", {}), **overrides.get("fakes", {})}
+        scenario["name"] = name
+
+        mix = scenario.get("mix") or {}
+        if not mix:
+            raise ValueError(f"Scenario {name} has an empty mix")
+        unknown = sorted(set(mix) - set(templates))
+        if unknown:
+            raise ValueError(f"Scenario {name} uses unknown requests: {', '.join(unknown)}")
+        if scenario.get("arrival", "poisson") not in ARRIVALS:
+            raise ValueError(f"Scenario {name}: arrival must be one of {ARRIVALS}")
+        if scenario.get("rps", 0) <= 0 or scenario.get("duration_seconds", 0) <= 0:
+            raise ValueError(f"Scenario {name}: rps and duration_seconds must be positive")
+        scenario["requests"] = {request: templates[request] for request in mix}
+        scenarios[name] = scenario
+    return scenarios
+
+
+def render(value: Any, i: int) -> Any:
+    """Fill the placeholders of a request template for request number i."""
+    if isinstance(value, dict):
+        return {key: render(item, i) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, i) for item in value]
+    if value == "{resume_data}":
+        return copy.deepcopy(RESUME_DATA)
+    if value == "{resume_sections}":
+        return dict(RESUME_SECTIONS)
+    if isinstance(value, str):
+        return value.replace("{job_description}", job_description(i)).replace("{i}", str(i))
+    return value
+
+
+class LoopLagMonitor:
+    """Samples how late a periodic timer fires on the running event loop."""
+
+    def __init__(self, interval_ms: float = 10.0):
+        self.interval = interval_ms / 1000
+        self.samples_ms: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples_ms.append(max(0.0, (loop.time() - expected) * 1000))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def serve(scenario: Dict[str, Any], transport: str = "asgi"):
+    """
+    Run the application with fake models installed and yield (client, fakes).
+
+    Exports, embedding files and the job table go to a temporary directory,
+    services are rebuilt so they pick up the fakes, and everything is
+    restored on exit.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport: {transport} (expected one of {TRANSPORTS})")
+    from app.factory import create_app
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="resume-loadtest-"))
+    saved = (settings.paths.exports_dir, settings.paths.embeddings_dir, settings.job_queue.db_path,
+             settings.vector_db.embedding_model, settings.cache.llm_responses.enabled)
+    settings.paths.exports_dir = str(tmp_dir / "exports")
+    settings.paths.embeddings_dir = str(tmp_dir / "embeddings")
+    settings.job_queue.db_path = str(tmp_dir / "jobs.sqlite3")
+    job_queue = get_job_queue()
+    job_queue.close()
+    # Keep fake vectors apart from real ones in a shared embedding cache
+    settings.vector_db.embedding_model = f"loadtest-{settings.vector_db.embedding_model}"
+    settings.cache.llm_responses.enabled = bool(scenario.get("warm_caches", False))
+
+    fake_config = {key: (str(value) if key.endswith("_latency") else value)
+                   for key, value in scenario["fakes"].items()}
+    fakes = Fakes(argparse.Namespace(**fake_config), tmp_dir)
+    gateway = get_llm_gateway()
+    gateway.set_override(chat_factory=fakes.chat, embeddings_factory=fakes.embedder)
+    container = get_container()
+    container.reset()
+
+    app = create_app()
+    timeout = httpx.Timeout(scenario.get("timeout_seconds", 60))
+    server = server_task = None
+    try:
+        if transport == "asgi":
+            # ASGITransport does not send lifespan events; run startup/shutdown here
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                             base_url="http://loadtest", timeout=timeout) as client:
+                    yield client, fakes
+        else:
+            import uvicorn
+
+            port = _free_port()
+            server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port,
+                                                   log_level="warning", access_log=False))
+            server_task = asyncio.create_task(server.serve())
+            while not server.started:
+                if server_task.done():
+                    server_task.result()
+                    raise RuntimeError("uvicorn exited during startup")
+                await asyncio.sleep(0.01)
+            limits = httpx.Limits(max_connections=scenario.get("max_in_flight", 200))
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=timeout,
+                                         limits=limits) as client:
+                yield client, fakes
+    finally:
+        if server is not None:
+            server.should_exit = True
+            await server_task
+        gateway.clear_override()
+        container.reset()
+        job_queue.close()
+        (settings.paths.exports_dir, settings.paths.embeddings_dir, settings.job_queue.db_path,
+         settings.vector_db.embedding_model, settings.cache.llm_responses.enabled) = saved
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+async def run_load(client: httpx.AsyncClient, scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drive one scenario against a client and return its results.
+
+    Args:
+        client: Client for the application under test
+        scenario: Scenario from load_scenarios(), possibly with overrides
+    """
+    rng = random.Random(scenario["fakes"].get("seed", 0))
+    names = list(scenario["mix"])
+    weights = [scenario["mix"][name] for name in names]
+    rps, duration = scenario["rps"], scenario["duration_seconds"]
+    max_in_flight = scenario.get("max_in_flight", 200)
+    poisson = scenario.get("arrival", "poisson") == "poisson"
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    outcomes: Dict[str, Counter] = defaultdict(Counter)
+    in_flight = set()
+    monitor = LoopLagMonitor(scenario.get("lag_interval_ms", 10))
+
+    async def send(name: str, i: int, scheduled: float):
+        template = scenario["requests"][name]
+        try:
+            response = await client.request(template.get("method", "POST"), render(template["path"], i),
+                                            json=render(template.get("body"), i))
+            outcome = str(response.status_code)
+        except httpx.TimeoutException:
+            outcome = "timeout"
+        except Exception as e:
+            outcome = type(e).__name__
+        latencies[name].append((time.perf_counter() - scheduled) * 1000)
+        outcomes[name][outcome] += 1
+
+    monitor.start()
+    started = time.perf_counter()
+    next_arrival = 0.0
+    i = 0
+    while next_arrival < duration:
+        delay = started + next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        name = rng.choices(names, weights)[0]
+        if len(in_flight) >= max_in_flight:
+            outcomes[name]["dropped"] += 1
+        else:
+            task = asyncio.create_task(send(name, i, started + next_arrival))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        i += 1
+        next_arrival += rng.expovariate(rps) if poisson else 1 / rps
+    sent_seconds = time.perf_counter() - started
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    wall_seconds = time.perf_counter() - started
+    await monitor.stop()
+
+    def summarize(values: List[float], counts: Counter) -> Dict[str, Any]:
+        total = sum(counts.values())
+        errors = total - sum(n for outcome, n in counts.items() if outcome.isdigit() and int(outcome) < 400)
+        return {
+            "requests": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "outcomes": dict(sorted(counts.items())),
+            "latency_ms": distribution(values) if values else None,
+        }
+
+    everything = [value for values in latencies.values() for value in values]
+    overall = summarize(everything, sum(outcomes.values(), Counter()))
+    completed = len(everything)
+    return {
+        "target_rps": rps,
+        "offered_rps": round(i / sent_seconds, 2),
+        "throughput_per_s": round(completed / wall_seconds, 2),
+        "wall_seconds": round(wall_seconds, 2),
+        **overall,
+        "loop_lag_ms": distribution(monitor.samples_ms) if monitor.samples_ms else None,
+        "endpoints": {name: summarize(latencies[name], outcomes[name]) for name in names if outcomes[name]},
+    }
+
+
+def print_results(name: str, result: Dict[str, Any]):
+    print(f"\n{name}: {result['requests']} requests in {result['wall_seconds']:.1f}s  "
+          f"target {result['target_rps']}/s  offered {result['offered_rps']}/s  "
+          f"throughput {result['throughput_per_s']}/s  errors {result['error_rate']:.1%}")
+    print(f"  {'request':<24}{'count':>7}{'err %':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = list(result["endpoints"].items()) + [("all", result)]
+    for request, stats in rows:
+        latency = stats["latency_ms"] or {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        print(f"  {request:<24}{stats['requests']:>7}{stats['error_rate'] * 100:>8.1f}"
+              f"{latency['p50']:>10.1f}{latency['p95']:>10.1f}{latency['p99']:>10.1f}")
+    lag = result["loop_lag_ms"]
+    if lag:
+        print(f"  event-loop lag: p50 {lag['p50']:.2f} ms  p99 {lag['p99']:.2f} ms  max {lag['max']:.2f} ms")
+    for request, stats in result["endpoints"].items():
+        failures = {outcome: n for outcome, n in stats["outcomes"].items()
+                    if not (outcome.isdigit() and int(outcome) < 400)}
+        if failures:
+            print(f"  {request} failures: {failures}")
+
+
+async def run_scenario(scenario: Dict[str, Any], transport: str = "asgi") -> Dict[str, Any]:
+    """Serve the app with fakes, drive the scenario and add the fake model counters."""
+    async with serve(scenario, transport) as (client, fakes):
+        result = await run_load(client, scenario)
+        result["fakes"] = fakes.counters()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default=str(CONFIG_PATH), help="Scenario file")
+    parser.add_argument("--scenario", action="append", help="Scenario to run (repeatable; default: smoke)")
+    parser.add_argument("--list", action="store_true", help="List the scenarios and exit")
+    parser.add_argument("--transport", choices=TRANSPORTS, default="asgi", help="How the client reaches the app")
+    parser.add_argument("--rps", type=float, help="Override the target request rate")
+    parser.add_argument("--duration", type=float, help="Override the duration in seconds")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    # One INFO line per request would drown the report
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    scenarios = load_scenarios(Path(args.config))
+    if args.list:
+        for name, scenario in scenarios.items():
+            print(f"{name:<20}{scenario['rps']:>6} rps {scenario['duration_seconds']:>5}s  "
+                  f"{scenario.get('description', '')}")
+        return
+
+    names = args.scenario or ["smoke"]
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (see --list)")
+
+    results = {"revision": git_revision(), "transport": args.transport, "scenarios": {}}
+    for name in names:
+        scenario = scenarios[name]
+        if args.rps:
+            scenario["rps"] = args.rps
+        if args.duration:
+            scenario["duration_seconds"] = args.duration
+        print(f"Running {name}: {scenario['rps']} rps for {scenario['duration_seconds']}s over {args.transport}")
+        result = asyncio.run(run_scenario(scenario, args.transport))
+        results["scenarios"][name] = {"config": {key: value for key, value in scenario.items() if key != "requests"},
+                                      **result}
+        print_results(name, result)
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the cost of recording Prometheus metrics.
+
+Times Counter.inc and Histogram.observe on their own, then the per-request
+overhead of MetricsMiddleware: a minimal FastAPI app is called directly
+through ASGI (no HTTP server, so the difference is not lost in socket
+noise) with and without the middleware, in interleaved rounds. Finally
+times rendering /metrics for a registry with many label sets.
+
+Usage:
+    python -m bench.metrics_overhead
+    python -m bench.metrics_overhead --requests 20000 --rounds 7
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from fastapi import FastAPI
+
+from app.api.middleware import MetricsMiddleware
+from app.core import metrics
+
+
+def per_operation_ns(number: int):
+    registry = metrics.MetricsRegistry()
+    counter = registry.counter("bench_total", "Bench counter.", ("route",))
+    histogram = registry.histogram("bench_seconds", "Bench histogram.", ("method", "route", "status"))
+    labels = ("GET", "/api/jobs/{job_id}", "200")
+    inc = min(timeit.repeat(lambda: counter.inc(1, ("/a",)), number=number, repeat=5)) / number * 1e9
+    observe = min(timeit.repeat(lambda: histogram.observe(0.042, labels), number=number, repeat=5)) / number * 1e9
+    return inc, observe
+
+
+def build_app(with_metrics: bool):
+    app = FastAPI()
+
+    @app.get("/api/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def drive(app, requests: int) -> float:
+    """Call the app through ASGI `requests` times; return microseconds per request."""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    def scope(i: int):
+        return {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                "scheme": "http", "path": f"/api/items/{i}", "raw_path": f"/api/items/{i}".encode(),
+                "root_path": "", "query_string": b"", "headers": [], "client": ("127.0.0.1", 1),
+                "server": ("127.0.0.1", 80)}
+
+    started = time.perf_counter()
+    for i in range(requests):
+        await app(scope(i), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def render_ms(series: int) -> float:
+    registry = metrics.MetricsRegistry()
+    histogram = registry.histogram("bench_seconds", "Bench histogram.", ("route", "status"))
+    for i in range(series):
+        histogram.observe(0.1, (f"/route/{i}", "200"))
+    return min(timeit.repeat(registry.render, number=10, repeat=3)) / 10 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="ASGI requests per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Interleaved rounds per variant")
+    parser.add_argument("--series", type=int, default=200, help="Histogram label sets to render")
+    args = parser.parse_args()
+
+    inc_ns, observe_ns = per_operation_ns(100_000)
+    print(f"Counter.inc          {inc_ns:8.0f} ns/op")
+    print(f"Histogram.observe    {observe_ns:8.0f} ns/op")
+
+    plain, instrumented = build_app(False), build_app(True)
+    timings = {"without metrics": [], "with metrics": []}
+
+    async def rounds():
+        await drive(plain, 200)
+        await drive(instrumented, 200)
+        for _ in range(args.rounds):
+            timings["without metrics"].append(await drive(plain, args.requests))
+            timings["with metrics"].append(await drive(instrumented, args.requests))
+
+    asyncio.run(rounds())
+    print(f"\n{'ASGI request':<20}{'median us':>12}{'min us':>10}")
+    for name, values in timings.items():
+        print(f"{name:<20}{statistics.median(values):12.1f}{min(values):10.1f}")
+    overhead = statistics.median(timings["with metrics"]) - statistics.median(timings["without metrics"])
+    print(f"middleware overhead {overhead:12.1f} us/request "
+          f"({overhead / statistics.median(timings['without metrics']):.1%})")
+
+    print(f"\nrender /metrics with {args.series} histogram series: {render_ms(args.series):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
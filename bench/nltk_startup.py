@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark the startup cost of resume scoring's text resources.
+
+Each stage runs in a fresh interpreter, so module caches don't carry over.
+"legacy" is the import block ResumeScorerService used to run at import time
+(nltk plus its tokenizer and stopword corpus). The other stages time the
+scorer as it is now: importing it, constructing it, and the first keyword
+extraction, which loads the vendored stopwords and the tokenizer.
+
+Usage:
+    python -m bench.nltk_startup --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+STAGES = {
+    "legacy nltk imports": (
+        "import nltk\n"
+        "from nltk.corpus import stopwords\n"
+        "from nltk.tokenize import word_tokenize\n"
+    ),
+    "import resume_scorer": "from app.services.resume_scorer import ResumeScorerService\n",
+    "construct scorer": (
+        "from app.services.resume_scorer import ResumeScorerService\n"
+        "scorer = ResumeScorerService()\n"
+    ),
+    "first keyword extraction": (
+        "from app.services.resume_scorer import ResumeScorerService\n"
+        "scorer = ResumeScorerService()\n"
+        "scorer._extract_keywords('ML engineer with PyTorch, ONNX and CUDA experience.')\n"
+    ),
+}
+
+TIMED = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{body}"
+    "elapsed = (time.perf_counter() - start) * 1000\n"
+    "import sys\n"
+    "print(elapsed, 'nltk' in sys.modules)\n"
+)
+
+
+def time_stage(body: str):
+    """Return (milliseconds, whether nltk got imported) for one fresh interpreter."""
+    env = {**os.environ, "OPENAI_API_KEY": "bench-key"}
+    result = subprocess.run([sys.executable, "-c", TIMED.format(body=body)], cwd=project_root,
+                            env=env, capture_output=True, text=True, check=True)
+    elapsed, nltk_loaded = result.stdout.strip().splitlines()[-1].split()
+    return float(elapsed), nltk_loaded == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per stage")
+    args = parser.parse_args()
+
+    print(f"{'stage':<28}{'median ms':>12}{'min ms':>10}{'nltk loaded':>14}")
+    for name, body in STAGES.items():
+        try:
+            runs = [time_stage(body) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{name:<28}{'failed':>12}  {e.stderr.strip().splitlines()[-1]}")
+            continue
+        samples = [elapsed for elapsed, _ in runs]
+        nltk_loaded = "yes" if any(loaded for _, loaded in runs) else "no"
+        print(f"{name:<28}{statistics.median(samples):12.1f}{min(samples):10.1f}{nltk_loaded:>14}")
+
+
+if __name__ == "__main__":
+    main()
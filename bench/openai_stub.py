@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Minimal OpenAI-compatible HTTP server for offline benchmarks.
+
+Serves /v1/chat/completions (plain and streamed) and /v1/embeddings over
+HTTP/1.1 keep-alive with an injected latency, and counts accepted TCP
+connections so benchmarks can show whether clients reuse them.
+
+Usage:
+    python -m bench.openai_stub --port 8765 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+from typing import Optional
+
+
+class OpenAIStubServer:
+    """asyncio server answering chat completion and embedding requests."""
+
+    def __init__(self, latency: float = 0.05, reply: str = "Stub completion", dim: int = 16):
+        self.latency = latency
+        self.reply = reply
+        self.dim = dim
+        self.connections = 0
+        self.requests = 0
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.port = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    async def start(self, port: int = 0):
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                path = request_line.split(" ")[1]
+                await self._respond(writer, path, json.loads(body or b"{}"))
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, path: str, payload: dict):
+        self.requests += 1
+        self.active_requests += 1
+        self.max_active_requests = max(self.max_active_requests, self.active_requests)
+        try:
+            await asyncio.sleep(self.latency)
+            if path.endswith("/embeddings"):
+                texts = payload.get("input") or []
+                texts = [texts] if isinstance(texts, str) else texts
+                data = [{"object": "embedding", "index": i, "embedding": self._vector(str(text))}
+                        for i, text in enumerate(texts)]
+                self._write_json(writer, {"object": "list", "data": data, "model": payload.get("model"),
+                                          "usage": {"prompt_tokens": 0, "total_tokens": 0}})
+            elif payload.get("stream"):
+                self._write_stream(writer, payload.get("model"))
+            else:
+                self._write_json(writer, self._completion(payload.get("model")))
+            await writer.drain()
+        finally:
+            self.active_requests -= 1
+
+    def _vector(self, text: str) -> list:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [(digest[i % len(digest)] - 127.5) / 127.5 for i in range(self.dim)]
+
+    def _completion(self, model: str) -> dict:
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": self.reply}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": len(self.reply.split()), "total_tokens": 10 + len(self.reply.split())}
+        }
+
+    def _write_json(self, writer: asyncio.StreamWriter, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: keep-alive\r\n"
+                     + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+
+    def _write_stream(self, writer: asyncio.StreamWriter, model: str):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nConnection: keep-alive\r\n"
+                     b"Transfer-Encoding: chunked\r\n\r\n")
+        words = self.reply.split(" ")
+        for i, word in enumerate(words):
+            chunk = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": {"content": word if i == 0 else " " + word},
+                                                  "finish_reason": None}]}
+            self._write_chunk(writer, f"data: {json.dumps(chunk)}\n\n")
+        done = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        self._write_chunk(writer, f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+
+    @staticmethod
+    def _write_chunk(writer: asyncio.StreamWriter, text: str):
+        data = text.encode("utf-8")
+        writer.write(f"{len(data):x}\r\n".encode("latin-1") + data + b"\r\n")
+
+
+async def _serve(port: int, latency: float):
+    server = await OpenAIStubServer(latency=latency).start(port)
+    print(f"OpenAI stub listening on {server.base_url} (latency {latency * 1000:.0f} ms)")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds to wait before each response")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.port, args.latency))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark BM25 project search against the previous substring scan.
+
+Usage:
+    python -m bench.project_search --projects 50000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from app.services.project_search import ProjectSearchIndex
+
+WORDS = ("neural network pruning sparsity quantization edge deployment inference latency "
+         "object detection retrieval augmented generation embeddings transformer vision "
+         "distributed training benchmark accelerator compiler kernel dataset pipeline").split()
+TECHNOLOGIES = ["Python", "PyTorch", "ONNX", "CUDA", "FAISS", "FastAPI", "Docker",
+                "TensorFlow", "LangChain", "OpenAI GPT models", "C++", "Verilog"]
+QUERIES = ["pytorch", "edge inference", "spars", "quantization onnx", "retrieval augmented",
+           "cuda kernel latency", "transf", "verilog accelerator"]
+
+
+def synthetic_projects(count: int):
+    rng = random.Random(7)
+    for i in range(count):
+        yield f"project_{i}.yaml", {
+            "title": f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} Project {i}",
+            "description": " ".join(rng.choices(WORDS, k=25)),
+            "technologies": rng.sample(TECHNOLOGIES, 3),
+            "methods": rng.sample(WORDS, 4),
+        }
+
+
+def legacy_search(projects, query: str, limit: int = 5):
+    """Previous behaviour: substring checks over every project."""
+    query_lower = query.lower()
+    matches = []
+    for project in projects:
+        score = 0
+        if query_lower in project["title"].lower():
+            score += 3
+        if query_lower in project["description"].lower():
+            score += 2
+        for tech in project["technologies"]:
+            if query_lower in tech.lower():
+                score += 1
+        if query_lower in " ".join(project["methods"]).lower():
+            score += 1
+        if score > 0:
+            matches.append((project, score))
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches[:limit]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=50000, help="Number of synthetic projects")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed searches per query")
+    args = parser.parse_args()
+
+    projects = list(synthetic_projects(args.projects))
+    index = ProjectSearchIndex()
+    start = time.perf_counter()
+    for doc_id, project in projects:
+        index.add(doc_id, project)
+    print(f"Indexed {args.projects} projects in {(time.perf_counter() - start):.2f} s")
+
+    # Warm the per-term score cache, as repeated queries in production would
+    for query in QUERIES:
+        index.search(query)
+
+    print(f"{'query':<28}{'bm25 p50 (ms)':>15}{'bm25 p99 (ms)':>15}{'legacy (ms)':>14}")
+    plain_projects = [project for _, project in projects]
+    for query in QUERIES:
+        latencies = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            index.search(query, limit=5)
+            latencies.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        legacy_search(plain_projects, query)
+        legacy_ms = (time.perf_counter() - start) * 1000
+        print(f"{query:<28}{statistics.median(latencies):>15.3f}{percentile(latencies, 0.99):>15.3f}{legacy_ms:>14.1f}")
+
+    start = time.perf_counter()
+    index.add("project_0.yaml", {"title": "Updated Project", "description": "incremental update"})
+    index.search("pytorch")
+    print(f"Incremental update + first query: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark ProjectStoreService reads over a large synthetic projects directory.
+
+Compares the indexed, mtime-aware store against the previous behaviour of
+re-listing and re-parsing every YAML file on each read.
+
+Usage:
+    python -m bench.project_store --files 10000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from app.services.project_store import ProjectStoreService
+
+TECHNOLOGIES = ["Python", "PyTorch", "ONNX", "CUDA", "FAISS", "FastAPI", "Docker",
+                "TensorFlow", "LangChain", "OpenAI GPT models", "C++", "Verilog"]
+
+
+def write_projects(directory: str, count: int):
+    rng = random.Random(42)
+    for i in range(count):
+        project = {
+            "title": f"Synthetic Project {i}",
+            "slug": f"synthetic-project-{i}",
+            "description": f"Synthetic project number {i} for benchmarking.",
+            "technologies": rng.sample(TECHNOLOGIES, 3),
+            "created_at": "2024-01-01T00:00:00",
+        }
+        with open(os.path.join(directory, f"synthetic_project_{i}.yaml"), "w") as f:
+            yaml.dump(project, f, default_flow_style=False, sort_keys=False)
+
+
+def legacy_load_all(directory: str):
+    """Previous behaviour: list the directory and parse every file on each read."""
+    projects = []
+    for filename in os.listdir(directory):
+        if filename.endswith(".yaml"):
+            with open(os.path.join(directory, filename)) as f:
+                projects.append(yaml.safe_load(f))
+    return projects
+
+
+def legacy_get_by_title(directory: str, title: str):
+    for project in legacy_load_all(directory):
+        if project.get("title", "").lower() == title.lower():
+            return project
+    return None
+
+
+def timed(fn, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10000, help="Number of synthetic project files")
+    parser.add_argument("--legacy-repeat", type=int, default=1, help="Repetitions of the legacy full-scan reads")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="project_store_bench_")
+    try:
+        print(f"Writing {args.files} synthetic projects to {directory}...")
+        write_projects(directory, args.files)
+        title = f"Synthetic Project {args.files // 2}"
+
+        load_time, store = timed(lambda: ProjectStoreService(projects_dir=directory, refresh_interval=0.0))
+        print(f"Initial load (parse all files):       {load_time * 1000:10.1f} ms")
+
+        legacy_time, _ = timed(lambda: legacy_get_by_title(directory, title), args.legacy_repeat)
+        print(f"Legacy get_project_by_title:           {legacy_time * 1000:10.1f} ms")
+
+        # refresh_interval=0 forces a stat() scan on every read (worst case)
+        scan_time, project = timed(lambda: store.get_project_by_title(title), 5)
+        assert project and project["title"] == title
+        print(f"Indexed get_project_by_title (+scan):  {scan_time * 1000:10.1f} ms")
+
+        store.refresh_interval = 3600
+        lookup_time, _ = timed(lambda: store.get_project_by_title(title), 10000)
+        print(f"Indexed get_project_by_title (cached): {lookup_time * 1e6:10.1f} us")
+
+        tech_time, matches = timed(lambda: store.get_projects_by_technology("onnx"), 100)
+        print(f"get_projects_by_technology('onnx'):    {tech_time * 1000:10.2f} ms  ({len(matches)} matches)")
+
+        # Edit one file and measure an incremental refresh
+        edited = os.path.join(directory, "synthetic_project_0.yaml")
+        with open(edited, "a") as f:
+            f.write("impact: edited\n")
+        refresh_time, changed = timed(store.refresh)
+        assert changed
+        print(f"Incremental refresh (1 changed file):  {refresh_time * 1000:10.1f} ms")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark API cold start: time from launching uvicorn to the first /health response.
+
+Starts `uvicorn app.main:app` in a subprocess and polls /api/health, then
+follows the background service warmup through /api/admin/services. For
+comparison, "eager" times a fresh interpreter that imports the API and
+builds every service before it could serve a request, which is what the
+server did before services were built lazily.
+
+Usage:
+    python -m bench.startup --runs 3
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+EAGER = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import app.main\n"
+    "from app.core.container import get_container\n"
+    "for name in get_container().names:\n"
+    "    get_container().get(name)\n"
+    "print((time.perf_counter() - start) * 1000)\n"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def poll(client: httpx.Client, url: str, ready, timeout: float) -> float:
+    """Poll url until ready(response) holds; return the time it happened (perf_counter)."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            response = client.get(url)
+            if ready(response):
+                return time.perf_counter()
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} not ready after {timeout} s")
+
+
+def cold_start(timeout: float):
+    """Return (ms to first /health, ms until warmup is done, slowest service build ms)."""
+    port = free_port()
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench-key")}
+    base = f"http://127.0.0.1:{port}/api"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=project_root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        with httpx.Client(timeout=5.0) as client:
+            healthy = poll(client, f"{base}/health", lambda r: r.status_code == 200, timeout)
+            warm = poll(client, f"{base}/admin/services",
+                        lambda r: r.status_code == 200 and r.json()["warmup"] == "done", timeout)
+            services = client.get(f"{base}/admin/services").json()["services"]
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    slowest = max(services.items(), key=lambda item: item[1].get("build_ms", 0.0))
+    return (healthy - start) * 1000, (warm - start) * 1000, slowest
+
+
+def eager_start() -> float:
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "bench-key")}
+    result = subprocess.run([sys.executable, "-c", EAGER], cwd=project_root, env=env,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Server cold starts to measure")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the server")
+    args = parser.parse_args()
+
+    first_health, warm, slowest = [], [], None
+    for _ in range(args.runs):
+        health_ms, warm_ms, slowest = cold_start(args.timeout)
+        first_health.append(health_ms)
+        warm.append(warm_ms)
+    eager = [eager_start() for _ in range(args.runs)]
+
+    print(f"{'':<36}{'median ms':>12}{'min ms':>10}")
+    print(f"{'launch -> first /health':<36}{statistics.median(first_health):12.1f}{min(first_health):10.1f}")
+    print(f"{'launch -> warmup done':<36}{statistics.median(warm):12.1f}{min(warm):10.1f}")
+    print(f"{'eager: import + build all services':<36}{statistics.median(eager):12.1f}{min(eager):10.1f}")
+    name, stats = slowest
+    print(f"\nSlowest service build: {name} ({stats.get('build_ms', 0.0):.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite covering the service hot paths.
+
+Every chat model and embeddings client the services obtain from the LLM
+gateway is replaced by the deterministic fakes in bench/fakes.py, so the
+suite runs on air-gapped hosts without an API key. Scenarios:
+
+    rank_projects    RelevanceRanker.rank_projects (embeddings + project index)
+    dedup_resume     ResumeWriterService.generate_tailored_resume_with_deduplication
+    score_resume     ResumeScorerService.score_resume, tier 1 (keywords + LLM feedback)
+    upload_resume    ResumeParserService.parse_docx + RAGService.create_vector_store
+    export           ExportService.export_to_docx / _pdf / _json
+    cover_letter     CoverLetterWriterService.generate_cover_letter
+
+Each iteration uses a new job description, so response caches do not hide
+the work (the persistent LLM response cache is disabled unless --warm-caches
+is given). Per scenario the suite reports the latency distribution, LLM
+calls, tokens and token throughput, embedding requests, and the mean time
+per pipeline stage taken from the request traces.
+
+Fake latency defaults to zero, which measures the local CPU cost of each
+path; pass distributions to model the API, e.g. --chat-latency
+lognormal:0.8:0.5 --tokens-per-second 60. All sampling is seeded.
+
+Results are written as JSON (bench/results/<commit>.json by default);
+--compare prints the change against an earlier result file.
+
+Usage:
+    python -m bench.suite
+    python -m bench.suite --iterations 50 --scenario dedup_resume --scenario score_resume
+    python -m bench.suite --chat-latency lognormal:0.8:0.5 --tokens-per-second 60 --concurrency 8
+    python -m bench.suite --compare bench/results/3738052.json --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from app.core import tracing
+from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
+from bench.fakes import FakeChatModel, FakeEmbeddings, Latency
+
+RESULTS_DIR = project_root / "bench" / "results"
+SCHEMA_VERSION = 1
+
+JOB_JSON = json.dumps({
+    "job_title": "Machine Learning Engineer",
+    "company": "Example Labs",
+    "required_skills": ["Python", "PyTorch", "Docker"],
+    "preferred_skills": ["ONNX", "Kubernetes"],
+    "tools_technologies": ["PyTorch", "ONNX", "CUDA"],
+    "responsibilities": ["Train and deploy models", "Optimize inference latency"],
+    "qualifications": ["MS in Computer Science"],
+    "industry_focus": "machine learning",
+    "experience_level": "Mid",
+    "keywords": ["deep learning", "edge deployment"]
+})
+FEEDBACK_JSON = json.dumps({
+    "llm_score": 78,
+    "overall_feedback": "Strong ML background; quantify the deployment impact.",
+    "section_feedback": {"summary": "Lead with inference work.", "skills": "Group by domain.",
+                         "projects": "Add latency numbers."},
+    "ats_tips": ["Mirror the job title", "List ONNX explicitly"]
+})
+# Replies for prompts that must be parsed as JSON; everything else gets hash-derived prose
+RESPONSES = [("parsing job descriptions", JOB_JSON), ("resume optimization engine", FEEDBACK_JSON)]
+
+RESUME_DATA = {
+    "summary": "Machine learning engineer focused on efficient inference for edge devices.",
+    "skills": ["Python", "PyTorch", "ONNX", "Docker", "CUDA", "Kubernetes"],
+    "experience": [{"title": "ML Engineer", "company": "Acme", "description": "Cut model latency by 40% with quantization."}],
+    "projects": [{"title": "Sparse CNN training", "description": "Dynamic sparsity for CNNs on GPUs."},
+                 {"title": "Edge detector", "description": "Real-time object detection on FPGA."}],
+    "education": [{"degree": "MS Computer Science", "institution": "State University"}]
+}
+SECTIONS = ["summary", "research", "projects", "experience", "skills"]
+
+
+def job_description(i: int) -> str:
+    return (f"Posting #{i}: Machine Learning Engineer at Example Labs. Train and deploy PyTorch models, "
+            f"export them to ONNX and optimize inference latency on edge devices. Required: Python, "
+            f"PyTorch, Docker. Preferred: Kubernetes, CUDA.")
+
+
+class Fakes:
+    """The fake models installed in the gateway, with their combined counters."""
+
+    def __init__(self, args, tmp_dir: Path):
+        self.args = args
+        self.tmp_dir = tmp_dir
+        self.chat_models: List[FakeChatModel] = []
+        self.embeddings: List[FakeEmbeddings] = []
+
+    def chat(self, model: str, temperature: float) -> FakeChatModel:
+        chat_model = FakeChatModel(
+            model_name=f"fake-{model}", latency=Latency.parse(self.args.chat_latency, seed=self.args.seed),
+            tokens_per_second=self.args.tokens_per_second, reply_words=self.args.reply_words, responses=RESPONSES
+        )
+        self.chat_models.append(chat_model)
+        return chat_model
+
+    def embedder(self, model: str = None) -> FakeEmbeddings:
+        embeddings = FakeEmbeddings(dim=self.args.embedding_dim, model=f"fake-{model}",
+                                    latency=Latency.parse(self.args.embedding_latency, seed=self.args.seed),
+                                    seconds_per_text=self.args.seconds_per_text)
+        self.embeddings.append(embeddings)
+        return embeddings
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            "llm_calls": sum(m.calls for m in self.chat_models),
+            "prompt_tokens": sum(m.prompt_tokens for m in self.chat_models),
+            "completion_tokens": sum(m.completion_tokens for m in self.chat_models),
+            "embedding_requests": sum(e.requests for e in self.embeddings),
+            "embedded_texts": sum(e.documents_embedded + e.queries_embedded for e in self.embeddings),
+        }
+
+
+# name -> setup(fakes) returning the coroutine function run once per iteration
+Scenario = Callable[[Fakes], Callable[[int], Awaitable[Any]]]
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str):
+    def register(setup: Scenario) -> Scenario:
+        SCENARIOS[name] = setup
+        return setup
+    return register
+
+
+@scenario("rank_projects")
+def rank_projects(fakes: Fakes):
+    from app.services.embedding_cache import EmbeddingCache
+    from app.services.project_store import ProjectStoreService
+    from app.services.relevance_ranker import RelevanceRanker
+
+    store = ProjectStoreService()
+    ranker = RelevanceRanker(embeddings=fakes.embedder(), project_store=store,
+                             embedding_cache=EmbeddingCache(str(fakes.tmp_dir / "embeddings.sqlite3")))
+    projects = store.get_all_projects()
+
+    async def run(i: int):
+        return await ranker.rank_projects(job_description(i), projects, top_k=5)
+    return run
+
+
+@scenario("dedup_resume")
+def dedup_resume(fakes: Fakes):
+    from app.services.project_store import ProjectStoreService
+    from app.services.resume_writer import ResumeWriterService
+
+    writer = ResumeWriterService(ProjectStoreService())
+
+    async def run(i: int):
+        return await writer.generate_tailored_resume_with_deduplication(job_description(i), SECTIONS)
+    return run
+
+
+@scenario("score_resume")
+def score_resume(fakes: Fakes):
+    from app.services.resume_scorer import ResumeScorerService
+
+    scorer = ResumeScorerService()
+
+    async def run(i: int):
+        return await scorer.score_resume(job_description(i), RESUME_DATA, tier=1)
+    return run
+
+
+@scenario("upload_resume")
+def upload_resume(fakes: Fakes):
+    from docx import Document
+    from app.services.rag_service import RAGService
+    from app.services.resume_parser_service import ResumeParserService
+
+    resume_path = fakes.tmp_dir / "resume.docx"
+    document = Document()
+    document.add_paragraph("Jordan Example")
+    document.add_paragraph("jordan@example.com | +1 555 0100")
+    for heading, lines in [
+        ("Summary", [RESUME_DATA["summary"]]),
+        ("Experience", ["ML Engineer, Acme (2021-2024)", "Cut model latency by 40% with quantization."] * 3),
+        ("Education", ["MS Computer Science, State University, 2021"]),
+        ("Skills", [", ".join(RESUME_DATA["skills"])]),
+        ("Projects", [f"{p['title']}: {p['description']}" for p in RESUME_DATA["projects"]] * 3),
+    ]:
+        document.add_paragraph(heading)
+        for line in lines:
+            document.add_paragraph(line)
+    document.save(str(resume_path))
+
+    parser = ResumeParserService()
+    rag_service = RAGService(embedding_model=fakes.embedder(), vector_store_path=str(fakes.tmp_dir / "tenants"))
+
+    async def run(i: int):
+        with tracing.span("parse_docx", "parse"):
+            parsed = parser.parse_docx(str(resume_path))
+        # A new tenant per iteration, so every upload builds its index
+        return await rag_service.create_vector_store(parsed, tenant_id=f"bench-{i}")
+    return run
+
+
+@scenario("export")
+def export(fakes: Fakes):
+    from app.services.export_service import ExportService
+
+    service = ExportService()
+    sections = {name: (value if isinstance(value, str) else json.dumps(value)) for name, value in RESUME_DATA.items()}
+
+    async def run(i: int):
+        service.export_to_docx(sections, f"bench_{i}")
+        service.export_to_pdf(sections, f"bench_{i}")
+        service.export_to_json(sections, f"bench_{i}")
+    return run
+
+
+@scenario("cover_letter")
+def cover_letter(fakes: Fakes):
+    from app.services.cover_letter_writer import CoverLetterWriterService
+
+    writer = CoverLetterWriterService()
+
+    async def run(i: int):
+        return await writer.generate_cover_letter(job_description(i), "Jordan Example", RESUME_DATA,
+                                                  "Example Labs", "Machine Learning Engineer")
+    return run
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linearly interpolated percentile, q in [0, 100]."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def distribution(values: List[float]) -> Dict[str, float]:
+    return {
+        "mean": round(statistics.fmean(values), 3),
+        "stdev": round(statistics.stdev(values), 3) if len(values) > 1 else 0.0,
+        "min": round(min(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p90": round(percentile(values, 90), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(max(values), 3),
+    }
+
+
+async def run_scenario(name: str, fakes: Fakes, args) -> Dict[str, Any]:
+    run = SCENARIOS[name](fakes)
+    counter = iter(range(10 ** 9))
+    for _ in range(args.warmup):
+        await run(next(counter))
+
+    before = fakes.counters()
+    latencies: List[float] = []
+    stage_ms: Dict[str, float] = defaultdict(float)
+    failures = 0
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def iteration(i: int):
+        nonlocal failures
+        async with semaphore:
+            with tracing.trace(f"bench {name}") as iteration_trace:
+                started = time.perf_counter()
+                try:
+                    await run(i)
+                except Exception as e:
+                    failures += 1
+                    print(f"  {name} iteration {i} failed: {str(e)}")
+                latencies.append((time.perf_counter() - started) * 1000)
+            for stage, totals in iteration_trace.summary()["stages"].items():
+                stage_ms[stage] += totals["total_ms"]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(iteration(next(counter)) for _ in range(args.iterations)))
+    wall_seconds = time.perf_counter() - started
+    counters = {key: value - before[key] for key, value in fakes.counters().items()}
+
+    return {
+        "iterations": args.iterations,
+        "failures": failures,
+        "latency_ms": distribution(latencies),
+        "throughput_per_s": round(args.iterations / wall_seconds, 2),
+        **counters,
+        "completion_tokens_per_s": round(counters["completion_tokens"] / wall_seconds, 1),
+        "stages_mean_ms": {stage: round(total / args.iterations, 3) for stage, total in sorted(stage_ms.items())},
+    }
+
+
+def git_revision() -> Dict[str, Any]:
+    def git(*command):
+        result = subprocess.run(["git", *command], cwd=project_root, capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(status)}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print p50/p95 changes against a baseline result; return the regressions."""
+    regressions = []
+    print(f"\nCompared with {baseline['revision']['commit']} ({baseline['timestamp']}):")
+    if baseline["config"] != results["config"]:
+        print("  note: the runs used different settings; latencies are not directly comparable")
+    print(f"{'scenario':<16}{'p50 ms':>22}{'p95 ms':>24}")
+    for name, result in results["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            print(f"{name:<16}{'(new)':>22}")
+            continue
+        cells = []
+        for key in ("p50", "p95"):
+            before, after = old["latency_ms"][key], result["latency_ms"][key]
+            change = (after - before) / before if before else 0.0
+            cells.append(f"{before:9.2f} -> {after:9.2f} {change:+6.1%}")
+            if change > threshold:
+                regressions.append(f"{name} {key}: {before:.2f} -> {after:.2f} ms ({change:+.1%})")
+        print(f"{name:<16}{cells[0]:>26}{cells[1]:>28}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to run (repeatable)")
+    parser.add_argument("--iterations", type=int, default=20, help="Measured iterations per scenario")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured iterations per scenario")
+    parser.add_argument("--concurrency", type=int, default=1, help="Iterations in flight at once")
+    parser.add_argument("--chat-latency", default="0",
+                        help='Time to first token: seconds or "distribution:mean[:spread]"')
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="Fake completion throughput (0: instant)")
+    parser.add_argument("--reply-words", type=int, default=120, help="Words per generated fake completion")
+    parser.add_argument("--embedding-latency", default="0", help='Per request: seconds or "distribution:mean[:spread]"')
+    parser.add_argument("--seconds-per-text", type=float, default=0.0, help="Extra embedding latency per text")
+    parser.add_argument("--embedding-dim", type=int, default=256, help="Fake embedding dimensions")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the latency distributions")
+    parser.add_argument("--warm-caches", action="store_true", help="Leave the persistent LLM response cache on")
+    parser.add_argument("--output", help="Result file (default: bench/results/<commit>.json)")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when --compare finds a regression")
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="resume-bench-"))
+    settings.paths.exports_dir = str(tmp_dir / "exports")
+    if not args.warm_caches:
+        settings.cache.llm_responses.enabled = False
+
+    fakes = Fakes(args, tmp_dir)
+    gateway = get_llm_gateway()
+    gateway.set_override(chat_factory=fakes.chat, embeddings_factory=fakes.embedder)
+
+    names = args.scenario or list(SCENARIOS)
+    results = {
+        "schema": SCHEMA_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "host": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {
+            "iterations": args.iterations, "warmup": args.warmup, "concurrency": args.concurrency,
+            "chat_latency": Latency.parse(args.chat_latency, args.seed).describe(),
+            "tokens_per_second": args.tokens_per_second, "reply_words": args.reply_words,
+            "embedding_latency": Latency.parse(args.embedding_latency, args.seed).describe(),
+            "seconds_per_text": args.seconds_per_text, "embedding_dim": args.embedding_dim,
+            "warm_caches": args.warm_caches,
+        },
+        "scenarios": {},
+    }
+    try:
+        for name in names:
+            result = asyncio.run(run_scenario(name, fakes, args))
+            results["scenarios"][name] = result
+            latency = result["latency_ms"]
+            print(f"{name:<16} p50 {latency['p50']:9.2f} ms  p95 {latency['p95']:9.2f} ms  "
+                  f"p99 {latency['p99']:9.2f} ms  {result['throughput_per_s']:8.2f}/s  "
+                  f"LLM calls {result['llm_calls']:4d}  tokens {result['prompt_tokens'] + result['completion_tokens']:7d}  "
+                  f"embedded {result['embedded_texts']:5d}  failures {result['failures']}")
+    finally:
+        gateway.clear_override()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{results['revision']['commit'] or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        regressions = compare(results, json.loads(Path(args.compare).read_text()), args.threshold)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Script to vendor the NLTK resources used by resume scoring into data/nltk_data.
+
+Downloads the pinned packages with the installed NLTK and records the NLTK
+version and a sha256 of every file in data/nltk_data/MANIFEST.json, so the
+app never downloads anything at runtime.
+
+Usage:
+    python scripts/vendor_nltk_data.py            # download and write the manifest
+    python scripts/vendor_nltk_data.py --verify   # check files against the manifest
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+PACKAGES = ["stopwords", "punkt"]
+DATA_DIR = os.path.join("data", "nltk_data")
+MANIFEST = os.path.join(DATA_DIR, "MANIFEST.json")
+
+
+def file_hashes(data_dir):
+    """Return {relative path: sha256} for every vendored file."""
+    hashes = {}
+    for root, _, files in os.walk(data_dir):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, data_dir).replace(os.sep, "/")
+            if relative == "MANIFEST.json":
+                continue
+            with open(path, "rb") as f:
+                hashes[relative] = hashlib.sha256(f.read()).hexdigest()
+    return dict(sorted(hashes.items()))
+
+
+def vendor(packages):
+    """Download packages into DATA_DIR and write the manifest."""
+    import nltk
+
+    for package in packages:
+        if not nltk.download(package, download_dir=DATA_DIR, quiet=True):
+            print(f"❌ Could not download NLTK package: {package}")
+            return 1
+    # Only the English stopwords list is used
+    stopwords_dir = os.path.join(DATA_DIR, "corpora", "stopwords")
+    for name in os.listdir(stopwords_dir):
+        if name != "english":
+            os.remove(os.path.join(stopwords_dir, name))
+    zipped = os.path.join(DATA_DIR, "corpora", "stopwords.zip")
+    if os.path.exists(zipped):
+        os.remove(zipped)
+
+    manifest = {"nltk_version": nltk.__version__, "packages": packages, "files": file_hashes(DATA_DIR)}
+    with open(MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    print(f"✅ Vendored {', '.join(packages)} ({len(manifest['files'])} files) into {DATA_DIR}")
+    return 0
+
+
+def verify():
+    """Check vendored files against the manifest."""
+    with open(MANIFEST) as f:
+        manifest = json.load(f)
+    actual = file_hashes(DATA_DIR)
+    problems = [f"missing {path}" for path in manifest["files"] if path not in actual]
+    problems += [f"modified {path}" for path, digest in manifest["files"].items()
+                 if path in actual and actual[path] != digest]
+    problems += [f"unlisted {path}" for path in actual if path not in manifest["files"]]
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print(f"✅ {len(actual)} vendored files match {MANIFEST} (NLTK {manifest['nltk_version']})")
+    return 1 if problems else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verify", action="store_true", help="Only check files against the manifest")
+    parser.add_argument("--packages", nargs="+", default=PACKAGES, help="NLTK packages to vendor")
+    args = parser.parse_args()
+    return verify() if args.verify else vendor(args.packages)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
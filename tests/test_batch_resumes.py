@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for batched multi-job resume generation.
+Uses slow local LLMs, so no OpenAI calls are made.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+from langchain_core.messages import BaseMessage
+
+from app.core import llm_cache
+from app.core.config import settings
+from app.core.job_cache import job_analysis_cache
+from app.services.project_store import ProjectStoreService
+from app.services.resume_writer import ResumeWriterService
+from bench.fakes import SlowFakeChatModel
+
+SECTIONS = ["summary", "research", "projects", "skills"]
+JOB_JSON = json.dumps({"job_title": "ML Engineer", "required_skills": ["Python", "PyTorch"],
+                       "preferred_skills": ["ONNX"], "industry_focus": "machine learning"})
+
+
+class JobParsingFakeChatModel(SlowFakeChatModel):
+    """Returns parsed-job JSON, failing for job descriptions that contain FAIL."""
+
+    reply: str = JOB_JSON
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any):
+        if "FAIL" in messages[-1].content:
+            self.calls += 1
+            raise RuntimeError("upstream error")
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+
+class CountingProjectStore(ProjectStoreService):
+    def __init__(self):
+        super().__init__()
+        self.project_loads = 0
+        self.skills_loads = 0
+
+    def get_all_projects(self):
+        self.project_loads += 1
+        return super().get_all_projects()
+
+    def get_master_skills_as_text(self):
+        self.skills_loads += 1
+        return super().get_master_skills_as_text()
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_llm_caches(monkeypatch, tmp_path):
+    # A private response cache under tmp_path, so nothing is written to data/
+    monkeypatch.setattr(llm_cache, "_default_cache", llm_cache.LLMResponseCache(str(tmp_path / "responses.sqlite3")))
+    monkeypatch.setattr(settings.cache.llm_responses, "enabled", False)
+    job_analysis_cache.clear()
+    yield
+    job_analysis_cache.clear()
+
+
+def _writer(latency: float):
+    store = CountingProjectStore()
+    writer = ResumeWriterService(store)
+    writer.llm = SlowFakeChatModel(latency=latency)
+    writer.job_parser.llm = JobParsingFakeChatModel(latency=latency)
+    return writer, store
+
+
+def test_batch_reports_partial_failures_in_input_order():
+    writer, store = _writer(latency=0.01)
+    jobs = [f"ML engineer opening #{i}" for i in range(6)]
+    jobs[2] = "FAIL: malformed posting"
+
+    batch = asyncio.run(writer.generate_resumes_batch(jobs, SECTIONS))
+
+    assert [result["index"] for result in batch["results"]] == list(range(6))
+    assert batch["succeeded"] == 5 and batch["failed"] == 1
+    assert batch["results"][2]["status"] == "error"
+    assert "upstream error" in batch["results"][2]["error"]
+    assert set(batch["results"][0]["sections"]) == set(SECTIONS)
+    # Projects and master skills are read once for the whole batch
+    assert store.project_loads == 1
+    assert store.skills_loads == 1
+
+
+def test_batch_shares_one_bounded_pool_of_section_calls():
+    latency = 0.05
+    writer, _ = _writer(latency=latency)
+    jobs = [f"ML engineer opening #{i}" for i in range(20)]
+
+    in_flight = peak = 0
+    original = writer._run_sections_concurrently
+
+    async def tracking_run(section_plan, max_concurrency=None, semaphore=None):
+        wrapped = []
+        for section, generator, args in section_plan:
+            async def tracked(*call_args, _generator=generator):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await _generator(*call_args)
+                finally:
+                    in_flight -= 1
+            wrapped.append((section, tracked, args))
+        return await original(wrapped, max_concurrency, semaphore)
+
+    writer._run_sections_concurrently = tracking_run
+    start = time.perf_counter()
+    batch = asyncio.run(writer.generate_resumes_batch(jobs, SECTIONS, max_concurrency=8))
+    elapsed = time.perf_counter() - start
+
+    assert batch["succeeded"] == len(jobs)
+    assert peak == 8
+    # 20 jobs x 4 sections through 8 slots, plus one round of concurrent parsing
+    assert elapsed < latency * (len(jobs) * len(SECTIONS) / 8 + 1) * 2
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the deterministic fakes and the offline benchmark suite.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
+from bench import suite
+from bench.fakes import FakeChatModel, FakeEmbeddings, Latency
+
+
+def test_fakes_are_deterministic():
+    model = FakeChatModel(reply_words=12, responses=[("as JSON", '{"ok": true}')])
+    first, again = model.invoke("Describe the project"), model.invoke("Describe the project")
+    other = model.invoke("Describe another project")
+
+    assert first.content == again.content != other.content
+    assert len(first.content.split()) == 12
+    assert first.usage_metadata["output_tokens"] == 12
+    assert json.loads(model.invoke("Answer as JSON").content) == {"ok": True}
+
+    embeddings = FakeEmbeddings(dim=32)
+    vector = embeddings.embed_query("python")
+    assert vector == embeddings.embed_documents(["python"])[0]
+    assert math.isclose(sum(value * value for value in vector), 1.0)
+
+    samples = [Latency.parse("lognormal:0.5:0.5", seed=7).sample() for _ in range(2)]
+    assert samples[0] == samples[1] > 0
+
+
+def test_streaming_honours_time_to_first_token_and_throughput():
+    model = FakeChatModel(latency=Latency(0.05), tokens_per_second=200, reply_words=20)
+
+    async def stream():
+        started = time.perf_counter()
+        chunks = []
+        async for chunk in model.astream("Summarize"):
+            chunks.append((time.perf_counter() - started, chunk))
+        return chunks
+
+    chunks = asyncio.run(stream())
+
+    assert len(chunks) == 20
+    assert chunks[0][0] >= 0.05
+    assert chunks[-1][0] >= 0.05 + 19 / 200
+    assert "".join(chunk.content for _, chunk in chunks) == model.invoke("Summarize").content
+
+
+def test_suite_scenarios_run_offline(tmp_path):
+    args = argparse.Namespace(chat_latency="0", tokens_per_second=0.0, reply_words=120, embedding_latency="0",
+                              seconds_per_text=0.0, embedding_dim=64, seed=0, iterations=2, warmup=0,
+                              concurrency=1)
+    fakes = suite.Fakes(args, tmp_path)
+    gateway = get_llm_gateway()
+    gateway.set_override(chat_factory=fakes.chat, embeddings_factory=fakes.embedder)
+    enabled = settings.cache.llm_responses.enabled
+    settings.cache.llm_responses.enabled = False
+    try:
+        scored = asyncio.run(suite.run_scenario("score_resume", fakes, args))
+        ranked = asyncio.run(suite.run_scenario("rank_projects", fakes, args))
+    finally:
+        settings.cache.llm_responses.enabled = enabled
+        gateway.clear_override()
+
+    assert scored["failures"] == 0 and scored["llm_calls"] == 2
+    assert scored["completion_tokens"] > 0
+    assert scored["latency_ms"]["p50"] <= scored["latency_ms"]["max"]
+    assert ranked["failures"] == 0 and ranked["embedded_texts"] > 0
+    assert "vector_search" in ranked["stages_mean_ms"]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed project embedding cache.
+Uses a deterministic local embedder, so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.services.embedding_cache import EmbeddingCache
+from app.services.relevance_ranker import RelevanceRanker
+from bench.fakes import CountingFakeEmbeddings
+
+
+def _sample_projects():
+    return [
+        {"title": f"Project {i}", "description": f"Edge AI pruning work {i}", "technologies": ["PyTorch", "ONNX"]}
+        for i in range(5)
+    ]
+
+
+def test_second_ranking_call_embeds_no_projects(tmp_path):
+    fake = CountingFakeEmbeddings()
+    cache = EmbeddingCache(cache_path=str(tmp_path / "cache.sqlite3"), max_memory_entries=32)
+    ranker = RelevanceRanker(embeddings=fake, embedding_cache=cache)
+    projects = _sample_projects()
+
+    asyncio.run(ranker.rank_projects("ML engineer for edge AI", projects))
+    assert fake.documents_embedded == len(projects)
+
+    asyncio.run(ranker.rank_projects("Research scientist, model compression", projects))
+    assert fake.documents_embedded == len(projects)
+    assert fake.queries_embedded == 2
+
+    # A second ranker sharing the cache is served entirely from memory
+    other_ranker = RelevanceRanker(embeddings=fake, embedding_cache=cache)
+    asyncio.run(other_ranker.rank_projects("ML engineer for edge AI", projects))
+    assert fake.documents_embedded == len(projects)
+    assert cache.stats()["hits"] == len(projects)
+    assert cache.stats()["misses"] == len(projects)
+
+
+def test_only_edited_projects_are_re_embedded(tmp_path):
+    fake = CountingFakeEmbeddings()
+    cache = EmbeddingCache(cache_path=str(tmp_path / "cache.sqlite3"))
+    ranker = RelevanceRanker(embeddings=fake, embedding_cache=cache)
+    projects = _sample_projects()
+
+    asyncio.run(ranker.rank_projects("ML engineer", projects))
+    projects[2]["description"] = "Rewritten description"
+    projects.append({"title": "New project", "technologies": ["CUDA"]})
+    asyncio.run(ranker.rank_projects("ML engineer", projects))
+
+    assert fake.documents_embedded == 5 + 2
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    cache_path = str(tmp_path / "cache.sqlite3")
+    projects = _sample_projects()
+
+    first = CountingFakeEmbeddings()
+    asyncio.run(RelevanceRanker(embeddings=first, embedding_cache=EmbeddingCache(cache_path)).rank_projects("ML", projects))
+
+    second = CountingFakeEmbeddings()
+    restarted_cache = EmbeddingCache(cache_path)
+    asyncio.run(RelevanceRanker(embeddings=second, embedding_cache=restarted_cache).rank_projects("ML", projects))
+
+    assert second.documents_embedded == 0
+    assert restarted_cache.stats()["disk_hits"] == len(projects)
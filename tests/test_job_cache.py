@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide job-description analysis cache.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+
+from app.core.cache import AsyncTTLCache
+from app.core.job_cache import job_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_concurrent_requests_share_one_call():
+    cache = AsyncTTLCache(max_size=8, ttl_seconds=60)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"job_title": "ML Engineer"}
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("jd", compute) for _ in range(10)))
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(result == {"job_title": "ML Engineer"} for result in results)
+    assert cache.stats()["coalesced"] == 9
+
+
+def test_entries_expire_and_are_evicted():
+    clock = FakeClock()
+    cache = AsyncTTLCache(max_size=2, ttl_seconds=10, clock=clock)
+
+    async def value(v):
+        return v
+
+    asyncio.run(cache.get_or_compute("a", lambda: value(1)))
+    clock.now = 11
+    assert cache.get("a") is None
+
+    for key in ("a", "b", "c"):
+        asyncio.run(cache.get_or_compute(key, lambda: value(key)))
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_failures_are_not_cached():
+    cache = AsyncTTLCache()
+
+    async def fail():
+        raise ValueError("LLM unavailable")
+
+    with pytest.raises(ValueError):
+        asyncio.run(cache.get_or_compute("jd", fail))
+    assert len(cache) == 0
+
+
+def test_copy_on_read_protects_cached_value():
+    cache = AsyncTTLCache(copy_on_read=True)
+
+    async def compute():
+        return {"required_skills": ["Python"]}
+
+    first = asyncio.run(cache.get_or_compute("jd", compute))
+    first["required_skills"].append("Mutated")
+    second = asyncio.run(cache.get_or_compute("jd", compute))
+
+    assert second == {"required_skills": ["Python"]}
+
+
+def test_key_ignores_whitespace_but_not_model_or_prompt_version():
+    base = job_cache_key("parse", "ML  Engineer\n needed ", "gpt-4", "1")
+    assert base == job_cache_key("parse", "ML Engineer needed", "gpt-4", "1")
+    assert base != job_cache_key("parse", "ML Engineer needed", "gpt-4o", "1")
+    assert base != job_cache_key("parse", "ML Engineer needed", "gpt-4", "2")
+
+
+def test_cancelled_leader_does_not_fail_coalesced_callers():
+    cache = AsyncTTLCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"job_title": "ML Engineer"}
+
+    async def run():
+        leader = asyncio.create_task(cache.get_or_compute("jd", compute))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_compute("jd", compute)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        # The first caller's client disconnects
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        return leader, results
+
+    leader, results = asyncio.run(run())
+
+    assert leader.cancelled()
+    assert calls == 1
+    assert results == [{"job_title": "ML Engineer"}] * 3
+    assert cache.get("jd") == {"job_title": "ML Engineer"}
+
+
+def test_analysis_text_fallback_is_not_cached():
+    from app.core.job_cache import job_analysis_cache
+    from app.services.job_analysis_service import JobAnalysisService
+    from bench.fakes import SlowFakeChatModel
+
+    service = JobAnalysisService()
+    service.llm = SlowFakeChatModel(model_name="fallback-fake", latency=0, reply="Not JSON at all")
+    job_analysis_cache.clear()
+
+    first = asyncio.run(service.analyze_job_description("Fallback posting"))
+    second = asyncio.run(service.analyze_job_description("Fallback posting"))
+
+    assert first == second == {"analysis": "Not JSON at all"}
+    assert service.llm.calls == 2
+    assert len(job_analysis_cache) == 0
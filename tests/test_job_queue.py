@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed background job queue.
+Handlers are local coroutines, so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.job_queue import OWNER, JobQueue
+
+
+async def _wait_until_finished(queue, job_id, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_submitted_job_returns_id_and_result_is_pollable(tmp_path):
+    async def scenario():
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=2)
+
+        async def echo(payload):
+            await asyncio.sleep(0.01)
+            return {"sections": {"summary": payload["job_description"].upper()}}
+
+        queue.register("resume", echo)
+        job_id = await queue.submit("resume", {"job_description": "ml engineer"})
+        assert queue.get(job_id)["status"] in ("queued", "running")
+
+        job = await _wait_until_finished(queue, job_id)
+        await queue.stop()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"sections": {"summary": "ML ENGINEER"}}
+    assert job["attempts"] == 1
+    assert job["wait_ms"] is not None and job["service_ms"] >= 0
+
+
+def test_failed_job_reports_error_and_unknown_kind_is_rejected(tmp_path):
+    async def scenario():
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=1)
+
+        async def broken(payload):
+            raise ValueError("Error generating resume: model unavailable")
+
+        queue.register("resume", broken)
+        job = await _wait_until_finished(queue, await queue.submit("resume", {}))
+        try:
+            await queue.submit("poem", {})
+            rejected = False
+        except ValueError:
+            rejected = True
+        await queue.stop()
+        return job, rejected, queue.get("missing")
+
+    job, rejected, missing = asyncio.run(scenario())
+    assert job["status"] == "failed"
+    assert "model unavailable" in job["error"]
+    assert rejected
+    assert missing is None
+
+
+def test_workers_bound_parallelism_and_stats_report_depth_and_timings(tmp_path):
+    async def scenario():
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=3)
+        active, peak = 0, 0
+
+        async def work(payload):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return payload
+
+        queue.register("resume", work)
+        job_ids = [await queue.submit("resume", {"n": i}) for i in range(9)]
+        depth_after_submit = queue.stats()["queue_depth"]
+        jobs = [await _wait_until_finished(queue, job_id) for job_id in job_ids]
+        stats = queue.stats()
+        await queue.stop()
+        return jobs, peak, depth_after_submit, stats
+
+    jobs, peak, depth_after_submit, stats = asyncio.run(scenario())
+    assert [job["result"]["n"] for job in jobs] == list(range(9))
+    assert peak == 3
+    assert depth_after_submit == 9
+    assert stats["queue_depth"] == 0 and stats["jobs"]["succeeded"] == 9
+    assert stats["wait_time"]["count"] == 9
+    # Later jobs wait for earlier ones to free a worker
+    assert stats["wait_time"]["max_ms"] >= 20
+    assert stats["service_time"]["p50_ms"] >= 15
+
+
+def test_unfinished_jobs_resume_after_restart(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    release = None
+
+    async def first_process():
+        nonlocal release
+        release = asyncio.Event()
+        queue = JobQueue(db_path=db_path, workers=1)
+
+        async def blocked(payload):
+            await release.wait()
+            return payload
+
+        queue.register("resume", blocked)
+        job_ids = [await queue.submit("resume", {"n": i}) for i in range(3)]
+        await asyncio.sleep(0.02)
+        assert queue.get(job_ids[0])["status"] == "running"
+        # Simulate a worker restart while one job runs and two are queued
+        await queue.stop()
+        return job_ids
+
+    async def second_process(job_ids):
+        queue = JobQueue(db_path=db_path, workers=2)
+
+        async def finish(payload):
+            return {"n": payload["n"], "resumed": True}
+
+        queue.register("resume", finish)
+        await queue.start()
+        jobs = [await _wait_until_finished(queue, job_id) for job_id in job_ids]
+        recovered = queue.stats()["recovered"]
+        await queue.stop()
+        return jobs, recovered
+
+    job_ids = asyncio.run(first_process())
+    jobs, recovered = asyncio.run(second_process(job_ids))
+    assert recovered == 3
+    assert all(job["status"] == "succeeded" and job["result"]["resumed"] for job in jobs)
+    assert jobs[0]["attempts"] == 2
+
+
+def test_job_interrupted_too_often_is_marked_failed(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+
+    async def interrupted_run(submit):
+        queue = JobQueue(db_path=db_path, workers=1, max_attempts=2)
+
+        async def hang(payload):
+            await asyncio.Event().wait()
+
+        queue.register("resume", hang)
+        job_id = await queue.submit("resume", {}) if submit else None
+        await queue.start()
+        await asyncio.sleep(0.02)
+        await queue.stop()
+        return job_id
+
+    async def final_run(job_id):
+        queue = JobQueue(db_path=db_path, workers=1, max_attempts=2)
+        queue.register("resume", lambda payload: asyncio.sleep(0))
+        await queue.start()
+        job = await _wait_until_finished(queue, job_id)
+        await queue.stop()
+        return job
+
+    job_id = asyncio.run(interrupted_run(submit=True))
+    asyncio.run(interrupted_run(submit=False))
+    job = asyncio.run(final_run(job_id))
+    assert job["status"] == "failed"
+    assert "interrupted 2 times" in job["error"]
+
+
+def test_restart_only_requeues_jobs_of_processes_that_are_gone(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    JobQueue(db_path=db_path).stats()  # Creates the table
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    host = socket.gethostname()
+    conn = sqlite3.connect(db_path)
+    for job_id, owner in (("crashed", f"{host}:{exited.pid}:{uuid.uuid4().hex}"),
+                          # A server restarted in a container often gets its predecessor's pid
+                          ("previous_incarnation", f"{host}:{os.getpid()}:{uuid.uuid4().hex}"),
+                          ("legacy_owner", f"{host}:{exited.pid}"),
+                          ("other_process", f"{host}:{os.getppid()}:{uuid.uuid4().hex}"),
+                          ("this_process", OWNER)):
+        conn.execute("INSERT INTO jobs (id, kind, status, payload, created_at, started_at, owner) "
+                     "VALUES (?, 'resume', 'running', '{}', 0, 0, ?)", (job_id, owner))
+    conn.commit()
+    conn.close()
+
+    async def restart():
+        queue = JobQueue(db_path=db_path, workers=1)
+        queue.register("resume", lambda payload: asyncio.sleep(0, {"resumed": True}))
+        await queue.start()
+        jobs = [await _wait_until_finished(queue, job_id)
+                for job_id in ("crashed", "previous_incarnation", "legacy_owner")]
+        statuses = {job_id: queue.get(job_id)["status"] for job_id in ("other_process", "this_process")}
+        await queue.stop()
+        return jobs, statuses
+
+    jobs, statuses = asyncio.run(restart())
+    assert all(job["status"] == "succeeded" and job["result"] == {"resumed": True} for job in jobs)
+    # Jobs claimed by live processes are left to them
+    assert statuses == {"other_process": "running", "this_process": "running"}
+
+
+def test_queue_creates_no_file_until_used(tmp_path):
+    db_path = tmp_path / "jobs.sqlite3"
+    queue = JobQueue(db_path=str(db_path))
+    queue.register("resume", lambda payload: asyncio.sleep(0))
+    assert not db_path.exists()
+    assert queue.stats()["queue_depth"] == 0
+    assert db_path.exists()
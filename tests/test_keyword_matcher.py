@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the Aho-Corasick tech keyword matcher used by resume scoring.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.keyword_matcher import DEFAULT_TECH_KEYWORDS, KeywordMatcher, load_vocabulary_file
+
+
+def test_terms_match_on_whole_words_only():
+    matcher = KeywordMatcher(DEFAULT_TECH_KEYWORDS)
+    text = "Good engineers maintain Google-scale services with Go, C++17, REST APIs and CI/CD on GCP."
+
+    found = matcher.find_all(text)
+
+    assert found == ["go", "c++", "rest", "ci/cd", "gcp"]
+    # The previous substring scan also reported these
+    assert all(keyword not in found for keyword in ("ai", "api", "git"))
+
+
+def test_overlapping_and_nested_phrases_are_found_in_one_pass():
+    matcher = KeywordMatcher(["deep learning", "learning", "machine learning", "learning rate schedule", "rate"])
+
+    found = matcher.find_all("Deep   learning and machine-learning with a learning rate warmup")
+
+    assert found == ["deep learning", "learning", "machine learning", "rate"]
+
+
+def test_failure_links_recover_from_partial_phrase_matches():
+    matcher = KeywordMatcher(["vertex ai search", "ai search", "ai", "google cloud storage", "cloud"])
+
+    assert matcher.find_all("Vertex AI Search on Google Cloud") == ["ai", "vertex ai search", "ai search", "cloud"]
+    assert matcher.find_all("vertex ai pipelines") == ["ai"]
+
+
+def test_vocabulary_is_normalized_and_deduplicated():
+    matcher = KeywordMatcher(["PyTorch", "pytorch", "  Computer   Vision ", "", "+++"])
+
+    assert matcher.terms == ["pytorch", "computer vision"]
+    assert matcher.find_all("COMPUTER VISION in PyTorch") == ["computer vision", "pytorch"]
+
+
+def test_skills_file_terms_include_parenthesized_abbreviations(tmp_path):
+    skills_file = tmp_path / "skills.yaml"
+    skills_file.write_text(
+        "GenAI & NLP: OpenAI GPT APIs, Retrieval-Augmented Generation (RAG), FAISS\n"
+        "Hardware & EDA Tools:\n"
+        "  - FPGA\n"
+        "  - Vivado\n"
+    )
+
+    terms = load_vocabulary_file(str(skills_file))
+    matcher = KeywordMatcher(terms)
+
+    assert terms == ["OpenAI GPT APIs", "RAG", "Retrieval-Augmented Generation", "FAISS", "FPGA", "Vivado"]
+    assert matcher.find_all("Built RAG pipelines over FAISS on an FPGA") == ["rag", "faiss", "fpga"]
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for sparse bulk keyword coverage scoring.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.keyword_matrix import KeywordCoverageMatrix
+from app.services.resume_scorer import ResumeScorerService
+
+
+def _per_pair_scores(job_keywords, resume_keywords):
+    # The per-pair computation score_resume performs
+    return [[ResumeScorerService._calculate_keyword_match(None, job, resume)
+             for resume in resume_keywords] for job in job_keywords]
+
+
+def test_matrix_scores_match_per_pair_calculation():
+    rng = random.Random(3)
+    vocabulary = [f"term{i}" for i in range(200)]
+    job_keywords = [rng.sample(vocabulary, rng.randint(1, 60)) for _ in range(25)] + [[]]
+    resume_keywords = [rng.sample(vocabulary, rng.randint(0, 80)) for _ in range(30)]
+
+    matrix = KeywordCoverageMatrix(job_keywords, resume_keywords)
+    scores = matrix.scores()
+    expected = _per_pair_scores(job_keywords, resume_keywords)
+
+    assert scores.shape == (26, 30)
+    for job_index, row in enumerate(expected):
+        for resume_index, (score, matched, missing) in enumerate(row):
+            assert scores[job_index, resume_index] == score
+    # A job without keywords scores 0 against everything
+    assert not scores[-1].any()
+
+
+def test_pair_keywords_split_job_keywords_into_matched_and_missing():
+    job_keywords = [["pytorch", "onnx", "cuda", "docker"], ["react", "aws"]]
+    resume_keywords = [["pytorch", "cuda", "python"], ["aws", "docker"]]
+
+    matrix = KeywordCoverageMatrix(job_keywords, resume_keywords)
+
+    assert matrix.scores().tolist() == [[50, 25], [0, 50]]
+    assert matrix.pair_keywords(0, 0) == (["cuda", "pytorch"], ["docker", "onnx"])
+    assert matrix.pair_keywords(1, 1) == (["aws"], ["react"])
+    assert matrix.pair_keywords(1, 0) == ([], ["aws", "react"])
+
+
+def test_duplicate_keywords_count_once():
+    matrix = KeywordCoverageMatrix([["sql", "sql", "git"]], [["sql", "sql"]])
+
+    assert matrix.job_sizes.tolist() == [2]
+    assert matrix.scores().tolist() == [[50]]
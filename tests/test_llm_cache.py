@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-tier LLM response cache.
+Uses a local chat model, so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.core.llm_cache import LLMResponseCache
+from bench.fakes import SlowFakeChatModel
+
+PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are an expert resume writer."),
+    ("user", "Section: {section_name}\nContent: {content}")
+])
+INPUTS = {"section_name": "skills", "content": "Python, PyTorch"}
+
+
+class WarmFakeChatModel(SlowFakeChatModel):
+    """Fake chat model sampling at a non-zero temperature."""
+
+    temperature: float = 0.7
+
+
+def _invoke(cache, llm, endpoint="unlisted_endpoint", inputs=INPUTS, **kwargs):
+    return asyncio.run(cache.ainvoke(PROMPT, llm, inputs, endpoint=endpoint, **kwargs)).content
+
+
+def test_identical_prompt_is_served_from_cache(tmp_path):
+    cache = LLMResponseCache(cache_path=str(tmp_path / "responses.sqlite3"))
+    llm = SlowFakeChatModel(latency=0.02, reply="Optimized skills")
+
+    assert _invoke(cache, llm) == "Optimized skills"
+    assert _invoke(cache, llm) == "Optimized skills"
+    assert _invoke(cache, llm, inputs={**INPUTS, "content": "C++"}) == "Optimized skills"
+
+    assert llm.calls == 2
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["bytes_stored"] == 2 * len("Optimized skills")
+    assert stats["saved_latency_ms"] >= 20
+    assert stats["endpoints"]["unlisted_endpoint"]["hits"] == 1
+
+
+def test_nonzero_temperature_requires_opt_in(tmp_path):
+    cache = LLMResponseCache(cache_path=str(tmp_path / "responses.sqlite3"))
+    llm = WarmFakeChatModel(latency=0)
+
+    _invoke(cache, llm)
+    _invoke(cache, llm)
+    assert llm.calls == 2
+    assert cache.stats()["bypassed"] == 2
+
+    # Section rewrites stay fresh by default; parse_job opts in through config/settings.yaml
+    _invoke(cache, llm, endpoint="optimize_section")
+    _invoke(cache, llm, endpoint="optimize_section")
+    assert llm.calls == 4
+    _invoke(cache, llm, endpoint="parse_job")
+    _invoke(cache, llm, endpoint="parse_job")
+    assert llm.calls == 5
+
+
+def test_entries_expire_after_endpoint_ttl(tmp_path):
+    now = [1000.0]
+    cache = LLMResponseCache(cache_path=str(tmp_path / "responses.sqlite3"), clock=lambda: now[0])
+    llm = SlowFakeChatModel(latency=0)
+    ttl_seconds, _ = cache.endpoint_policy("optimize_section")
+
+    _invoke(cache, llm, endpoint="optimize_section")
+    now[0] += ttl_seconds - 1
+    _invoke(cache, llm, endpoint="optimize_section")
+    assert llm.calls == 1
+
+    now[0] += 2
+    _invoke(cache, llm, endpoint="optimize_section")
+    assert llm.calls == 2
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    cache_path = str(tmp_path / "responses.sqlite3")
+    _invoke(LLMResponseCache(cache_path=cache_path), SlowFakeChatModel(latency=0))
+
+    llm = SlowFakeChatModel(latency=0)
+    restarted = LLMResponseCache(cache_path=cache_path)
+    _invoke(restarted, llm)
+    assert llm.calls == 0
+    assert restarted.stats()["disk_hits"] == 1
+
+
+def test_invalid_responses_are_not_cached(tmp_path):
+    cache = LLMResponseCache(cache_path=str(tmp_path / "responses.sqlite3"))
+    llm = SlowFakeChatModel(latency=0, reply="not json")
+
+    _invoke(cache, llm, endpoint="parse_job", validate=lambda content: "{" in content)
+    _invoke(cache, llm, endpoint="parse_job", validate=lambda content: "{" in content)
+    assert llm.calls == 2
+    assert cache.stats()["stored_responses"] == 0
+
+
+def test_disabled_cache_creates_no_file(tmp_path, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings.cache.llm_responses, "enabled", False)
+    cache_path = tmp_path / "responses.sqlite3"
+    cache = LLMResponseCache(cache_path=str(cache_path))
+    llm = SlowFakeChatModel(latency=0)
+
+    _invoke(cache, llm)
+    _invoke(cache, llm)
+
+    assert llm.calls == 2
+    assert cache.stats()["stored_responses"] == 0
+    assert not cache_path.exists()
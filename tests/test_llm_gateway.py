@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared LLM gateway, using a local OpenAI-compatible stand-in
+server so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.llm_gateway import LLMGateway, get_llm_gateway
+from app.core.job_parser import JobParserService
+from app.services.job_analysis_service import JobAnalysisService
+from app.services.cover_letter_writer import CoverLetterWriterService
+from bench.fakes import CountingFakeEmbeddings, SlowFakeChatModel
+from bench.openai_stub import OpenAIStubServer
+
+
+def test_models_are_shared_per_profile():
+    gateway = LLMGateway(api_key="test-key")
+
+    assert gateway.chat_model() is gateway.chat_model()
+    assert gateway.chat_model(temperature=0.3) is not gateway.chat_model()
+    assert gateway.embeddings() is gateway.embeddings()
+    assert gateway.stats()["http_client_pairs"] == 3
+
+
+def test_services_obtain_models_from_the_gateway():
+    gateway = get_llm_gateway()
+    fakes = {}
+
+    def chat_factory(model, temperature):
+        return fakes.setdefault((model, temperature), SlowFakeChatModel(latency=0))
+
+    gateway.set_override(chat_factory=chat_factory, embeddings_factory=lambda model: CountingFakeEmbeddings())
+    try:
+        services = [JobAnalysisService(), JobParserService(), CoverLetterWriterService()]
+        assert all(service.llm is gateway.chat_model() for service in services)
+        assert len(fakes) == 1
+    finally:
+        gateway.clear_override()
+
+
+def test_concurrency_cap_and_connection_reuse():
+    async def run():
+        async with OpenAIStubServer(latency=0.05, reply="pooled reply") as server:
+            gateway = LLMGateway(api_key="test-key", base_url=server.base_url, max_concurrency=4,
+                                 requests_per_second=0, max_connections=4, max_keepalive_connections=4)
+            model = gateway.chat_model()
+            replies = await asyncio.gather(*(model.ainvoke(f"prompt {i}") for i in range(20)))
+            streamed = [chunk.content async for chunk in model.astream("stream me")]
+            await gateway.aclose()
+            return server, gateway, replies, streamed
+
+    server, gateway, replies, streamed = asyncio.run(run())
+
+    assert all(reply.content == "pooled reply" for reply in replies)
+    assert "".join(streamed) == "pooled reply"
+    assert server.max_active_requests <= 4
+    assert server.connections <= 4
+    assert gateway.stats()["max_in_flight"] == 4
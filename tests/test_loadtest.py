@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process HTTP load-test harness and its scenario file.
+The application runs against the local fake models, so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+import yaml
+
+from app.core.config import settings
+from bench import loadtest
+
+
+def test_scenarios_apply_defaults_and_reject_unknown_requests(tmp_path):
+    scenarios = loadtest.load_scenarios()
+
+    assert {"smoke", "mixed", "generation_heavy", "scoring_burst"} <= set(scenarios)
+    mixed = scenarios["mixed"]
+    assert mixed["timeout_seconds"] == 60 and mixed["fakes"]["tokens_per_second"] == 60
+    assert scenarios["smoke"]["fakes"]["chat_latency"] == "0"
+    assert scenarios["smoke"]["fakes"]["embedding_dim"] == 256
+    paths = {template["path"].split("?")[0] for scenario in scenarios.values()
+             for template in scenario["requests"].values()}
+    assert paths == {"/api/rank-projects", "/api/generate-deduplicated-resume", "/api/score-resume", "/api/export"}
+
+    body = loadtest.render(mixed["requests"]["score_resume"]["body"], 7)
+    assert body["job_description"].startswith("Posting #7:")
+    assert body["resume_data"]["skills"][0] == "Python"
+
+    broken = tmp_path / "loadtest.yaml"
+    broken.write_text(yaml.safe_dump({"requests": {}, "scenarios": {"bad": {"rps": 1, "duration_seconds": 1,
+                                                                           "mix": {"missing": 1}}}}))
+    with pytest.raises(ValueError, match="unknown requests: missing"):
+        loadtest.load_scenarios(broken)
+
+
+def test_load_run_reports_latency_throughput_errors_and_loop_lag():
+    scenario = loadtest.load_scenarios()["smoke"]
+    scenario.update(rps=40, duration_seconds=0.5, arrival="uniform")
+    scenario["mix"] = {"score_resume_keywords": 1, "rank_projects": 1, "invalid_export": 1}
+    scenario["requests"] = {
+        "score_resume_keywords": {"path": "/api/score-resume",
+                                  "body": {"job_description": "{job_description}", "resume_data": "{resume_data}",
+                                           "tier": 0}},
+        "rank_projects": {"path": "/api/rank-projects?top_k=3", "body": {"job_description": "{job_description}"}},
+        # Missing resume_data: rejected with 422 and counted as an error
+        "invalid_export": {"path": "/api/export", "body": {"format": "json"}},
+    }
+    embedding_model = settings.vector_db.embedding_model
+
+    result = asyncio.run(loadtest.run_scenario(scenario))
+
+    assert settings.vector_db.embedding_model == embedding_model
+    assert result["requests"] == 20
+    assert result["endpoints"]["invalid_export"]["outcomes"] == {"422": result["endpoints"]["invalid_export"]["requests"]}
+    assert result["endpoints"]["score_resume_keywords"]["errors"] == 0
+    assert result["endpoints"]["rank_projects"]["errors"] == 0
+    assert result["errors"] == result["endpoints"]["invalid_export"]["requests"] > 0
+    assert 0 < result["error_rate"] < 1
+    assert result["latency_ms"]["p50"] <= result["latency_ms"]["p95"] <= result["latency_ms"]["p99"]
+    assert result["throughput_per_s"] > 0 and result["loop_lag_ms"]["max"] >= 0
+    # Ranking embeds the job descriptions with the fake embedder
+    assert result["fakes"]["embedded_texts"] > 0
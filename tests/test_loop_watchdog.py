@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the event-loop stall watchdog and /api/debug/loop-stalls.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.routes import router as api_router
+from app.core import metrics
+from app.core.loop_watchdog import get_loop_watchdog
+
+
+def write_report_synchronously():
+    # Stands in for a blocking export or file parse inside an async route
+    time.sleep(0.3)
+
+
+def test_stalls_are_attributed_to_the_blocking_route_and_location():
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api")
+
+    @app.post("/reports/{report_id}")
+    async def create_report(report_id: int):
+        write_report_synchronously()
+        return {"report_id": report_id}
+
+    @app.get("/fast")
+    async def fast():
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    watchdog = get_loop_watchdog()
+    watchdog.reset()
+    watchdog.register_routes(app.routes)
+    stalls_before = metrics.EVENT_LOOP_STALLS.value(("POST /reports/{report_id}",))
+
+    async def run():
+        watchdog.start()
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                await client.get("/fast")
+                await client.post("/reports/7")
+                await asyncio.sleep(0.1)
+                return (await client.get("/api/debug/loop-stalls")).json()
+        finally:
+            await watchdog.stop()
+
+    summary = asyncio.run(run())
+    watchdog.reset()
+
+    assert summary["running"] and summary["stalls"] == 1
+    spot = summary["hot_spots"][0]
+    assert spot["route"] == "POST /reports/{report_id}"
+    assert spot["location"].endswith("in write_report_synchronously")
+    assert spot["count"] == 1 and 250 <= spot["max_ms"] < 1000
+    assert any("in create_report" in frame for frame in spot["stack"])
+    assert summary["recent"][0]["route"] == spot["route"] and "stack" not in summary["recent"][0]
+    assert summary["lag"]["max_ms"] >= 250 and summary["lag"]["p50_ms"] < 100
+    assert metrics.EVENT_LOOP_STALLS.value(("POST /reports/{report_id}",)) == stalls_before + 1
+    assert not watchdog.running
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prometheus-style /metrics endpoint and the metrics it exposes.
+Uses local fake models and a local OpenAI stand-in, so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.metrics import router as metrics_router
+from app.api.middleware import MetricsMiddleware
+from app.core import metrics
+from app.core.cache import LRUCache
+from app.core.llm_gateway import GatewayOpenAIEmbeddings, LLMGateway, _owner_from_self
+from bench.fakes import SlowFakeChatModel
+from bench.openai_stub import OpenAIStubServer
+
+
+def test_histograms_render_cumulative_buckets_and_escaped_labels():
+    registry = metrics.MetricsRegistry()
+    latency = registry.histogram("demo_seconds", "Demo latency.", ("route",), buckets=(0.1, 1.0))
+    calls = registry.counter("demo_total", "Demo calls.", ("route",))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, ('/a"b',))
+    calls.inc(2, ("/a",))
+
+    text = registry.render()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{route="/a\\"b",le="0.1"} 2' in text
+    assert 'demo_seconds_bucket{route="/a\\"b",le="1"} 3' in text
+    assert 'demo_seconds_bucket{route="/a\\"b",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{route="/a\\"b"} 4' in text
+    assert 'demo_total{route="/a"} 2' in text
+    assert latency.snapshot(('/a"b',))["sum"] == 3.65
+
+
+def test_routes_are_labelled_by_template_and_caches_report_hit_ratio():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="missing")
+        return {"item_id": item_id}
+
+    cache = LRUCache(4)
+    metrics.register_cache("test_items", cache)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    client = TestClient(app)
+    for item_id in (1, 2, 0):
+        client.get(f"/items/{item_id}")
+    client.get("/nowhere")
+    response = client.get("/metrics")
+    text = response.text
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"}' in text
+    assert metrics.HTTP_REQUEST_DURATION.snapshot(("GET", "/items/{item_id}", "200"))["count"] >= 2
+    assert metrics.HTTP_REQUEST_DURATION.snapshot(("GET", "/items/{item_id}", "404")) is not None
+    assert metrics.HTTP_REQUEST_DURATION.snapshot(("GET", "unmatched", "404")) is not None
+    # The scrape itself is the only request in flight
+    assert 'http_requests_in_flight{method="GET"} 1' in text
+    assert 'cache_hit_ratio{cache="test_items"} 0.5' in text
+    assert 'cache_entries{cache="test_items"} 1' in text
+
+
+class DigestService:
+    def __init__(self, llm):
+        self.llm = llm
+
+    async def digest(self, text: str):
+        return await self.llm.ainvoke(f"Summarize: {text}")
+
+
+def test_llm_calls_are_labelled_with_the_calling_service():
+    gateway = LLMGateway(api_key="test-key")
+    gateway.set_override(chat_factory=lambda model, temperature: SlowFakeChatModel(
+        model_name="metrics-fake", latency=0.01, reply="three word reply"))
+    labels = ("DigestService", "metrics-fake")
+    before = metrics.LLM_CALLS.value(labels + ("ok",))
+
+    asyncio.run(DigestService(gateway.chat_model()).digest("a short resume"))
+
+    assert metrics.LLM_CALLS.value(labels + ("ok",)) == before + 1
+    completion = metrics.LLM_COMPLETION_TOKENS.snapshot(labels)
+    assert completion["sum"] >= 3 and completion["buckets"][16] == completion["count"]
+    assert metrics.LLM_CALL_DURATION.snapshot(labels)["sum"] >= 0.01
+
+
+def test_service_owner_is_found_without_co_qualname():
+    # Python < 3.11 code objects have no co_qualname; the owner comes from `self`
+    class DerivedDigestService(DigestService):
+        pass
+
+    class Probe:
+        def frame(self):
+            return sys._getframe()
+
+    service = DerivedDigestService(llm=None)
+    digest = service.digest("text")
+    assert _owner_from_self(digest.cr_frame) == "DigestService"
+    digest.close()
+    assert _owner_from_self(Probe().frame()) == "Probe"
+    assert _owner_from_self(sys._getframe()) == ""
+
+
+def test_embedding_requests_and_texts_are_counted():
+    async def run():
+        async with OpenAIStubServer(latency=0.0) as server:
+            embeddings = GatewayOpenAIEmbeddings(model="metrics-embedding", api_key="test-key",
+                                                 base_url=server.base_url, check_embedding_ctx_length=False)
+            await embeddings.aembed_documents(["first", "second"])
+            await embeddings.aembed_query("third")
+
+    requests_before = metrics.EMBEDDING_REQUESTS.value(("metrics-embedding",))
+    texts_before = metrics.EMBEDDING_TEXTS.value(("metrics-embedding",))
+    asyncio.run(run())
+
+    assert metrics.EMBEDDING_REQUESTS.value(("metrics-embedding",)) == requests_before + 2
+    assert metrics.EMBEDDING_TEXTS.value(("metrics-embedding",)) == texts_before + 3
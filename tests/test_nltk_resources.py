@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the vendored NLTK resources and the regex tokenizer fallback used
+by resume scoring.
+"""
+
+import hashlib
+import json
+import os
+import string
+import subprocess
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.nltk_resources import STOPWORDS_RESOURCE, get_stopwords, regex_word_tokenize
+
+TEXTS = [
+    "Good muffins cost $3.88 (roughly 3,36 euros)\nin New York.  Please buy me\ntwo of them.\nThanks.",
+    "We're hiring an ML Engineer: C++, C#, Node.js & ONNX -- isn't that \"cutting-edge\"? You'll "
+    "own CI/CD... [Kubernetes] {Terraform} <gRPC> 'TensorRT' and 99.9% uptime; e-mail jobs@example.com!",
+    "I cannot say 'gonna' or “smart quotes” don’t «break» things, d'ye gotta wanna 'tis lemme",
+]
+
+
+def _corpus():
+    texts = list(TEXTS)
+    for path in sorted((project_root / "data" / "projects").glob("*.yaml")):
+        project = yaml.safe_load(path.read_text()) or {}
+        texts.extend(str(value) for value in project.values() if isinstance(value, (str, list)))
+    return texts + [text.lower() for text in texts]
+
+
+def _keywords(tokens, stop_words):
+    # The token filter ResumeScorerService._extract_keywords applies
+    stripped = (token.strip(string.punctuation) for token in tokens)
+    return {token for token in stripped if token not in stop_words and len(token) > 2 and not token.isdigit()}
+
+
+def test_regex_tokenizer_matches_nltk_word_tokenizer():
+    from nltk.tokenize import NLTKWordTokenizer
+
+    tokenizer = NLTKWordTokenizer()
+    stop_words = get_stopwords()
+    for text in _corpus():
+        assert regex_word_tokenize(text) == tokenizer.tokenize(text)
+        assert _keywords(regex_word_tokenize(text), stop_words) == _keywords(tokenizer.tokenize(text), stop_words)
+
+
+def test_vendored_stopwords_match_manifest():
+    data_dir = project_root / "data" / "nltk_data"
+    manifest = json.loads((data_dir / "MANIFEST.json").read_text())
+    path = data_dir / STOPWORDS_RESOURCE
+
+    assert manifest["files"]["corpora/stopwords/english"] == hashlib.sha256(path.read_bytes()).hexdigest()
+    stop_words = get_stopwords()
+    assert len(stop_words) == 179
+    assert {"the", "and", "with", "you're", "shouldn't"} <= stop_words
+    assert "python" not in stop_words
+
+
+def test_scoring_does_not_import_nltk_without_vendored_punkt():
+    code = (
+        "import sys\n"
+        "from app.services.resume_scorer import ResumeScorerService\n"
+        "from app.core.nltk_resources import tokenizer_name\n"
+        "keywords = ResumeScorerService()._extract_keywords('Experience with PyTorch and ONNX models.')\n"
+        "assert {'pytorch', 'onnx', 'models'} <= set(keywords), keywords\n"
+        "print(tokenizer_name(), 'nltk' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True,
+                            env={**os.environ, "OPENAI_API_KEY": "test-key"}, timeout=120)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["regex", "False"]
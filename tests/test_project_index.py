@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized project embedding index.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.services.embedding_cache import EmbeddingCache
+from app.services.project_index import ProjectEmbeddingIndex, project_id
+from app.services.relevance_ranker import RelevanceRanker, project_embedding_text
+from bench.fakes import CountingFakeEmbeddings
+
+
+def _projects(n):
+    return [{"slug": f"p{i}", "title": f"Project {i}", "description": f"work item {i}"} for i in range(n)]
+
+
+def test_top_k_matches_brute_force_cosine():
+    fake = CountingFakeEmbeddings(dim=32)
+    index = ProjectEmbeddingIndex(fake, project_embedding_text)
+    projects = _projects(50)
+    index.sync(projects)
+
+    query = fake.embed_query("edge ai engineer")
+    vectors = np.array(fake.embed_documents([project_embedding_text(p) for p in projects]))
+    expected = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    expected_ids = [projects[i]["slug"] for i in np.argsort(-expected)[:7]]
+
+    results = index.top_k(query, k=7)
+    assert [pid for pid, _ in results] == expected_ids
+    assert np.allclose([score for _, score in results], np.sort(expected)[::-1][:7], atol=1e-5)
+
+
+def test_sync_re_embeds_only_changed_rows():
+    fake = CountingFakeEmbeddings()
+    index = ProjectEmbeddingIndex(fake, project_embedding_text)
+    projects = _projects(10)
+
+    assert index.sync(projects) == 10
+    assert index.sync(projects) == 0
+
+    projects[3]["description"] = "changed"
+    assert index.sync(projects) == 1
+
+    del projects[5]
+    assert index.sync(projects) == 0
+    assert len(index) == 9
+    assert "p5" not in index.ids
+    assert fake.documents_embedded == 11
+
+
+def test_rank_projects_does_not_mutate_shared_projects(tmp_path, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings.project_analysis, "relevance_threshold", -1.0)
+
+    ranker = RelevanceRanker(
+        embeddings=CountingFakeEmbeddings(),
+        embedding_cache=EmbeddingCache(cache_path=str(tmp_path / "cache.sqlite3"))
+    )
+    projects = _projects(6)
+
+    ranked = asyncio.run(ranker.rank_projects("ML engineer", projects, top_k=3))
+
+    assert len(ranked) == 3
+    assert all("relevance_score" in p for p in ranked)
+    assert all("relevance_score" not in p for p in projects)
+
+
+def test_projects_sharing_a_title_keep_separate_rows():
+    fake = CountingFakeEmbeddings()
+    index = ProjectEmbeddingIndex(fake, project_embedding_text)
+    projects = [
+        {"title": "Chatbot", "description": "customer support bot", "source_file": "chatbot.yaml"},
+        {"title": "Chatbot", "description": "course assistant", "source_file": "chatbot_v2.yaml"},
+        {"title": "Chatbot", "description": "slack helper"},
+        {"title": "Chatbot", "description": "voice agent"},
+    ]
+
+    assert index.sync(projects) == 4
+    assert len(index) == 4 and len({project_id(p) for p in projects}) == 4
+    assert project_id(projects[0]) == "chatbot.yaml"
+    assert project_id({**projects[2], "created_at": "later"}) == project_id(projects[2])
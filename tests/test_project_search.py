@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for BM25 project search and its incremental updates.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.services.project_search import ProjectSearchIndex
+from app.services.project_store import ProjectStoreService
+from bench.fakes import SlowFakeChatModel
+
+
+def test_field_boosts_rank_title_matches_first():
+    index = ProjectSearchIndex()
+    index.add("methods", {"title": "Detector", "methods": ["pruning"]})
+    index.add("title", {"title": "Pruning Toolkit", "description": "Tools"})
+    index.add("description", {"title": "Compressor", "description": "Structured pruning of CNNs"})
+    index.add("unrelated", {"title": "Chatbot", "description": "RAG assistant"})
+
+    assert [doc_id for doc_id, _ in index.search("pruning", limit=10)] == ["title", "description", "methods"]
+
+
+def test_prefix_matching_and_removal():
+    index = ProjectSearchIndex()
+    index.add("a", {"title": "Dynamic Sparsity Optimization", "technologies": ["PyTorch"]})
+    index.add("b", {"title": "LitBot", "technologies": ["FAISS"]})
+
+    assert [doc_id for doc_id, _ in index.search("spars")] == ["a"]
+    assert index.search("spars", prefix=False) == []
+    assert {doc_id for doc_id, _ in index.search("pyt faiss")} == {"a", "b"}
+
+    index.remove("a")
+    assert index.search("spars") == []
+    assert len(index) == 1
+
+
+def test_store_search_updates_on_save(tmp_path):
+    store = ProjectStoreService(projects_dir=str(tmp_path), refresh_interval=3600)
+    assert store.search_projects("quantization") == []
+
+    store.save_project({"title": "Quantization Study", "technologies": ["ONNX"]})
+    assert [p["title"] for p in store.search_projects("quantization")] == ["Quantization Study"]
+
+
+def test_store_search_updates_on_parse_and_save(tmp_path):
+    store = ProjectStoreService(projects_dir=str(tmp_path), refresh_interval=3600)
+    parser = store.project_parser
+    parser.projects_dir = str(tmp_path)
+    parser.llm = SlowFakeChatModel(latency=0, reply=json.dumps({
+        "title": "Edge Detector", "description": "Real-time detection on Jetson", "technologies": ["TensorRT"]
+    }))
+
+    asyncio.run(parser.parse_and_save_project("I built a detector", "Edge Detector"))
+
+    assert [p["title"] for p in store.search_projects("tensorrt")] == ["Edge Detector"]
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the indexed, mtime-aware project store.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import yaml
+
+from app.services.project_store import ProjectStoreService
+
+
+def _write(directory, name, project):
+    with open(os.path.join(directory, name), "w") as f:
+        yaml.dump(project, f)
+
+
+def test_lookups_use_indexes(tmp_path):
+    _write(tmp_path, "a.yaml", {"title": "LitBot", "technologies": ["FAISS", "OpenAI GPT models"]})
+    _write(tmp_path, "b.yaml", {"title": "Sparsity", "technologies": "PyTorch; CUDA"})
+    store = ProjectStoreService(projects_dir=str(tmp_path), refresh_interval=0.0)
+
+    assert store.get_project_by_title("litbot")["title"] == "LitBot"
+    assert store.get_project_by_title("missing") is None
+    assert [p["title"] for p in store.get_projects_by_technology("cuda")] == ["Sparsity"]
+    assert [p["title"] for p in store.get_projects_by_technology("gpt")] == ["LitBot"]
+
+
+def test_refresh_reparses_only_changed_files(tmp_path, monkeypatch):
+    _write(tmp_path, "a.yaml", {"title": "A", "technologies": ["ONNX"]})
+    _write(tmp_path, "b.yaml", {"title": "B", "technologies": ["ONNX"]})
+    store = ProjectStoreService(projects_dir=str(tmp_path), refresh_interval=0.0)
+
+    loaded = []
+    original = store._load_project_file
+    monkeypatch.setattr(store, "_load_project_file", lambda name: loaded.append(name) or original(name))
+
+    assert store.refresh() is False
+    assert loaded == []
+
+    _write(tmp_path, "b.yaml", {"title": "B renamed", "technologies": ["CUDA"]})
+    os.remove(tmp_path / "a.yaml")
+    assert store.refresh() is True
+
+    assert loaded == ["b.yaml"]
+    assert [p["title"] for p in store.get_all_projects()] == ["B renamed"]
+    assert store.get_projects_by_technology("onnx") == []
+    assert store.get_project_by_title("B") is None
+
+
+def test_save_project_updates_index_without_rescan(tmp_path):
+    store = ProjectStoreService(projects_dir=str(tmp_path), refresh_interval=3600)
+
+    store.save_project({"title": "New Project", "technologies": ["FastAPI"]})
+
+    assert store.get_project_by_title("new project")["technologies"] == ["FastAPI"]
+    assert len(store.get_all_projects()) == 1
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental, per-tenant resume FAISS indexes in RAGService.
+Uses a deterministic local embedder, so no OpenAI calls are made.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.api.dependencies import get_rag_service
+from app.api.routes import router as api_router
+from app.services.rag_service import RAGService, MANIFEST_FILENAME
+from bench.fakes import CountingFakeEmbeddings
+
+
+def _sample_resume():
+    return {
+        "sections": {
+            "summary": "ML engineer focused on edge AI and model compression.",
+            "experience": [
+                {"title": "ML Engineer", "company": "Acme", "description": "Pruned CNNs for MCUs"},
+                {"title": "Research Intern", "company": "Lab", "description": "Quantization research"},
+            ],
+            "skills": ["Python", "PyTorch", "ONNX"],
+        }
+    }
+
+
+def _indexed_ids(service):
+    return set(service.get_tenant_store().vector_store.index_to_docstore_id.values())
+
+
+def test_identical_reupload_embeds_nothing(tmp_path):
+    fake = CountingFakeEmbeddings()
+    service = RAGService(embedding_model=fake, vector_store_path=str(tmp_path))
+
+    asyncio.run(service.create_vector_store(_sample_resume()))
+    first_count = fake.documents_embedded
+    assert first_count == 6
+
+    asyncio.run(service.create_vector_store(_sample_resume()))
+    assert fake.documents_embedded == first_count
+
+
+def test_only_changed_chunks_are_embedded(tmp_path):
+    fake = CountingFakeEmbeddings()
+    service = RAGService(embedding_model=fake, vector_store_path=str(tmp_path))
+    resume = _sample_resume()
+    asyncio.run(service.create_vector_store(resume))
+    before = _indexed_ids(service)
+
+    edited = copy.deepcopy(resume)
+    edited["sections"]["summary"] = "Research scientist working on efficient inference."
+    edited["sections"]["skills"] = ["Python", "PyTorch"]
+    asyncio.run(service.create_vector_store(edited))
+
+    assert fake.documents_embedded == 6 + 1
+    after = _indexed_ids(service)
+    assert len(after) == 5
+    assert len(before & after) == 4
+    results = asyncio.run(service.query_vector_store("efficient inference", num_results=5))
+    assert not any("edge AI" in text for text in results)
+
+
+def test_restart_resumes_incrementally_from_manifest(tmp_path):
+    asyncio.run(RAGService(embedding_model=CountingFakeEmbeddings(), vector_store_path=str(tmp_path))
+                .create_vector_store(_sample_resume()))
+    manifest = json.loads((tmp_path / MANIFEST_FILENAME).read_text())
+    assert len(manifest["chunks"]) == 6
+
+    fake = CountingFakeEmbeddings()
+    restarted = RAGService(embedding_model=fake, vector_store_path=str(tmp_path))
+    asyncio.run(restarted.create_vector_store(_sample_resume()))
+    assert fake.documents_embedded == 0
+
+
+def test_index_without_manifest_is_rebuilt(tmp_path):
+    asyncio.run(RAGService(embedding_model=CountingFakeEmbeddings(), vector_store_path=str(tmp_path))
+                .create_vector_store(_sample_resume()))
+    (tmp_path / MANIFEST_FILENAME).unlink()
+
+    fake = CountingFakeEmbeddings()
+    restarted = RAGService(embedding_model=fake, vector_store_path=str(tmp_path))
+    asyncio.run(restarted.create_vector_store(_sample_resume()))
+    assert fake.documents_embedded == 6
+    assert (tmp_path / MANIFEST_FILENAME).exists()
+
+
+def test_tenants_are_isolated(tmp_path):
+    service = RAGService(embedding_model=CountingFakeEmbeddings(), vector_store_path=str(tmp_path))
+    other = copy.deepcopy(_sample_resume())
+    other["sections"]["summary"] = "Backend developer building payment APIs."
+
+    asyncio.run(service.create_vector_store(_sample_resume(), tenant_id="alice"))
+    asyncio.run(service.create_vector_store(other, tenant_id="bob"))
+
+    alice = asyncio.run(service.query_vector_store("summary", num_results=6, tenant_id="alice"))
+    bob = asyncio.run(service.query_vector_store("summary", num_results=6, tenant_id="bob"))
+    assert any("edge AI" in text for text in alice) and not any("payment" in text for text in alice)
+    assert any("payment" in text for text in bob)
+    assert (tmp_path / "tenants" / "alice" / MANIFEST_FILENAME).exists()
+
+
+def test_evicted_tenant_is_reloaded_from_disk(tmp_path):
+    fake = CountingFakeEmbeddings()
+    service = RAGService(embedding_model=fake, vector_store_path=str(tmp_path), max_resident_tenants=2)
+    for tenant in ("t1", "t2", "t3"):
+        asyncio.run(service.create_vector_store(_sample_resume(), tenant_id=tenant))
+    assert service.residency_stats()["size"] == 2
+    assert "t1" not in service.resident_stores
+
+    embedded = fake.documents_embedded
+    results = asyncio.run(service.query_vector_store("PyTorch", tenant_id="t1"))
+    assert results
+    asyncio.run(service.create_vector_store(_sample_resume(), tenant_id="t1"))
+    assert fake.documents_embedded == embedded
+
+
+def test_invalid_tenant_id_is_rejected(tmp_path):
+    service = RAGService(embedding_model=CountingFakeEmbeddings(), vector_store_path=str(tmp_path))
+    with pytest.raises(ValueError):
+        asyncio.run(service.create_vector_store(_sample_resume(), tenant_id="../escape"))
+
+
+def test_residency_is_bounded_by_index_size(tmp_path):
+    probe = RAGService(embedding_model=CountingFakeEmbeddings(), vector_store_path=str(tmp_path / "probe"))
+    asyncio.run(probe.create_vector_store(_sample_resume()))
+    index_bytes = probe.residency_stats()["weight"]
+    assert index_bytes == probe.get_tenant_store().vector_store.index.ntotal * 16 * 4
+
+    service = RAGService(embedding_model=CountingFakeEmbeddings(), vector_store_path=str(tmp_path),
+                         max_resident_bytes=2 * index_bytes)
+    for tenant in ("t1", "t2", "t3"):
+        asyncio.run(service.create_vector_store(_sample_resume(), tenant_id=tenant))
+    stats = service.residency_stats()
+    assert stats["size"] == 2 and stats["weight"] == 2 * index_bytes
+    assert "t1" not in service.resident_stores
+    assert asyncio.run(service.query_vector_store("PyTorch", tenant_id="t1"))
+
+
+def test_routes_reject_invalid_tenant_ids_with_422():
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api")
+    app.dependency_overrides[get_rag_service] = lambda: None
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            query = await client.post("/api/query", json={"query": "skills", "tenant_id": "../escape"})
+            existing = await client.post("/api/use-existing-resume", params={"tenant_id": "a/b"})
+            upload = await client.post("/api/upload-resume", data={"tenant_id": ".hidden"},
+                                       files={"file": ("resume.docx", b"x")})
+            return query, existing, upload
+
+    for response in asyncio.run(run()):
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][-1] == "tenant_id"
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for tiered resume scoring: local keyword scoring (tier 0) and cached
+LLM feedback (tier 1). Uses a local chat model, so no OpenAI calls are made.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.api.dependencies import get_resume_scorer
+from app.api.routes import router as api_router
+from app.services.resume_scorer import ResumeScorerService, feedback_cache_key
+from bench.fakes import SlowFakeChatModel
+
+JOB_DESCRIPTION = """
+We're hiring an ML Engineer for edge AI inference. Experience with ONNX, PyTorch,
+CUDA and {braces} in templates is required.
+"""
+RESUME = {
+    "summary": "Engineer focused on ONNX model optimization and CUDA kernels.",
+    "skills": ["ONNX", "PyTorch", "Python"],
+    "projects": [{"title": "Edge Pruning", "description": "Pruned PyTorch models for edge devices",
+                  "technologies": ["PyTorch", "ONNX"]}]
+}
+FEEDBACK = {
+    "llm_score": 80,
+    "overall_feedback": "Strong edge inference background",
+    "section_feedback": {"summary": "Mention latency gains"},
+    "ats_tips": ["Spell out CUDA versions"]
+}
+
+
+async def _wait_while_pending(scorer, feedback_key):
+    for _ in range(200):
+        if scorer.feedback_status(feedback_key) != "pending":
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def scorer():
+    service = ResumeScorerService()
+    service.llm = SlowFakeChatModel(latency=0.05, reply=json.dumps(FEEDBACK))
+    return service
+
+
+def test_tier0_scores_keywords_without_calling_the_llm(scorer):
+    async def scenario():
+        result = await scorer.score_resume(JOB_DESCRIPTION, RESUME, tier=0)
+        await asyncio.sleep(0)
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result["tier"] == 0
+    assert "match_score" not in result and "section_feedback" not in result
+    assert 0 < result["keyword_score"] <= 100
+    assert "onnx" in result["keywords_matched"]
+    assert result["feedback_key"] == feedback_cache_key(JOB_DESCRIPTION, RESUME)
+    assert result["latency_ms"]["tier0"] < 1000
+    assert result["feedback_status"] == "missing"
+    assert scorer.llm.calls == 0
+
+
+def test_tier0_prefetches_feedback_when_asked(scorer):
+    async def scenario():
+        result = await scorer.score_resume(JOB_DESCRIPTION, RESUME, tier=0, prefetch_feedback=True)
+        # The prefetched feedback completes in the background
+        await _wait_while_pending(scorer, result["feedback_key"])
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result["feedback_status"] == "pending"
+    assert "match_score" not in result
+    assert scorer.get_cached_feedback(result["feedback_key"]) == FEEDBACK
+    assert scorer.llm.calls == 1
+
+
+def test_tier1_feedback_is_cached_per_job_and_resume(scorer):
+    async def scenario():
+        first = await scorer.score_resume(JOB_DESCRIPTION, RESUME)
+        second = await scorer.score_resume("  " + JOB_DESCRIPTION.replace("\n", " "), RESUME)
+        other_resume = await scorer.score_resume(JOB_DESCRIPTION, {**RESUME, "skills": ["Go"]})
+        return first, second, other_resume
+
+    first, second, other_resume = asyncio.run(scenario())
+
+    assert first["tier"] == 1 and first["overall_feedback"] == FEEDBACK["overall_feedback"]
+    assert first["match_score"] == int(first["keyword_score"] * 0.7 + 80 * 0.3)
+    assert set(first["latency_ms"]) == {"tier0", "tier1"}
+    assert first["feedback_cached"] is False
+    # Whitespace differences in the job description hit the same cache entry
+    assert second["feedback_cached"] is True and second["feedback_key"] == first["feedback_key"]
+    assert other_resume["feedback_key"] != first["feedback_key"]
+    assert scorer.llm.calls == 2
+
+
+def test_unparsable_feedback_falls_back_without_being_cached(scorer):
+    scorer.llm = SlowFakeChatModel(latency=0.0, reply="not json")
+
+    async def scenario():
+        first = await scorer.score_resume(JOB_DESCRIPTION, RESUME)
+        second = await scorer.score_resume(JOB_DESCRIPTION, RESUME)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first["scoring_breakdown"]["llm_assessment"] == 75
+    assert second["feedback_cached"] is False
+    assert scorer.get_cached_feedback(first["feedback_key"]) is None
+    assert scorer.llm.calls == 2
+
+
+def test_failed_background_feedback_is_reported_then_retried(scorer):
+    class FailingChatModel(SlowFakeChatModel):
+        async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+            self.calls += 1
+            raise RuntimeError("rate limited")
+
+    scorer.llm = FailingChatModel(latency=0.0)
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api")
+    app.dependency_overrides[get_resume_scorer] = lambda: scorer
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            scored = (await client.post("/api/score-resume", json={
+                "job_description": JOB_DESCRIPTION, "resume_data": RESUME, "tier": 0,
+                "prefetch_feedback": True})).json()
+            key = scored["feedback_key"]
+            await _wait_while_pending(scorer, key)
+            failed = await client.get(f"/api/score-resume/feedback/{key}")
+
+            scorer.llm = SlowFakeChatModel(latency=0.0, reply=json.dumps(FEEDBACK))
+            await client.post("/api/score-resume", json={
+                "job_description": JOB_DESCRIPTION, "resume_data": RESUME, "tier": 0,
+                "prefetch_feedback": True})
+            await _wait_while_pending(scorer, key)
+            ready = await client.get(f"/api/score-resume/feedback/{key}")
+            missing = await client.get("/api/score-resume/feedback/unknown")
+            return failed, ready, missing
+
+    failed, ready, missing = asyncio.run(scenario())
+
+    assert failed.status_code == 200
+    assert failed.json()["status"] == "failed" and "rate limited" in failed.json()["error"]
+    assert ready.json() == {"feedback_key": failed.json()["feedback_key"], "status": "ready", "feedback": FEEDBACK}
+    assert missing.status_code == 404
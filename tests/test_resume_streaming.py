@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the Server-Sent Events variant of deduplicated resume generation.
+Uses a slow local LLM, so no OpenAI calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.services.project_store import ProjectStoreService
+from app.services.resume_writer import ResumeWriterService
+from bench.fakes import SlowFakeChatModel
+
+SECTIONS = ["summary", "research", "skills"]
+JOB_DATA = {"job_title": "ML Engineer", "required_skills": ["Python", "PyTorch"], "industry_focus": "machine learning"}
+
+
+def _writer(latency: float = 0.05) -> ResumeWriterService:
+    writer = ResumeWriterService(ProjectStoreService())
+    writer.llm = SlowFakeChatModel(latency=latency, reply="Streamed section body")
+
+    async def parse_job_description(job_description):
+        return dict(JOB_DATA)
+
+    writer.job_parser.parse_job_description = parse_job_description
+    return writer
+
+
+async def _collect(writer: ResumeWriterService, **kwargs):
+    return [event async for event in writer.stream_tailored_resume_with_deduplication(
+        "ML engineer opening", SECTIONS, **kwargs
+    )]
+
+
+def test_sections_stream_as_they_complete():
+    writer = _writer()
+    original_skills = writer._generate_skills_section_optimized
+
+    async def slow_skills(*args):
+        await asyncio.sleep(0.5)
+        return await original_skills(*args)
+
+    writer._generate_skills_section_optimized = slow_skills
+    events = asyncio.run(_collect(writer))
+
+    section_events = [event for event in events if event["event"] == "section"]
+    assert {event["section"] for event in section_events} == set(SECTIONS)
+    assert section_events[-1]["section"] == "skills"
+
+    done = events[-1]
+    assert done["event"] == "done"
+    assert done["job_analysis"] == JOB_DATA
+    assert "selected_projects_count" in done
+    assert done["failed_sections"] == []
+    # The first section is available long before the slow one finishes
+    assert done["time_to_first_section_ms"] < section_events[-1]["elapsed_ms"] - 300
+
+
+def test_token_events_precede_their_section():
+    events = asyncio.run(_collect(_writer(), stream_tokens=True))
+
+    tokens = [event for event in events if event["event"] == "token" and event["section"] == "skills"]
+    skills_index = next(i for i, event in enumerate(events) if event.get("section") == "skills" and event["event"] == "section")
+    assert tokens
+    assert all(events.index(token) < skills_index for token in tokens)
+    assert "".join(token["delta"] for token in tokens).strip() == "Streamed section body"
+
+
+def test_failed_section_is_reported_and_others_continue():
+    writer = _writer()
+
+    async def broken(*args):
+        raise ValueError("model unavailable")
+
+    writer._generate_summary_section_optimized = broken
+    events = asyncio.run(_collect(writer))
+
+    errors = [event for event in events if event["event"] == "error"]
+    assert errors == [{"event": "error", "section": "summary", "detail": "model unavailable"}]
+    assert {event["section"] for event in events if event["event"] == "section"} == {"research", "skills"}
+    assert events[-1]["failed_sections"] == ["summary"]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent section generation in ResumeWriterService.
+Uses slow local LLMs, so no OpenAI calls are made.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+from langchain_core.messages import BaseMessage
+
+from app.core import llm_cache
+from app.core.config import settings
+from app.core.job_cache import job_analysis_cache
+from app.services.project_store import ProjectStoreService
+from app.services.resume_writer import ResumeWriterService
+from bench.fakes import SlowFakeChatModel
+
+LLM_LATENCY = 0.1
+SECTIONS = ["summary", "research", "experience", "skills", "projects"]
+JOB_JSON = json.dumps({"job_title": "ML Engineer", "required_skills": ["Python", "PyTorch"],
+                       "preferred_skills": ["ONNX"], "industry_focus": "machine learning edge"})
+
+
+class InFlightFakeChatModel(SlowFakeChatModel):
+    """Records how many calls are in flight at once."""
+
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await super()._agenerate(messages, stop, run_manager, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_llm_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_cache, "_default_cache", llm_cache.LLMResponseCache(str(tmp_path / "responses.sqlite3")))
+    monkeypatch.setattr(settings.cache.llm_responses, "enabled", False)
+    job_analysis_cache.clear()
+    yield
+    job_analysis_cache.clear()
+
+
+def test_sections_overlap_under_the_cap_and_keep_deduplication(monkeypatch):
+    monkeypatch.setattr(settings.resume, "section_concurrency", 2)
+    writer = ResumeWriterService(ProjectStoreService())
+    writer.llm = InFlightFakeChatModel(latency=LLM_LATENCY)
+    writer.job_parser.llm = SlowFakeChatModel(latency=0.0, reply=JOB_JSON)
+
+    async def scenario():
+        _, section_plan, used_slugs = await writer._plan_deduplicated_resume("ML engineer, edge AI", SECTIONS)
+        sections, timings = await writer._run_sections_concurrently(section_plan)
+        return section_plan, used_slugs, sections, timings
+
+    section_plan, used_slugs, sections, timings = asyncio.run(scenario())
+
+    # Projects chosen for research are not reused by experience
+    projects_of = {section: args[1] for section, _, args in section_plan if section in ("research", "experience")}
+    research_slugs = {project["slug"] for project in projects_of["research"]}
+    experience_slugs = {project["slug"] for project in projects_of["experience"]}
+    assert research_slugs and not research_slugs & experience_slugs
+    assert research_slugs | experience_slugs <= used_slugs
+
+    assert list(sections) == SECTIONS
+    llm_sections = writer.llm.calls
+    assert llm_sections >= 3
+    # Sections overlap, but never more than section_concurrency at a time
+    assert writer.llm.max_in_flight == 2
+    assert set(timings) == set(SECTIONS)
+    assert sum(1 for ms in timings.values() if ms >= LLM_LATENCY * 1000 * 0.9) == llm_sections
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazily built service container behind the API dependencies.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from app.core.container import ServiceContainer
+
+
+def test_services_are_built_once_on_first_use_and_shared():
+    container = ServiceContainer()
+    builds = []
+
+    def store():
+        builds.append("store")
+        return object()
+
+    container.register("store", store)
+    container.register("ranker", lambda: {"store": container.get("store")})
+    container.register("writer", lambda: {"store": container.get("store"), "ranker": container.get("ranker")})
+
+    assert builds == [] and not container.is_built("store")
+    writer = container.get("writer")
+
+    assert builds == ["store"]
+    assert writer["store"] is writer["ranker"]["store"] is container.get("store")
+    assert container.get("writer") is writer
+    assert container.stats()["services"]["writer"]["built"] is True
+
+
+def test_concurrent_first_use_builds_a_single_instance():
+    container = ServiceContainer()
+    builds = []
+
+    def slow_service():
+        builds.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    container.register("slow", slow_service)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        instances = list(pool.map(lambda _: container.get("slow"), range(8)))
+
+    assert len(builds) == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test_warmup_builds_in_order_and_survives_failures():
+    container = ServiceContainer()
+    attempts = []
+
+    def broken():
+        attempts.append("broken")
+        raise RuntimeError("vector store unavailable")
+
+    container.register("broken", broken)
+    container.register("store", lambda: "store")
+    asyncio.run(container.warmup(["broken", "store"]))
+
+    stats = container.stats()
+    assert stats["warmup"] == "done"
+    assert stats["services"]["broken"] == {"built": False, "error": "vector store unavailable"}
+    assert stats["services"]["store"]["built"] is True
+    # A failed build is retried on the next use
+    container.register("broken", lambda: "recovered")
+    assert container.get("broken") == "recovered"
+    assert attempts == ["broken"]
+
+
+def test_importing_the_api_does_not_build_services_or_load_heavy_packages():
+    code = (
+        "import sys\n"
+        "import app.main\n"
+        "from app.core.container import get_container\n"
+        "built = [name for name in get_container().names if get_container().is_built(name)]\n"
+        "heavy = [m for m in ('app.services.rag_service', 'app.services.resume_writer', 'langchain_core',\n"
+        "                     'numpy', 'faiss', 'docx', 'fpdf', 'nltk') if m in sys.modules]\n"
+        "print(len(get_container().names), built, heavy)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True,
+                            env={**os.environ, "OPENAI_API_KEY": "test-key"}, timeout=120)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split("\n")[-2] == "11 [] []"
+
+
+def test_ranker_build_failures_are_retried_and_ranking_routes_fall_back(monkeypatch):
+    from app.api import dependencies
+
+    container = ServiceContainer()
+    dependencies.register_services(container)
+    monkeypatch.setattr(dependencies, "get_container", lambda: container)
+
+    def unavailable_store():
+        raise RuntimeError("project store unavailable")
+
+    container.register("project_store", unavailable_store)
+    ranker = dependencies.get_relevance_ranker_or_minimal()
+
+    assert isinstance(ranker, dependencies.MinimalRelevanceRanker)
+    assert container.stats()["services"]["relevance_ranker"] == {"built": False, "error": "project store unavailable"}
+    # The stand-in is not cached: once the store recovers the real ranker is built
+    container.register("relevance_ranker", lambda: "ranker")
+    assert dependencies.get_relevance_ranker_or_minimal() == "ranker"
+    assert container.is_built("relevance_ranker")
+
+
+def test_resume_writer_builds_the_ranker_only_when_it_is_needed(monkeypatch):
+    from app.api import dependencies
+
+    container = ServiceContainer()
+    dependencies.register_services(container)
+    monkeypatch.setattr(dependencies, "get_container", lambda: container)
+    container.register("project_store", lambda: "store")
+    container.register("relevance_ranker", lambda: "ranker")
+
+    writer = dependencies.get_resume_writer()
+
+    assert not container.is_built("relevance_ranker")
+    assert writer.relevance_ranker == "ranker"
+    assert container.is_built("relevance_ranker")
+
+
+def test_cache_stats_do_not_build_services(monkeypatch, tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.api import routes
+    from app.core import llm_cache
+    from app.services import embedding_cache
+
+    container = ServiceContainer()
+    built = []
+    container.register("rag_service", lambda: built.append("rag_service"))
+    container.register("resume_scorer", lambda: built.append("resume_scorer"))
+    monkeypatch.setattr(routes, "get_container", lambda: container)
+    monkeypatch.setattr(embedding_cache, "_default_cache",
+                        embedding_cache.EmbeddingCache(cache_path=str(tmp_path / "embeddings.sqlite3")))
+    monkeypatch.setattr(llm_cache, "_default_cache", llm_cache.LLMResponseCache(str(tmp_path / "responses.sqlite3")))
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api")
+
+    stats = TestClient(app).get("/api/admin/cache-stats").json()
+
+    assert built == []
+    assert stats["vector_stores"] is None and stats["score_feedback"] is None
+    assert "hit_ratio" in stats["job_analysis"]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Load test for the tailored resume path: /health must stay responsive while
+many resumes generate against a slow local LLM.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import httpx
+from fastapi import FastAPI
+
+from app.services.project_store import ProjectStoreService
+from app.services.resume_writer import ResumeWriterService
+from bench.fakes import SlowFakeChatModel
+
+LLM_LATENCY = 0.2
+CONCURRENT_RESUMES = 20
+SECTIONS = ["summary", "research_experience", "skills", "projects"]
+
+
+def _build_app(writer: ResumeWriterService) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    @app.post("/generate-tailored-resume")
+    async def generate(payload: dict):
+        return await writer.generate_tailored_resume(
+            job_description=payload["job_description"],
+            include_sections=payload["include_sections"],
+        )
+
+    return app
+
+
+async def _run_load(app: FastAPI):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+        idle_start = time.perf_counter()
+        await client.get("/health")
+        idle_latency = time.perf_counter() - idle_start
+
+        health_latencies = []
+        generating = True
+
+        async def probe_health():
+            while generating:
+                start = time.perf_counter()
+                response = await client.get("/health")
+                health_latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+                await asyncio.sleep(0.02)
+
+        probe = asyncio.create_task(probe_health())
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(
+            client.post("/generate-tailored-resume", json={
+                "job_description": f"ML engineer opening #{i}",
+                "include_sections": SECTIONS,
+            })
+            for i in range(CONCURRENT_RESUMES)
+        ))
+        elapsed = time.perf_counter() - start
+        generating = False
+        await probe
+
+        return idle_latency, health_latencies, responses, elapsed
+
+
+def test_health_stays_flat_while_resumes_generate():
+    llm = SlowFakeChatModel(latency=LLM_LATENCY)
+    writer = ResumeWriterService(ProjectStoreService())
+    writer.llm = llm
+
+    idle_latency, health_latencies, responses, elapsed = asyncio.run(_run_load(_build_app(writer)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert set(responses[0].json()["sections"]) == set(SECTIONS)
+    # Every LLM section (all but the static summary) ran once per resume
+    assert llm.calls == CONCURRENT_RESUMES * (len(SECTIONS) - 1)
+    # Sections and requests overlap instead of queueing behind each other
+    assert elapsed < LLM_LATENCY * (len(SECTIONS) - 1) * 2
+    # A blocked loop would stall /health for at least one LLM call
+    assert len(health_latencies) >= 3
+    assert max(health_latencies) < max(idle_latency * 10, LLM_LATENCY / 2)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for stage-level tracing of the generation pipeline.
+Uses local fake models, so no OpenAI calls are made.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware import TracingMiddleware
+from app.core import tracing
+from app.core.config import settings
+from app.core.llm_gateway import get_llm_gateway
+from app.services.project_store import ProjectStoreService
+from app.services.resume_writer import ResumeWriterService
+from bench.fakes import SlowFakeChatModel
+
+SECTIONS = ["summary", "skills"]
+
+
+def test_spans_nest_per_task_and_record_queue_wait():
+    async def section(name: str, semaphore: asyncio.Semaphore):
+        with tracing.span(f"section.{name}", "section"):
+            waited = asyncio.get_running_loop().time()
+            async with semaphore:
+                tracing.record_queue_wait(asyncio.get_running_loop().time() - waited)
+                with tracing.span("llm", "llm"):
+                    await asyncio.sleep(0.05)
+
+    async def run():
+        semaphore = asyncio.Semaphore(1)
+        with tracing.trace("request") as request_trace:
+            with tracing.span("job_parsing", "parse"):
+                pass
+            await asyncio.gather(section("a", semaphore), section("b", semaphore))
+        return request_trace
+
+    request_trace = asyncio.run(run())
+    spans = {span.id: span for span in request_trace.spans}
+    llm_spans = [span for span in request_trace.spans if span.name == "llm"]
+
+    assert len(llm_spans) == 2
+    assert {spans[span.parent_id].name for span in llm_spans} == {"section.a", "section.b"}
+    stages = request_trace.summary()["stages"]
+    assert stages["section.b"]["queue_wait_ms"] >= 40
+    assert stages["section.a"]["queue_wait_ms"] < 40
+    assert tracing.current_trace() is None
+
+
+def test_resume_generation_records_stages_and_tokens():
+    gateway = get_llm_gateway()
+    model_name = f"trace-fake-{uuid.uuid4().hex}"
+    gateway.set_override(chat_factory=lambda model, temperature: SlowFakeChatModel(
+        model_name=model_name, latency=0.01, reply="Traced section body"))
+    try:
+        writer = ResumeWriterService(ProjectStoreService())
+        writer.llm = gateway.chat_model()
+
+        async def parse_job_description(job_description):
+            return {"job_title": "ML Engineer", "required_skills": ["Python"]}
+
+        writer.job_parser.parse_job_description = parse_job_description
+
+        async def run():
+            with tracing.trace("generate") as request_trace:
+                await writer.generate_tailored_resume_with_deduplication("ML engineer opening", SECTIONS)
+            return request_trace
+
+        request_trace = asyncio.run(run())
+    finally:
+        gateway.clear_override()
+
+    summary = request_trace.summary()
+    assert {"job_parsing", "project_selection", "section.summary", "section.skills"} <= set(summary["stages"])
+    assert summary["llm_calls"] == len(SECTIONS)
+    assert summary["completion_tokens"] == len(SECTIONS) * len("Traced section body".split())
+    assert summary["prompt_tokens"] > 0
+    spans = {span.id: span for span in request_trace.spans}
+    for llm_span in (span for span in request_trace.spans if span.category == "llm"):
+        assert spans[llm_span.parent_id].name.startswith("section.")
+        assert llm_span.attributes["model"] == model_name
+
+    chrome = request_trace.to_chrome_trace()
+    events = [event for event in chrome["traceEvents"] if event["ph"] == "X"]
+    assert len(events) == len(request_trace.spans)
+    assert all(event["dur"] >= 0 and event["ts"] >= 0 for event in events)
+    json.dumps(request_trace.to_dict())
+
+
+def test_middleware_reports_trace_id_and_debug_summary():
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/api/work")
+    async def work():
+        with tracing.span("stage", "app"):
+            await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    client = TestClient(app)
+    plain = client.get("/api/work")
+    debug = client.get("/api/work", headers={"X-Debug-Trace": "1"})
+
+    assert "x-debug-trace" not in plain.headers
+    stored = tracing.get_trace_store().get(plain.headers["x-trace-id"])
+    assert stored is not None and stored.attributes["status"] == 200
+    if settings.tracing.debug_header:
+        summary = json.loads(debug.headers["x-debug-trace"])
+        assert summary["trace_id"] == debug.headers["x-trace-id"]
+        assert summary["stages"]["stage"]["count"] == 1
@@ -3,6 +3,7 @@ import requests
 import sys
 import os
 import json
+import time
 from datetime import datetime
 
 # Add the scripts directory to the path so we can import from create_concise_resume.py
@@ -31,6 +32,48 @@ except ImportError:
         doc.save(output_path)
         return output_path
 
+def stream_generated_resume(response):
+    """
+    Render sections from a resume generation SSE stream as they arrive.
+    Returns the same structure as the non-streaming endpoints.
+    """
+    generated_data = {"sections": {}}
+    status = st.empty()
+    status.info("⏳ Waiting for the first section...")
+    placeholders = {}
+    event_name = None
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("event:"):
+            event_name = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            payload = json.loads(line[len("data:"):])
+            if event_name == "section":
+                generated_data["sections"][payload["section"]] = payload["content"]
+                placeholders.setdefault(payload["section"], st.empty()).success(
+                    f"✅ {payload['section'].title()} ready ({payload['duration_ms'] / 1000:.1f}s)"
+                )
+                status.info(f"⏳ {len(generated_data['sections'])} section(s) ready...")
+            elif event_name == "error":
+                st.warning(f"⚠️ {payload.get('section', 'Generation')} failed: {payload.get('detail')}")
+            elif event_name == "done":
+                generated_data.update(payload)
+    status.empty()
+    return generated_data
+
+def wait_for_job(submit_response, label, poll_interval=2.0):
+    """
+    Poll a background job submitted to one of the /api/jobs endpoints.
+    Returns the finished job record; the job keeps running on the server if the page reloads.
+    """
+    job = submit_response.json()
+    status = st.empty()
+    while job["status"] in ("queued", "running"):
+        status.info(f"⏳ {label} {job['status']}...")
+        time.sleep(poll_interval)
+        job = requests.get(f"http://localhost:8000/api/jobs/{job['job_id']}", timeout=30).json()
+    status.empty()
+    return job
+
 st.set_page_config(page_title="Resume Editor", page_icon="📝", layout="wide")
 
 st.title("AI-Powered Resume Editor")
@@ -109,20 +152,24 @@ with tab1:
                 else:
                     endpoint = "http://localhost:8000/api/generate-academic-cv"
                 
-                # Generate tailored resume using the deduplication endpoint
+                # Stream sections from the deduplication endpoint as they complete
                 response = requests.post(
-                    endpoint,
+                    f"{endpoint}/stream",
                     json={
                         "job_description": job_description,
                         "include_sections": include_sections,
                         "max_projects_per_section": 4
-                    }
+                    },
+                    stream=True
                 )
                 
                 if response.status_code == 200:
-                    generated_data = response.json()
+                    generated_data = stream_generated_resume(response)
                     
                     st.success("✅ Tailored resume generated successfully!")
+                    if generated_data.get("time_to_first_section_ms") is not None:
+                        st.caption(f"First section after {generated_data['time_to_first_section_ms'] / 1000:.1f}s, "
+                                   f"complete after {generated_data.get('generation_time_ms', 0) / 1000:.1f}s")
                     
                     # Show deduplication info
                     if generated_data.get("deduplication_applied"):
@@ -172,9 +219,9 @@ with tab1:
                                 "research": []
                             }
                             
-                            # Generate cover letter
+                            # Generate cover letter as a background job and poll for it
                             cover_letter_response = requests.post(
-                                "http://localhost:8000/api/generate-cover-letter",
+                                "http://localhost:8000/api/jobs/generate-cover-letter",
                                 json={
                                     "job_description": job_description,
                                     "candidate_name": candidate_name,
@@ -185,8 +232,11 @@ with tab1:
                                 }
                             )
                             
-                            if cover_letter_response.status_code == 200:
-                                cover_letter_data = cover_letter_response.json()
+                            if cover_letter_response.status_code == 202:
+                                cover_letter_job = wait_for_job(cover_letter_response, "Cover letter")
+                                if cover_letter_job["status"] != "succeeded":
+                                    raise RuntimeError(cover_letter_job.get("error", "cover letter job failed"))
+                                cover_letter_data = cover_letter_job["result"]
                                 
                                 st.success("✅ Cover letter generated successfully!")
                                 
@@ -273,13 +323,14 @@ with tab1:
                         resume_data_for_scoring["projects"] = generated_data["job_analysis"]["ranked_projects"][:3]
                     
                     try:
-                        # Score the resume
+                        # Tier 0: local keyword score, rendered right away
+                        scoring_request = {
+                            "job_description": job_description,
+                            "resume_data": resume_data_for_scoring
+                        }
                         scoring_response = requests.post(
                             "http://localhost:8000/api/score-resume",
-                            json={
-                                "job_description": job_description,
-                                "resume_data": resume_data_for_scoring
-                            }
+                            json={**scoring_request, "tier": 0}
                         )
                         
                         if scoring_response.status_code == 200:
@@ -289,13 +340,8 @@ with tab1:
                             col1, col2, col3 = st.columns(3)
                             
                             with col1:
-                                match_score = scoring_data.get("match_score", 0)
-                                if match_score >= 80:
-                                    st.metric("🎯 Resume Fit Score", f"{match_score}/100", delta="Excellent", delta_color="normal")
-                                elif match_score >= 60:
-                                    st.metric("🎯 Resume Fit Score", f"{match_score}/100", delta="Good", delta_color="normal")
-                                else:
-                                    st.metric("🎯 Resume Fit Score", f"{match_score}/100", delta="Needs Improvement", delta_color="inverse")
+                                fit_score_placeholder = st.empty()
+                                fit_score_placeholder.metric("🎯 Resume Fit Score", "…", delta="Waiting for LLM feedback", delta_color="off")
                             
                             with col2:
                                 keyword_score = scoring_data.get("keyword_score", 0)
@@ -327,6 +373,29 @@ with tab1:
                                 else:
                                     st.success("All keywords covered!")
                             
+                            # Tier 1: LLM feedback, already being prepared by the server since tier 0
+                            with st.spinner("Generating LLM feedback..."):
+                                feedback_response = requests.post(
+                                    "http://localhost:8000/api/score-resume",
+                                    json={**scoring_request, "tier": 1}
+                                )
+                            if feedback_response.status_code == 200:
+                                scoring_data = feedback_response.json()
+                                
+                                match_score = scoring_data.get("match_score", 0)
+                                if match_score >= 80:
+                                    fit_score_placeholder.metric("🎯 Resume Fit Score", f"{match_score}/100", delta="Excellent", delta_color="normal")
+                                elif match_score >= 60:
+                                    fit_score_placeholder.metric("🎯 Resume Fit Score", f"{match_score}/100", delta="Good", delta_color="normal")
+                                else:
+                                    fit_score_placeholder.metric("🎯 Resume Fit Score", f"{match_score}/100", delta="Needs Improvement", delta_color="inverse")
+                                
+                                latency = scoring_data.get("latency_ms", {})
+                                st.caption(f"Keyword score in {latency.get('tier0', 0):.1f} ms, "
+                                           f"LLM feedback in {latency.get('tier1', 0) / 1000:.1f} s")
+                            else:
+                                fit_score_placeholder.metric("🎯 Resume Fit Score", "n/a", delta="LLM feedback unavailable", delta_color="off")
+                            
                             # Section feedback
                             st.subheader("🛠️ Optimization Suggestions")
                             section_feedback = scoring_data.get("section_feedback", {})